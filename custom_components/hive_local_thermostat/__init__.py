@@ -7,31 +7,52 @@ https://github.com/andrew-codechimp/HA_Hive_Local_Thermostat
 from __future__ import annotations
 
 from asyncio import sleep
+from typing import cast
 
 from awesomeversion.awesomeversion import AwesomeVersion
 
-from homeassistant.components.mqtt import client as mqtt_client
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import (
     Platform,
     __version__ as HA_VERSION,  # noqa: N812
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.typing import ConfigType
 
-from .common import HiveConfigEntry, HiveData
+from .common import HiveConfigEntry, HiveData, HiveHouseConfigEntry, HiveHouseData
 from .const import (
+    CONF_ATTRIBUTE_OUTPUT,
+    CONF_ENTRY_TYPE,
+    CONF_MEMBERS,
     CONF_MODEL,
     CONF_MQTT_TOPIC,
     CONF_SHOW_HEAT_SCHEDULE_MODE,
     CONF_SHOW_WATER_SCHEDULE_MODE,
+    CONF_STALE_TIMEOUT,
+    CONF_TEMPERATURE_DEADBAND,
+    CONF_TEMPERATURE_HEARTBEAT,
+    CONF_TRACE_SAMPLE_RATE,
+    DEFAULT_STALE_TIMEOUT_MINUTES,
+    DEFAULT_TEMPERATURE_DEADBAND,
+    DEFAULT_TEMPERATURE_HEARTBEAT_MINUTES,
+    DEFAULT_TRACE_SAMPLE_RATE,
     DOMAIN,
+    ENTRY_TYPE_GROUP,
+    ENTRY_TYPE_HOUSE,
     LOGGER,
     MIN_HA_VERSION,
     MODEL_SLR2,
 )
-from .coordinator import HiveCoordinator
+from .coordinator import HiveCoordinator, state_cache_store
+from .coordinator_index import async_get_index
+from .error_reporter import async_delete_issues
+from .group import HiveGroupCoordinator
+from .house import HiveHouseCoordinator
 from .services import async_setup_services
+from .watchdog import async_get_watchdog
+from .websocket_api import async_setup_websocket
 
 PLATFORMS_SLR1: list[Platform] = [
     Platform.SENSOR,
@@ -50,6 +71,18 @@ PLATFORMS_SLR2: list[Platform] = [
     Platform.BINARY_SENSOR,
 ]
 
+PLATFORMS_GROUP: list[Platform] = [
+    Platform.CLIMATE,
+    Platform.NUMBER,
+    Platform.BUTTON,
+    Platform.BINARY_SENSOR,
+]
+
+PLATFORMS_HOUSE: list[Platform] = [
+    Platform.SENSOR,
+    Platform.BINARY_SENSOR,
+]
+
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 
@@ -58,6 +91,13 @@ def get_platforms(model: str) -> list[Platform]:
     return PLATFORMS_SLR2 if model == MODEL_SLR2 else PLATFORMS_SLR1
 
 
+def get_group_platforms(model: str) -> list[Platform]:
+    """Return platforms for a group of receivers of a model."""
+    if model == MODEL_SLR2:
+        return [*PLATFORMS_GROUP, Platform.SELECT]
+    return PLATFORMS_GROUP
+
+
 async def async_setup(
     hass: HomeAssistant,
     config: ConfigType,  # noqa: ARG001
@@ -74,6 +114,7 @@ async def async_setup(
         return False
 
     async_setup_services(hass)
+    async_setup_websocket(hass)
 
     return True
 
@@ -81,6 +122,11 @@ async def async_setup(
 async def async_setup_entry(hass: HomeAssistant, entry: HiveConfigEntry) -> bool:
     """Set up this integration using UI."""
 
+    if entry.options.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_GROUP:
+        return await async_setup_group_entry(hass, entry)
+    if entry.options.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_HOUSE:
+        return await async_setup_house_entry(hass, cast(HiveHouseConfigEntry, entry))
+
     coordinator = HiveCoordinator(
         hass,
         entry.entry_id,
@@ -88,6 +134,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: HiveConfigEntry) -> bool
         entry.options[CONF_MQTT_TOPIC],
         entry.options.get(CONF_SHOW_HEAT_SCHEDULE_MODE, True),
         entry.options.get(CONF_SHOW_WATER_SCHEDULE_MODE, True),
+        entry.options.get(CONF_ATTRIBUTE_OUTPUT, False),
+        entry.options.get(CONF_TEMPERATURE_DEADBAND, DEFAULT_TEMPERATURE_DEADBAND),
+        entry.options.get(
+            CONF_TEMPERATURE_HEARTBEAT, DEFAULT_TEMPERATURE_HEARTBEAT_MINUTES
+        ),
+        entry.options.get(CONF_STALE_TIMEOUT, DEFAULT_STALE_TIMEOUT_MINUTES),
+        int(entry.options.get(CONF_TRACE_SAMPLE_RATE, DEFAULT_TRACE_SAMPLE_RATE)),
     )
 
     platforms = get_platforms(coordinator.model)
@@ -97,32 +150,111 @@ async def async_setup_entry(hass: HomeAssistant, entry: HiveConfigEntry) -> bool
         coordinator=coordinator,
     )
 
+    # Seed entities from the last persisted state before they are added
+    await coordinator.async_load_cache()
+
     await hass.config_entries.async_forward_entry_setups(entry, platforms)
 
-    LOGGER.debug(
-        "Subscribing to MQTT topic: %s, will parse platforms for %s",
-        coordinator.topic,
-        coordinator.model,
-    )
+    # Registered before subscribing, a model detected from the first payload
+    # is applied by reloading the entry
+    entry.async_on_unload(entry.add_update_listener(config_entry_update_listener))
 
     # Subscribe to MQTT and have the coordinator handle messages
-    entry.async_on_unload(
-        await mqtt_client.async_subscribe(
-            hass, coordinator.topic, coordinator.handle_mqtt_message, 1
-        )
-    )
+    await coordinator.async_subscribe()
+    entry.async_on_unload(coordinator.async_unsubscribe)
+    entry.async_on_unload(async_get_watchdog(hass).async_register(coordinator))
+    entry.async_on_unload(async_get_index(hass).async_register(coordinator))
 
-    # Send an initial message to get the current state
+    # Send an initial message to get the current state, cached values may
+    # have changed while Home Assistant was stopped
     await sleep(2)
-    payload = r'{"system_mode":""}'
-    LOGGER.debug("Sending to %s/get message %s", coordinator.topic, payload)
-    await mqtt_client.async_publish(hass, coordinator.topic_get, payload)
+    await coordinator.async_request_state()
+
+    return True
+
+
+async def async_setup_group_entry(hass: HomeAssistant, entry: HiveConfigEntry) -> bool:
+    """Set up a Zigbee2MQTT group of receivers."""
+
+    members: list[HiveCoordinator] = []
+    for member_entry_id in entry.options.get(CONF_MEMBERS, []):
+        member_entry = hass.config_entries.async_get_entry(member_entry_id)
+        if member_entry is None or member_entry.disabled_by:
+            LOGGER.warning(
+                "Group %s member %s is not available, skipping it",
+                entry.title,
+                member_entry_id,
+            )
+            continue
+        if member_entry.state is not ConfigEntryState.LOADED:
+            msg = f"Waiting for group member {member_entry.title} to load"
+            raise ConfigEntryNotReady(msg)
+
+        members.append(member_entry.runtime_data.coordinator)
+
+        # Member coordinators are replaced when a member reloads
+        @callback
+        def _async_member_changed(member_entry: HiveConfigEntry = member_entry) -> None:
+            if (
+                member_entry.state is ConfigEntryState.NOT_LOADED
+                and entry.state is ConfigEntryState.LOADED
+            ):
+                hass.config_entries.async_schedule_reload(entry.entry_id)
+
+        entry.async_on_unload(member_entry.async_on_state_change(_async_member_changed))
+
+    coordinator = HiveGroupCoordinator(
+        hass,
+        entry.entry_id,
+        entry.options[CONF_MODEL],
+        entry.options[CONF_MQTT_TOPIC],
+        entry.options.get(CONF_SHOW_HEAT_SCHEDULE_MODE, True),
+        entry.options.get(CONF_SHOW_WATER_SCHEDULE_MODE, True),
+        members,
+    )
+
+    platforms = get_group_platforms(coordinator.model)
+
+    entry.runtime_data = HiveData(
+        platforms=platforms,
+        coordinator=coordinator,
+    )
+
+    await coordinator.async_load_cache()
+
+    await hass.config_entries.async_forward_entry_setups(entry, platforms)
+
+    # Aggregate state from the member coordinators
+    await coordinator.async_subscribe()
+    entry.async_on_unload(coordinator.async_unsubscribe)
+    entry.async_on_unload(async_get_index(hass).async_register(coordinator))
 
     entry.async_on_unload(entry.add_update_listener(config_entry_update_listener))
 
     return True
 
 
+async def async_setup_house_entry(
+    hass: HomeAssistant, entry: HiveHouseConfigEntry
+) -> bool:
+    """Set up the house-level aggregate of all receivers."""
+
+    coordinator = HiveHouseCoordinator(hass, entry.entry_id)
+
+    entry.runtime_data = HiveHouseData(
+        platforms=PLATFORMS_HOUSE,
+        coordinator=coordinator,
+    )
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS_HOUSE)
+
+    # Follow receivers as they are set up and unloaded
+    await coordinator.async_subscribe()
+    entry.async_on_unload(coordinator.async_unsubscribe)
+
+    return True
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: HiveConfigEntry) -> bool:
     """Handle removal of an entry."""
     return await hass.config_entries.async_unload_platforms(
@@ -130,9 +262,25 @@ async def async_unload_entry(hass: HomeAssistant, entry: HiveConfigEntry) -> boo
     )
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: HiveConfigEntry) -> None:
+    """Remove the persisted state cache and repair issues of a deleted entry."""
+    await state_cache_store(hass, entry.entry_id).async_remove()
+    async_delete_issues(hass, entry.entry_id)
+
+
 async def config_entry_update_listener(
     hass: HomeAssistant, entry: HiveConfigEntry
 ) -> None:
     """Update listener, called when the config entry options are changed."""
-
-    await hass.config_entries.async_reload(entry.entry_id)
+    coordinator = entry.runtime_data.coordinator
+
+    if (
+        entry.options[CONF_MODEL] != coordinator.model
+        or entry.options.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_GROUP
+    ):
+        # Platforms and payload keys depend on the model, groups on members
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    LOGGER.debug("Applying options for %s without reload", entry.title)
+    await coordinator.async_apply_options(entry.options)
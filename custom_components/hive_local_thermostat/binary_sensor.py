@@ -3,21 +3,25 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import cast
 
 from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .common import HiveConfigEntry
+from .common import HiveConfigEntry, HiveHouseConfigEntry
 from .const import (
+    CONF_ENTRY_TYPE,
     DOMAIN,
+    ENTRY_TYPE_HOUSE,
     MODEL_SLR2,
 )
 from .coordinator import HiveCoordinator
-from .entity import HiveEntity, HiveEntityDescription
+from .entity import HiveEntity, HiveEntityDescription, HiveHouseEntity
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -37,6 +41,33 @@ async def async_setup_entry(
 ) -> None:
     """Set up the binary sensor platform."""
 
+    if config_entry.options.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_HOUSE:
+        coordinator_house = cast(
+            HiveHouseConfigEntry, config_entry
+        ).runtime_data.coordinator
+        async_add_entities(
+            [
+                HiveHouseBinarySensor(
+                    HiveBinarySensorEntityDescription(
+                        key="heating",
+                        translation_key="house_heating",
+                        name=config_entry.title,
+                        device_class=BinarySensorDeviceClass.HEAT,
+                    ),
+                    coordinator_house,
+                ),
+                HiveHouseBinarySensor(
+                    HiveBinarySensorEntityDescription(
+                        key="boost",
+                        translation_key="house_boost",
+                        name=config_entry.title,
+                    ),
+                    coordinator_house,
+                ),
+            ]
+        )
+        return
+
     coordinator = config_entry.runtime_data.coordinator
 
     if coordinator.model == MODEL_SLR2:
@@ -105,3 +136,14 @@ class HiveBinarySensor(HiveEntity, BinarySensorEntity):
 
         self._attr_is_on = new_value
         self.async_write_ha_state()
+
+
+class HiveHouseBinarySensor(HiveHouseEntity, BinarySensorEntity):
+    """hive_local_thermostat house aggregate Binary Sensor class."""
+
+    entity_description: HiveBinarySensorEntityDescription
+
+    @property
+    def is_on(self) -> bool:
+        """Return True if any zone is on."""
+        return bool(self.coordinator.data[self.entity_description.key])
@@ -66,6 +66,7 @@ class HiveButton(HiveEntity, ButtonEntity):
     """hive_local_thermostat Button class."""
 
     entity_description: HiveButtonEntityDescription
+    _shows_receiver_state = False
 
     def __init__(
         self,
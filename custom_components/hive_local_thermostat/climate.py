@@ -69,6 +69,13 @@ async def async_setup_entry(
     async_add_entities(climateEntity for climateEntity in _entities)
 
 
+def hvac_modes(show_schedule_mode: bool) -> list[HVACMode]:  # noqa: FBT001
+    """Return the HVAC modes offered, depending on schedule mode visibility."""
+    if show_schedule_mode:
+        return [HVACMode.OFF, HVACMode.HEAT, HVACMode.AUTO]
+    return [HVACMode.OFF, HVACMode.HEAT]
+
+
 class HiveClimateEntity(HiveEntity, ClimateEntity):
     """hive_local_thermostat Climate class."""
 
@@ -89,10 +96,7 @@ class HiveClimateEntity(HiveEntity, ClimateEntity):
 
         self._attr_temperature_unit = UnitOfTemperature.CELSIUS
 
-        if coordinator.show_heating_schedule_mode:
-            self._attr_hvac_modes = [HVACMode.OFF, HVACMode.HEAT, HVACMode.AUTO]
-        else:
-            self._attr_hvac_modes = [HVACMode.OFF, HVACMode.HEAT]
+        self._attr_hvac_modes = hvac_modes(coordinator.show_heating_schedule_mode)
         self._attr_hvac_mode = None
         self._attr_preset_modes = list(PRESET_MAP.keys())
         self._attr_preset_mode = None
@@ -217,11 +221,14 @@ class HiveClimateEntity(HiveEntity, ClimateEntity):
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
 
-        self._attr_current_temperature = self.coordinator.current_temperature
+        # Small temperature changes are held back, other attributes still update
+        if self.temperature_changed(self.coordinator.current_temperature):
+            self._attr_current_temperature = self.coordinator.current_temperature
         self._attr_target_temperature = self.coordinator.target_temperature
         self._attr_preset_mode = self.coordinator.preset_mode
         self._attr_hvac_action = self.coordinator.hvac_action
         self._attr_hvac_mode = self.coordinator.hvac_mode
+        self._attr_hvac_modes = hvac_modes(self.coordinator.show_heating_schedule_mode)
 
         # Update HA state
         self.async_write_ha_state()
@@ -0,0 +1,115 @@
+"""Offline command queue for Hive Local Thermostat."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from .latency import normalize_value
+
+COMMAND_QUEUE_SIZE = 10
+
+
+@dataclass(slots=True)
+class CommandQueueStats:
+    """Counters for the offline command queue."""
+
+    queued: int = 0
+    collapsed: int = 0
+    dropped: int = 0
+    replayed: int = 0
+    max_depth: int = 0
+
+
+class CommandQueue:
+    """Bounded queue holding /set commands while they cannot be published.
+
+    Commands are collapsed by key as they are queued: a later mode for a
+    channel replaces earlier commands setting a different mode (with their
+    hold and boost settings), and is merged with earlier commands setting the
+    same mode so that commands sent in parts, such as a mode and its hold
+    followed by the mode and setpoint, are replayed as one. Other keys such as
+    the setpoint are removed from earlier commands. Only the final mode and
+    setpoint are replayed. When the queue is full the oldest command is
+    dropped.
+    """
+
+    def __init__(
+        self, mode_keys: Iterable[str], maxlen: int = COMMAND_QUEUE_SIZE
+    ) -> None:
+        """Initialize the queue."""
+        self.mode_keys = frozenset(mode_keys)
+        self.maxlen = maxlen
+        self.commands: deque[dict[str, Any]] = deque()
+        self.stats = CommandQueueStats()
+
+    def __len__(self) -> int:
+        """Return the queue depth."""
+        return len(self.commands)
+
+    def enqueue(self, command: dict[str, Any]) -> None:
+        """Queue a command, collapsing the commands it supersedes."""
+        self.stats.queued += 1
+        self.stats.collapsed += self._add(command)
+
+        while len(self.commands) > self.maxlen:
+            self.commands.popleft()
+            self.stats.dropped += 1
+
+        self.stats.max_depth = max(self.stats.max_depth, len(self.commands))
+
+    def requeue(self, command: dict[str, Any]) -> None:
+        """Put a command that failed to send back at the front of the queue."""
+        later = list(self.commands)
+        self.commands.clear()
+        self.commands.append(command)
+        for queued in later:
+            self._add(queued)
+
+    def popleft(self) -> dict[str, Any]:
+        """Return the oldest command for replay."""
+        self.stats.replayed += 1
+        return self.commands.popleft()
+
+    def _add(self, command: dict[str, Any]) -> int:
+        """Append a command, returning how many queued commands it replaced."""
+        modes = self.mode_keys & command.keys()
+
+        merged: dict[str, Any] = {}
+        still_queued: deque[dict[str, Any]] = deque()
+        for queued in self.commands:
+            remaining = {
+                key: value for key, value in queued.items() if key not in command
+            }
+            if shared := modes & queued.keys():
+                if all(
+                    normalize_value(queued[key]) == normalize_value(command[key])
+                    for key in shared
+                ):
+                    merged.update(remaining)
+                continue
+            # Keys set again by a later queued command are no longer carried
+            for key in remaining:
+                merged.pop(key, None)
+            if remaining:
+                still_queued.append(remaining)
+
+        collapsed = len(self.commands) - len(still_queued)
+        still_queued.append({**merged, **command} if merged else command)
+        self.commands = still_queued
+        return collapsed
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return queue state for diagnostics."""
+        return {
+            "depth": len(self.commands),
+            "max_size": self.maxlen,
+            "max_depth": self.stats.max_depth,
+            "queued": self.stats.queued,
+            "collapsed": self.stats.collapsed,
+            "dropped": self.stats.dropped,
+            "replayed": self.stats.replayed,
+            "commands": list(self.commands),
+        }
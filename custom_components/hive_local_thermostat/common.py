@@ -10,6 +10,7 @@ from homeassistant.const import Platform
 
 if TYPE_CHECKING:
     from .coordinator import HiveCoordinator
+    from .house import HiveHouseCoordinator
 
 
 @dataclass
@@ -20,4 +21,13 @@ class HiveData:
     coordinator: HiveCoordinator
 
 
+@dataclass
+class HiveHouseData:
+    """Hive house aggregate data type."""
+
+    platforms: list[Platform]
+    coordinator: HiveHouseCoordinator
+
+
 type HiveConfigEntry = ConfigEntry[HiveData]
+type HiveHouseConfigEntry = ConfigEntry[HiveHouseData]
@@ -7,17 +7,32 @@ from typing import Any, cast
 
 import voluptuous as vol
 
+from homeassistant.components import mqtt
+from homeassistant.config_entries import (
+    SOURCE_INTEGRATION_DISCOVERY,
+    ConfigEntry,
+    ConfigFlowResult,
+)
 from homeassistant.const import CONF_NAME
 from homeassistant.core import callback
 from homeassistant.helpers import selector
 from homeassistant.helpers.schema_config_entry_flow import (
+    SchemaCommonFlowHandler,
     SchemaConfigFlowHandler,
+    SchemaFlowError,
     SchemaFlowFormStep,
     SchemaFlowMenuStep,
     SchemaOptionsFlowHandler,
 )
 
 from . import const
+from .discovery import (
+    DEFAULT_BASE_TOPIC,
+    DiscoveredReceiver,
+    async_discover_receivers,
+)
+
+DISCOVERED = "discovered"
 
 
 def required(
@@ -46,10 +61,234 @@ def optional(
     return vol.Optional(key, description={"suggested_value": suggested_value})
 
 
+def member_selector(handler: SchemaCommonFlowHandler) -> selector.SelectSelector:
+    """Return a selector for the receivers that can be members of a group."""
+    hass = handler.parent_handler.hass
+    options = [
+        selector.SelectOptionDict(value=entry.entry_id, label=entry.title)
+        for entry in hass.config_entries.async_entries(const.DOMAIN)
+        if entry.options.get(const.CONF_ENTRY_TYPE)
+        not in (const.ENTRY_TYPE_GROUP, const.ENTRY_TYPE_HOUSE)
+    ]
+    return selector.SelectSelector(
+        selector.SelectSelectorConfig(
+            options=options,
+            multiple=True,
+            mode=selector.SelectSelectorMode.LIST,
+        ),
+    )
+
+
+def group_schema(handler: SchemaCommonFlowHandler) -> dict[Any, Any]:
+    """Generate the schema fields shared by group config and options."""
+    return {
+        required(const.CONF_MQTT_TOPIC, handler.options): selector.TextSelector(),
+        required(const.CONF_MODEL, handler.options): selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=const.MODELS,
+                translation_key="model",
+                mode=selector.SelectSelectorMode.DROPDOWN,
+            ),
+        ),
+        required(const.CONF_MEMBERS, handler.options): member_selector(handler),
+        required(
+            const.CONF_SHOW_HEAT_SCHEDULE_MODE, handler.options, default=True
+        ): selector.BooleanSelector(
+            selector.BooleanSelectorConfig(),
+        ),
+        required(
+            const.CONF_SHOW_WATER_SCHEDULE_MODE, handler.options, default=True
+        ): selector.BooleanSelector(
+            selector.BooleanSelectorConfig(),
+        ),
+    }
+
+
+async def group_config_schema(handler: SchemaCommonFlowHandler) -> vol.Schema:
+    """Generate group config schema."""
+    return vol.Schema(
+        {
+            required(CONF_NAME, handler.options): selector.TextSelector(),
+            **group_schema(handler),
+        }
+    )
+
+
+async def validate_group(
+    handler: SchemaCommonFlowHandler, user_input: dict[str, Any]
+) -> dict[str, Any]:
+    """Validate that all group members are receivers of the group model."""
+    if not user_input.get(const.CONF_MEMBERS):
+        msg = "no_members"
+        raise SchemaFlowError(msg)
+
+    hass = handler.parent_handler.hass
+    for entry_id in user_input[const.CONF_MEMBERS]:
+        entry = hass.config_entries.async_get_entry(entry_id)
+        if (
+            entry is None
+            or entry.options[const.CONF_MODEL] != user_input[const.CONF_MODEL]
+        ):
+            msg = "model_mismatch"
+            raise SchemaFlowError(msg)
+
+    return {**user_input, const.CONF_ENTRY_TYPE: const.ENTRY_TYPE_GROUP}
+
+
+async def house_config_schema(handler: SchemaCommonFlowHandler) -> vol.Schema:
+    """Generate house aggregate config schema."""
+    return vol.Schema(
+        {
+            required(CONF_NAME, handler.options, default="House"): (
+                selector.TextSelector()
+            ),
+        }
+    )
+
+
+async def validate_house(
+    handler: SchemaCommonFlowHandler, user_input: dict[str, Any]
+) -> dict[str, Any]:
+    """Validate that there is only one house aggregate."""
+    hass = handler.parent_handler.hass
+    if any(
+        entry.options.get(const.CONF_ENTRY_TYPE) == const.ENTRY_TYPE_HOUSE
+        for entry in hass.config_entries.async_entries(const.DOMAIN)
+    ):
+        msg = "house_exists"
+        raise SchemaFlowError(msg)
+
+    return {**user_input, const.CONF_ENTRY_TYPE: const.ENTRY_TYPE_HOUSE}
+
+
+async def discover_schema(handler: SchemaCommonFlowHandler) -> vol.Schema:  # noqa: ARG001
+    """Generate the Zigbee2MQTT discovery schema."""
+    return vol.Schema(
+        {
+            vol.Required(
+                const.CONF_BASE_TOPIC, default=DEFAULT_BASE_TOPIC
+            ): selector.TextSelector(),
+        }
+    )
+
+
+async def validate_discover(
+    handler: SchemaCommonFlowHandler, user_input: dict[str, Any]
+) -> dict[str, Any]:
+    """Read Zigbee2MQTT's device list and keep the receivers not yet added."""
+    hass = handler.parent_handler.hass
+    if not await mqtt.async_wait_for_mqtt_client(hass):
+        msg = "mqtt_not_connected"
+        raise SchemaFlowError(msg)
+
+    base_topic = user_input[const.CONF_BASE_TOPIC].strip("/")
+    receivers = await async_discover_receivers(hass, base_topic)
+    if receivers is None:
+        msg = "no_device_list"
+        raise SchemaFlowError(msg)
+
+    configured = {
+        entry.options.get(const.CONF_MQTT_TOPIC)
+        for entry in hass.config_entries.async_entries(const.DOMAIN)
+    }
+    discovered = {
+        receiver.topic: receiver
+        for receiver in receivers
+        if receiver.topic not in configured
+    }
+    if not discovered:
+        msg = "no_receivers_found"
+        raise SchemaFlowError(msg)
+
+    handler.flow_state[DISCOVERED] = discovered
+
+    # The base topic is only used to discover, it is not an entry option
+    return {}
+
+
+async def discovered_schema(handler: SchemaCommonFlowHandler) -> vol.Schema:
+    """Generate the schema selecting discovered receivers."""
+    discovered: dict[str, DiscoveredReceiver] = handler.flow_state[DISCOVERED]
+    return vol.Schema(
+        {
+            vol.Required(
+                const.CONF_RECEIVERS, default=list(discovered)
+            ): selector.SelectSelector(
+                selector.SelectSelectorConfig(
+                    options=[
+                        selector.SelectOptionDict(
+                            value=topic,
+                            label=f"{receiver.name} ({receiver.model})",
+                        )
+                        for topic, receiver in discovered.items()
+                    ],
+                    multiple=True,
+                    mode=selector.SelectSelectorMode.LIST,
+                ),
+            ),
+        }
+    )
+
+
+def discovered_options(receiver: DiscoveredReceiver) -> dict[str, Any]:
+    """Return the entry options for a discovered receiver."""
+    return {
+        CONF_NAME: receiver.name,
+        const.CONF_MQTT_TOPIC: receiver.topic,
+        const.CONF_MODEL: receiver.model,
+        const.CONF_SHOW_HEAT_SCHEDULE_MODE: True,
+        const.CONF_SHOW_WATER_SCHEDULE_MODE: True,
+        const.CONF_ATTRIBUTE_OUTPUT: False,
+    }
+
+
+async def validate_discovered(
+    handler: SchemaCommonFlowHandler, user_input: dict[str, Any]
+) -> dict[str, Any]:
+    """Add the selected receivers.
+
+    This flow creates the entry for the first receiver, the others are
+    offered as discovered receivers to confirm.
+    """
+    discovered: dict[str, DiscoveredReceiver] = handler.flow_state[DISCOVERED]
+    selected = [
+        discovered[topic]
+        for topic in user_input[const.CONF_RECEIVERS]
+        if topic in discovered
+    ]
+    if not selected:
+        msg = "no_receivers_selected"
+        raise SchemaFlowError(msg)
+
+    hass = handler.parent_handler.hass
+    for receiver in selected[1:]:
+        hass.async_create_task(
+            hass.config_entries.flow.async_init(
+                const.DOMAIN,
+                context={"source": SOURCE_INTEGRATION_DISCOVERY},
+                data=discovered_options(receiver),
+            )
+        )
+
+    return discovered_options(selected[0])
+
+
+async def validate_options(
+    handler: SchemaCommonFlowHandler, user_input: dict[str, Any]
+) -> dict[str, Any]:
+    """Validate options, group members need checking."""
+    if handler.options.get(const.CONF_ENTRY_TYPE) == const.ENTRY_TYPE_GROUP:
+        return await validate_group(handler, user_input)
+    return user_input
+
+
 async def general_options_schema(
     handler: SchemaConfigFlowHandler | SchemaOptionsFlowHandler,
 ) -> vol.Schema:
     """Generate options schema."""
+    if handler.options.get(const.CONF_ENTRY_TYPE) == const.ENTRY_TYPE_GROUP:
+        return vol.Schema(group_schema(handler))
+
     return vol.Schema(
         {
             required(const.CONF_MQTT_TOPIC, handler.options): selector.TextSelector(),
@@ -70,6 +309,62 @@ async def general_options_schema(
             ): selector.BooleanSelector(
                 selector.BooleanSelectorConfig(),
             ),
+            required(
+                const.CONF_ATTRIBUTE_OUTPUT, handler.options, default=False
+            ): selector.BooleanSelector(
+                selector.BooleanSelectorConfig(),
+            ),
+            required(
+                const.CONF_TEMPERATURE_DEADBAND,
+                handler.options,
+                default=const.DEFAULT_TEMPERATURE_DEADBAND,
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=2,
+                    step=0.05,
+                    unit_of_measurement="°C",
+                    mode=selector.NumberSelectorMode.BOX,
+                ),
+            ),
+            required(
+                const.CONF_TEMPERATURE_HEARTBEAT,
+                handler.options,
+                default=const.DEFAULT_TEMPERATURE_HEARTBEAT_MINUTES,
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=1,
+                    max=1440,
+                    step=1,
+                    unit_of_measurement="min",
+                    mode=selector.NumberSelectorMode.BOX,
+                ),
+            ),
+            required(
+                const.CONF_STALE_TIMEOUT,
+                handler.options,
+                default=const.DEFAULT_STALE_TIMEOUT_MINUTES,
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=1440,
+                    step=1,
+                    unit_of_measurement="min",
+                    mode=selector.NumberSelectorMode.BOX,
+                ),
+            ),
+            required(
+                const.CONF_TRACE_SAMPLE_RATE,
+                handler.options,
+                default=const.DEFAULT_TRACE_SAMPLE_RATE,
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=100,
+                    step=1,
+                    mode=selector.NumberSelectorMode.BOX,
+                ),
+            ),
         }
     )
 
@@ -99,15 +394,35 @@ async def general_config_schema(
             ): selector.BooleanSelector(
                 selector.BooleanSelectorConfig(),
             ),
+            required(
+                const.CONF_ATTRIBUTE_OUTPUT, handler.options, default=False
+            ): selector.BooleanSelector(
+                selector.BooleanSelectorConfig(),
+            ),
         }
     )
 
 
 CONFIG_FLOW: dict[str, SchemaFlowFormStep | SchemaFlowMenuStep] = {
-    "user": SchemaFlowFormStep(general_config_schema),
+    "user": SchemaFlowMenuStep(["discover", "receiver", "group", "house"]),
+    "discover": SchemaFlowFormStep(
+        discover_schema, validate_user_input=validate_discover, next_step=DISCOVERED
+    ),
+    DISCOVERED: SchemaFlowFormStep(
+        discovered_schema, validate_user_input=validate_discovered
+    ),
+    "receiver": SchemaFlowFormStep(general_config_schema),
+    "group": SchemaFlowFormStep(
+        group_config_schema, validate_user_input=validate_group
+    ),
+    "house": SchemaFlowFormStep(
+        house_config_schema, validate_user_input=validate_house
+    ),
 }
 OPTIONS_FLOW: dict[str, SchemaFlowFormStep | SchemaFlowMenuStep] = {
-    "init": SchemaFlowFormStep(general_options_schema),
+    "init": SchemaFlowFormStep(
+        general_options_schema, validate_user_input=validate_options
+    ),
 }
 
 
@@ -119,6 +434,44 @@ class ConfigFlowHandler(SchemaConfigFlowHandler, domain=const.DOMAIN):
     options_flow = OPTIONS_FLOW
     VERSION = const.CONFIG_VERSION
 
+    @classmethod
+    @callback
+    def async_supports_options_flow(cls, config_entry: ConfigEntry) -> bool:
+        """Return options flow support, the house aggregate has no options."""
+        return config_entry.options.get(const.CONF_ENTRY_TYPE) != const.ENTRY_TYPE_HOUSE
+
+    async def async_step_integration_discovery(
+        self, discovery_info: dict[str, Any]
+    ) -> ConfigFlowResult:
+        """Offer a receiver selected in the discovery step."""
+        topic = discovery_info[const.CONF_MQTT_TOPIC]
+        if any(
+            entry.options.get(const.CONF_MQTT_TOPIC) == topic
+            for entry in self._async_current_entries(include_ignore=False)
+        ):
+            return self.async_abort(reason="already_configured")
+
+        self._discovered_options = discovery_info
+        self.context["title_placeholders"] = {CONF_NAME: discovery_info[CONF_NAME]}
+        return await self.async_step_discovery_confirm()
+
+    async def async_step_discovery_confirm(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Confirm adding a discovered receiver."""
+        if user_input is None:
+            return self.async_show_form(
+                step_id="discovery_confirm",
+                description_placeholders={
+                    CONF_NAME: self._discovered_options[CONF_NAME],
+                    const.CONF_MQTT_TOPIC: self._discovered_options[
+                        const.CONF_MQTT_TOPIC
+                    ],
+                    const.CONF_MODEL: self._discovered_options[const.CONF_MODEL],
+                },
+            )
+        return self.async_create_entry(data=self._discovered_options)
+
     @callback
     def async_config_entry_title(self, options: Mapping[str, Any]) -> str:
         """Return config entry title.
@@ -8,11 +8,24 @@ MIN_HA_VERSION = "2025.4"
 
 DOMAIN = "hive_local_thermostat"
 CONFIG_VERSION = 1
+STORAGE_VERSION = 1
 
 CONF_MQTT_TOPIC = "mqtt_topic"
 CONF_MODEL = "model"
 CONF_SHOW_HEAT_SCHEDULE_MODE = "show_heat_schedule_mode"
 CONF_SHOW_WATER_SCHEDULE_MODE = "show_water_schedule_mode"
+CONF_ATTRIBUTE_OUTPUT = "attribute_output"
+CONF_TEMPERATURE_DEADBAND = "temperature_deadband"
+CONF_TEMPERATURE_HEARTBEAT = "temperature_heartbeat"
+CONF_STALE_TIMEOUT = "stale_timeout"
+CONF_ENTRY_TYPE = "entry_type"
+CONF_MEMBERS = "members"
+CONF_TRACE_SAMPLE_RATE = "trace_sample_rate"
+CONF_BASE_TOPIC = "base_topic"
+CONF_RECEIVERS = "receivers"
+
+ENTRY_TYPE_GROUP = "group"
+ENTRY_TYPE_HOUSE = "house"
 
 MODEL_OTR1 = "OTR1"
 MODEL_SLR1 = "SLR1"
@@ -30,5 +43,43 @@ DEFAULT_FROST_TEMPERATURE = 12
 DEFAULT_HEATING_BOOST_MINUTES = 120
 DEFAULT_HEATING_BOOST_TEMPERATURE = 25
 DEFAULT_WATER_BOOST_MINUTES = 60
+DEFAULT_TEMPERATURE_DEADBAND = 0.0
+DEFAULT_TEMPERATURE_HEARTBEAT_MINUTES = 30
 
 MAXIMUM_BOOST_MINUTES = 180
+
+BOOST_REMAINING_SAMPLE_MINUTES = 5
+
+DEFAULT_STALE_TIMEOUT_MINUTES = 60
+WATCHDOG_INTERVAL_SECONDS = 60
+
+# Seconds between replayed commands, as between multi-part commands
+COMMAND_REPLAY_DELAY = 0.5
+
+STATE_CACHE_SAVE_DELAY = 30
+
+# Entity attribute flagging values seeded from the state cache
+ATTR_CACHED = "cached"
+
+# Repeated errors are logged once per interval, with a count
+ERROR_LOG_INTERVAL_MINUTES = 10
+# Consecutive misconfigured payloads before a repair issue is raised
+REPAIR_ISSUE_THRESHOLD = 5
+
+# Message trace, 1 in the sample rate of received messages is recorded
+TRACE_BUFFER_SIZE = 200
+DEFAULT_TRACE_SAMPLE_RATE = 1
+
+SIGNAL_RECEIVER_ADDED = f"{DOMAIN}_receiver_added"
+SIGNAL_RECEIVER_REMOVED = f"{DOMAIN}_receiver_removed"
+# Formatted with the entry id and trigger type
+SIGNAL_TRIGGER = f"{DOMAIN}_trigger_{{}}_{{}}"
+
+# Device triggers, fired on transitions between live reports
+TRIGGER_HEAT_BOOST_STARTED = "heat_boost_started"
+TRIGGER_HEAT_BOOST_ENDED = "heat_boost_ended"
+TRIGGER_WATER_BOOST_STARTED = "water_boost_started"
+TRIGGER_WATER_BOOST_ENDED = "water_boost_ended"
+TRIGGER_HEATING_STARTED = "heating_started"
+TRIGGER_HEATING_STOPPED = "heating_stopped"
+TRIGGER_HVAC_MODE_CHANGED = "hvac_mode_changed"
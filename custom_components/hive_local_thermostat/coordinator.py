@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import json
-from asyncio import sleep
-from datetime import datetime
+from asyncio import Event, sleep, timeout
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from typing import Any, cast
 
+from homeassistant.components import mqtt
 from homeassistant.components.climate.const import (
     PRESET_BOOST,
     PRESET_NONE,
@@ -15,19 +18,83 @@ from homeassistant.components.climate.const import (
 )
 from homeassistant.components.mqtt import client as mqtt_client
 from homeassistant.components.mqtt.models import ReceiveMessage
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-from homeassistant.util.dt import utcnow
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import Store
+from homeassistant.util.dt import parse_datetime, utcnow
 
+from .command_queue import CommandQueue
 from .const import (
+    COMMAND_REPLAY_DELAY,
+    CONF_ATTRIBUTE_OUTPUT,
+    CONF_MODEL,
+    CONF_MQTT_TOPIC,
+    CONF_SHOW_HEAT_SCHEDULE_MODE,
+    CONF_SHOW_WATER_SCHEDULE_MODE,
+    CONF_STALE_TIMEOUT,
+    CONF_TEMPERATURE_DEADBAND,
+    CONF_TEMPERATURE_HEARTBEAT,
+    CONF_TRACE_SAMPLE_RATE,
     DEFAULT_FROST_TEMPERATURE,
     DEFAULT_HEATING_BOOST_MINUTES,
     DEFAULT_HEATING_BOOST_TEMPERATURE,
+    DEFAULT_STALE_TIMEOUT_MINUTES,
+    DEFAULT_TEMPERATURE_DEADBAND,
+    DEFAULT_TEMPERATURE_HEARTBEAT_MINUTES,
+    DEFAULT_TRACE_SAMPLE_RATE,
     DEFAULT_WATER_BOOST_MINUTES,
     DOMAIN,
     HIVE_BOOST,
     LOGGER,
+    MODEL_SLR1,
     MODEL_SLR2,
+    SIGNAL_TRIGGER,
+    STATE_CACHE_SAVE_DELAY,
+    STORAGE_VERSION,
+    TRIGGER_HEAT_BOOST_ENDED,
+    TRIGGER_HEAT_BOOST_STARTED,
+    TRIGGER_HEATING_STARTED,
+    TRIGGER_HEATING_STOPPED,
+    TRIGGER_HVAC_MODE_CHANGED,
+    TRIGGER_WATER_BOOST_ENDED,
+    TRIGGER_WATER_BOOST_STARTED,
+)
+from .error_reporter import (
+    ISSUE_INVALID_PAYLOAD,
+    ISSUE_MODEL_MISMATCH,
+    ErrorReporter,
+)
+from .latency import (
+    COMMAND_BOOST,
+    COMMAND_MODE,
+    COMMAND_SETPOINT,
+    CommandLatencyTracker,
+    reflects,
+)
+from .message_trace import (
+    TRACE_CORRECTION,
+    TRACE_QUEUED,
+    TRACE_REQUEST,
+    TRACE_SENT,
+    TRACE_SUPPRESSED,
+    TraceBuffer,
+)
+from .push import HivePushCoordinator
+from .schedule import (
+    SCHEDULE_HEAT,
+    SCHEDULE_REQUEST_TIMEOUT,
+    SCHEDULE_WATER,
+    DaySchedule,
+    WeeklySchedule,
+)
+from .validation import (
+    BOOLEAN,
+    NUMBER,
+    OBJECT,
+    PAYLOAD_FIELD,
+    STRING,
+    PayloadValidator,
 )
 
 PRESET_MAP = {
@@ -37,8 +104,156 @@ PRESET_MAP = {
 
 BOOST_ERROR = 65000
 
+# Number entity values persisted in the state cache
+SETTINGS_KEYS = (
+    "heating_boost_duration",
+    "heating_boost_temperature",
+    "heating_frost_prevention",
+    "water_boost_duration",
+)
+
+
+def decode_attribute_str(payload: str) -> str:
+    """Decode a string attribute published on its own topic."""
+    return payload
+
+
+def decode_attribute_float(payload: str) -> float | None:
+    """Decode a numeric attribute published on its own topic."""
+    if payload in ("", "null"):
+        return None
+    return float(payload)
+
+
+def decode_attribute_int(payload: str) -> int | None:
+    """Decode an integer attribute published on its own topic."""
+    if payload in ("", "null"):
+        return None
+    return int(float(payload))
+
+
+def decode_attribute_bool(payload: str) -> bool:
+    """Decode a boolean attribute published on its own topic."""
+    return payload.lower() == "true"
+
+
+def state_cache_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the persisted state cache for a config entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+
+
+@dataclass(frozen=True, slots=True)
+class HivePayloadKeys:
+    """Payload keys for one Hive channel (heating or water)."""
+
+    system_mode: str
+    hold: str
+    hold_duration: str
+    setpoint: str
+    local_temperature: str
+    running_state: str
+    weekly_schedule: str
+
+    @property
+    def inputs(self) -> frozenset[str]:
+        """Return all keys that feed derived values."""
+        return frozenset(
+            (
+                self.system_mode,
+                self.hold,
+                self.hold_duration,
+                self.setpoint,
+                self.local_temperature,
+                self.running_state,
+            )
+        )
+
+    @property
+    def attribute_decoders(self) -> dict[str, Callable[[str], Any]]:
+        """Return the attribute output decoder for each key."""
+        return {
+            self.system_mode: decode_attribute_str,
+            self.hold: decode_attribute_bool,
+            self.hold_duration: decode_attribute_int,
+            self.setpoint: decode_attribute_float,
+            self.local_temperature: decode_attribute_float,
+            self.running_state: decode_attribute_str,
+        }
+
+    @property
+    def field_types(self) -> dict[str, frozenset[type]]:
+        """Return the accepted types for each key."""
+        return {
+            self.system_mode: STRING,
+            self.hold: BOOLEAN,
+            self.hold_duration: NUMBER,
+            self.setpoint: NUMBER,
+            self.local_temperature: NUMBER,
+            self.running_state: STRING,
+            self.weekly_schedule: OBJECT,
+        }
+
+
+HEAT_KEYS_SLR1 = HivePayloadKeys(
+    system_mode="system_mode",
+    hold="temperature_setpoint_hold",
+    hold_duration="temperature_setpoint_hold_duration",
+    setpoint="occupied_heating_setpoint",
+    local_temperature="local_temperature",
+    running_state="running_state",
+    weekly_schedule="weekly_schedule",
+)
+
+HEAT_KEYS_SLR2 = HivePayloadKeys(
+    system_mode="system_mode_heat",
+    hold="temperature_setpoint_hold_heat",
+    hold_duration="temperature_setpoint_hold_duration_heat",
+    setpoint="occupied_heating_setpoint_heat",
+    local_temperature="local_temperature_heat",
+    running_state="running_state_heat",
+    weekly_schedule="weekly_schedule_heat",
+)
 
-class HiveCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+WATER_KEYS = HivePayloadKeys(
+    system_mode="system_mode_water",
+    hold="temperature_setpoint_hold_water",
+    hold_duration="temperature_setpoint_hold_duration_water",
+    setpoint="occupied_heating_setpoint_water",
+    local_temperature="local_temperature_water",
+    running_state="running_state_water",
+    weekly_schedule="weekly_schedule_water",
+)
+
+
+def payload_validator(model: str) -> PayloadValidator:
+    """Return a validator for the payloads of a model.
+
+    SLR2 payloads always carry the water mode, SLR1 and OTR1 never do.
+    """
+    if model == MODEL_SLR2:
+        return PayloadValidator(
+            HEAT_KEYS_SLR2.field_types | WATER_KEYS.field_types,
+            required={WATER_KEYS.system_mode: HEAT_KEYS_SLR1.inputs},
+        )
+    return PayloadValidator(
+        HEAT_KEYS_SLR1.field_types,
+        unexpected=frozenset((WATER_KEYS.system_mode,)),
+    )
+
+
+def detect_model(data: dict[str, Any]) -> str | None:
+    """Return the model a payload is from, judged by its keys.
+
+    SLR1 and OTR1 payloads have the same keys, so either is reported as SLR1.
+    """
+    if WATER_KEYS.system_mode in data or not HEAT_KEYS_SLR2.inputs.isdisjoint(data):
+        return MODEL_SLR2
+    if not HEAT_KEYS_SLR1.inputs.isdisjoint(data):
+        return MODEL_SLR1
+    return None
+
+
+class HiveCoordinator(HivePushCoordinator):
     """Class to manage fetching Hive data from MQTT."""
 
     current_temperature: float | None = None
@@ -80,19 +295,92 @@ class HiveCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         topic: str,
         show_heat_schedule_mode: bool,  # noqa: FBT001
         show_water_schedule_mode: bool,  # noqa: FBT001
+        attribute_output: bool = False,  # noqa: FBT001, FBT002
+        temperature_deadband: float = DEFAULT_TEMPERATURE_DEADBAND,
+        temperature_heartbeat: float = DEFAULT_TEMPERATURE_HEARTBEAT_MINUTES,
+        stale_timeout: float = DEFAULT_STALE_TIMEOUT_MINUTES,
+        trace_sample_rate: int = DEFAULT_TRACE_SAMPLE_RATE,
     ) -> None:
         """Initialize the coordinator."""
-        super().__init__(
-            hass,
-            LOGGER,
-            name=f"{DOMAIN}_{entry_id}",
-        )
+        super().__init__(hass)
         self.entry_id = entry_id
         self.model = model
         self.topic = topic
         self.show_heating_schedule_mode = show_heat_schedule_mode
         self.show_water_schedule_mode = show_water_schedule_mode
-        self.data: dict[str, Any] = {}
+        self.attribute_output = attribute_output
+        self.temperature_deadband = temperature_deadband
+        self.temperature_heartbeat = temperature_heartbeat
+        self.stale_timeout = stale_timeout
+
+        # Availability, from Zigbee2MQTT and the stale data watchdog
+        self.online: bool | None = None
+        self.stale = False
+        self.last_report: datetime | None = None
+        self.subscribed_at: datetime | None = None
+        self._availability_listeners: list[CALLBACK_TYPE] = []
+
+        # Last known receiver state, merged from (possibly partial) payloads
+        self.reported_state: dict[str, Any] = {}
+        self._heat_keys = HEAT_KEYS_SLR2 if model == MODEL_SLR2 else HEAT_KEYS_SLR1
+        self._input_keys: frozenset[str] = self._heat_keys.inputs
+        self._attribute_decoders = self._heat_keys.attribute_decoders
+        self._mode_keys: tuple[str, ...] = (self._heat_keys.system_mode,)
+        self._hold_keys: tuple[str, ...] = (self._heat_keys.hold,)
+        self.schedules = {
+            SCHEDULE_HEAT: WeeklySchedule(self._heat_keys.weekly_schedule)
+        }
+        if model == MODEL_SLR2:
+            self._input_keys |= WATER_KEYS.inputs
+            self._attribute_decoders |= WATER_KEYS.attribute_decoders
+            self._mode_keys += (WATER_KEYS.system_mode,)
+            self._hold_keys += (WATER_KEYS.hold,)
+            self.schedules[SCHEDULE_WATER] = WeeklySchedule(WATER_KEYS.weekly_schedule)
+        self._schedule_keys = {
+            schedule.key: schedule for schedule in self.schedules.values()
+        }
+        self._schedule_reported = Event()
+
+        self.validator = payload_validator(model)
+        self.model_switching = False
+        self.trace = TraceBuffer(topic, trace_sample_rate)
+        self.errors = ErrorReporter(hass, entry_id, topic, trace=self.trace)
+
+        self._unsubscribes: list[CALLBACK_TYPE] = []
+
+        # Commands held while the receiver or MQTT is offline
+        self.command_queue = CommandQueue(self._mode_keys)
+        self._replaying = False
+        self.commands_suppressed = 0
+
+        # Diagnostics
+        self.latency = CommandLatencyTracker()
+
+        # Persisted state cache, values are cached until the first live report
+        self._store = state_cache_store(hass, entry_id)
+        self.cached = False
+        self.cached_at: datetime | None = None
+        self.restored_settings: set[str] = set()
+
+    @property
+    def topic_attributes(self) -> str:
+        """Return the wildcard topic for attribute output."""
+        return self.topic + "/+"
+
+    @property
+    def topic_availability(self) -> str:
+        """Return the Zigbee2MQTT availability topic."""
+        return self.topic + "/availability"
+
+    @property
+    def available(self) -> bool:
+        """Return True unless the receiver is offline or its data is stale."""
+        return self.online is not False and not self.stale
+
+    @property
+    def can_publish(self) -> bool:
+        """Return True if commands can reach the receiver."""
+        return self.online is not False and mqtt.is_connected(self.hass)
 
     @property
     def topic_get(self) -> str:
@@ -104,6 +392,115 @@ class HiveCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Return the topic setter."""
         return self.topic + "/set"
 
+    async def async_subscribe(self) -> None:
+        """Subscribe to the receiver state topic."""
+        if self.attribute_output:
+            # Each attribute is published on its own subtopic
+            topic = self.topic_attributes
+            message_handler = self.handle_mqtt_attribute
+        else:
+            topic = self.topic
+            message_handler = self.handle_mqtt_message
+
+        LOGGER.debug(
+            "Subscribing to MQTT topic: %s, will parse platforms for %s",
+            topic,
+            self.model,
+        )
+
+        self._unsubscribes.append(
+            await mqtt_client.async_subscribe(self.hass, topic, message_handler, 1)
+        )
+        self._unsubscribes.append(
+            await mqtt_client.async_subscribe(
+                self.hass, self.topic_availability, self.handle_mqtt_availability, 1
+            )
+        )
+        self._unsubscribes.append(
+            mqtt.async_subscribe_connection_status(
+                self.hass, self.handle_mqtt_connection_status
+            )
+        )
+        self.subscribed_at = utcnow()
+
+    @callback
+    def async_unsubscribe(self) -> None:
+        """Unsubscribe from the receiver state and availability topics."""
+        while self._unsubscribes:
+            self._unsubscribes.pop()()
+
+    async def async_request_state(self) -> None:
+        """Ask the receiver to publish its current state."""
+        payload = r'{"system_mode":""}'
+        self.trace.record(TRACE_REQUEST, payload)
+        await mqtt_client.async_publish(self.hass, self.topic_get, payload)
+
+    async def async_apply_options(self, options: Mapping[str, Any]) -> None:
+        """Apply changed config entry options without reloading.
+
+        A model change needs different platforms and is handled by a reload.
+        """
+        self.show_heating_schedule_mode = options.get(
+            CONF_SHOW_HEAT_SCHEDULE_MODE, True
+        )
+        self.show_water_schedule_mode = options.get(CONF_SHOW_WATER_SCHEDULE_MODE, True)
+        self.temperature_deadband = options.get(
+            CONF_TEMPERATURE_DEADBAND, DEFAULT_TEMPERATURE_DEADBAND
+        )
+        self.temperature_heartbeat = options.get(
+            CONF_TEMPERATURE_HEARTBEAT, DEFAULT_TEMPERATURE_HEARTBEAT_MINUTES
+        )
+        self.stale_timeout = options.get(
+            CONF_STALE_TIMEOUT, DEFAULT_STALE_TIMEOUT_MINUTES
+        )
+        self.trace.sample_rate = int(
+            options.get(CONF_TRACE_SAMPLE_RATE, DEFAULT_TRACE_SAMPLE_RATE)
+        )
+        if self.stale and not self.stale_timeout:
+            self.stale = False
+            self.async_availability_changed()
+
+        topic = options[CONF_MQTT_TOPIC]
+        attribute_output = options.get(CONF_ATTRIBUTE_OUTPUT, False)
+        if topic != self.topic or attribute_output != self.attribute_output:
+            self.async_unsubscribe()
+            if topic != self.topic:
+                self.forget_reported_state()
+            self.topic = topic
+            self.errors.name = topic
+            self.trace.name = topic
+            self.attribute_output = attribute_output
+            self.online = None
+            await self.async_subscribe()
+            await self.async_request_state()
+
+        # Decode the modes again, schedule visibility changes how they map
+        if self.reported_state:
+            changed = {self._heat_keys.system_mode, self._heat_keys.hold}
+            if self.model == MODEL_SLR2:
+                changed |= {WATER_KEYS.system_mode, WATER_KEYS.hold}
+            self.apply_changes(changed, send_corrections=False)
+
+        self.async_update_listeners()
+
+    @callback
+    def forget_reported_state(self) -> None:
+        """Drop what the old topic reported, it may be another receiver.
+
+        The values already shown are flagged as cached until the new topic
+        reports.
+        """
+        self.reported_state = {}
+        self.last_report = None
+        self.last_mqtt_payload = None
+        self.latency = CommandLatencyTracker()
+        for schedule in self.schedules.values():
+            schedule.days.clear()
+            schedule.reported.clear()
+        self.cached = True
+        self.cached_at = None
+        self.async_availability_changed()
+
     @property
     def boost_remaining_heat(self) -> int:
         """Return the remaining boost time for heating."""
@@ -127,6 +524,16 @@ class HiveCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return HVACAction.OFF
         return None
 
+    @property
+    def command_latency(self) -> float | None:
+        """Return the last command round trip time in seconds."""
+        return self.latency.last
+
+    @property
+    def commands_lost(self) -> int:
+        """Return the number of commands the receiver never confirmed."""
+        return self.latency.lost
+
     @property
     def local_temperature_heat(self) -> float | None:
         """Return the local temperature for heating."""
@@ -139,182 +546,634 @@ class HiveCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         )
 
     @callback
-    def handle_mqtt_message(self, message: ReceiveMessage) -> None:  # noqa: C901, PLR0912, PLR0915
+    def handle_mqtt_message(self, message: ReceiveMessage) -> None:
         """Handle received MQTT message."""
         topic = message.topic
         payload = message.payload
-        LOGGER.debug("Received from %s payload: %s", topic, payload)
+        self.trace.received(payload)
 
         if not payload:
-            LOGGER.error(
+            self.errors.error(
+                "empty_payload",
                 "Received empty payload on topic %s, check that you have the correct topic name",
                 topic,
             )
+            self.errors.problem(ISSUE_INVALID_PAYLOAD)
             return
 
-        self.current_temperature = None
-        self.target_temperature = None
-        self.preset_mode = None
-        self.hvac_mode = None
-        self.heat_boost = False
-        self.water_boost = False
-        self.water_mode = None
-
         try:
             parsed_data: dict[str, Any] = json.loads(payload)
 
             # Store last payload for diagnostics
             self.last_mqtt_payload = parsed_data
 
-            if not self.valid_data_for_model(parsed_data):
+            validation = self.validator.validate(parsed_data)
+            if validation.model_mismatch and self.async_detect_model(parsed_data):
                 return
+            if validation.errors:
+                self.report_rejected(validation.errors, validation.model_mismatch)
+            if validation.valid is None:
+                return
+            self.errors.resolved()
 
-            if self.model == MODEL_SLR2:
-                reported_boost_remaining_heat = cast(
-                    int,
-                    parsed_data["temperature_setpoint_hold_duration_heat"]
-                    if parsed_data["system_mode_heat"] == "emergency_heating"
-                    else 0,
-                )
-                reported_boost_remaining_water = cast(
-                    int,
-                    parsed_data["temperature_setpoint_hold_duration_water"]
-                    if parsed_data["system_mode_water"] == "emergency_heating"
-                    else 0,
+            for key, schedule in self._schedule_keys.items():
+                if key in validation.valid:
+                    self.handle_schedule_report(schedule, validation.valid[key])
+
+            # Triggers only fire between live reports
+            before = self.trigger_state() if self.last_report is not None else None
+            changed = self.merge_state(validation.valid)
+            self.report_received()
+            if not changed:
+                return
+
+            self.schedule_save()
+
+            corrected = self.apply_changes(changed)
+            if before is not None:
+                self.fire_triggers(before)
+            if corrected:
+                return  # Correction made, exit to avoid state update loop
+
+            self.async_update_listeners()
+        except json.JSONDecodeError:
+            self.errors.error(
+                "invalid_json", "Failed to parse JSON from MQTT payload: %s", payload
+            )
+            self.errors.problem(ISSUE_INVALID_PAYLOAD)
+        except Exception as err:  # noqa: BLE001
+            self.errors.error(
+                "message_error", "Error handling MQTT message from %s: %s", topic, err
+            )
+
+    @callback
+    def handle_mqtt_availability(self, message: ReceiveMessage) -> None:
+        """Handle a Zigbee2MQTT availability message."""
+        payload = cast(str, message.payload)
+        LOGGER.debug("Received from %s payload: %s", message.topic, payload)
+
+        # Legacy availability is a plain string, current is {"state": "online"}
+        try:
+            parsed = json.loads(payload)
+        except json.JSONDecodeError:
+            parsed = payload
+        state = parsed.get("state") if isinstance(parsed, dict) else parsed
+
+        online = state == "online"
+        if online == self.online:
+            return
+
+        was_offline = self.online is False
+        self.online = online
+        LOGGER.info("Receiver %s is %s", self.topic, "online" if online else "offline")
+
+        if online and was_offline and self.config_entry is not None:
+            self.config_entry.async_create_task(self.hass, self.async_reconnected())
+
+        self.async_availability_changed()
+
+    @callback
+    def handle_mqtt_connection_status(self, connected: bool) -> None:  # noqa: FBT001
+        """Replay queued commands when the MQTT connection is restored."""
+        if connected and self.command_queue and self.config_entry is not None:
+            self.config_entry.async_create_task(self.hass, self.async_replay_commands())
+
+    async def async_reconnected(self) -> None:
+        """Replay queued commands and refresh state once the receiver is back."""
+        await self.async_replay_commands()
+        await self.async_request_state()
+
+    async def async_replay_commands(self) -> None:
+        """Send queued commands in order while the receiver can be reached."""
+        if self._replaying:
+            return
+
+        self._replaying = True
+        try:
+            while self.command_queue and self.can_publish:
+                command = self.command_queue.popleft()
+                LOGGER.debug("Replaying queued command to %s", self.topic_set)
+                if not await self._async_send(command):
+                    break
+                if self.command_queue:
+                    await sleep(COMMAND_REPLAY_DELAY)
+        finally:
+            self._replaying = False
+
+    @callback
+    def async_add_availability_listener(
+        self, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for availability changes, returns a callback to stop."""
+        self._availability_listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._availability_listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_availability_changed(self) -> None:
+        """Notify entities that availability changed.
+
+        Entities may skip writing state on data updates, so availability
+        changes are delivered separately.
+        """
+        for update_callback in list(self._availability_listeners):
+            update_callback()
+
+    @callback
+    def report_received(self) -> None:
+        """Record that a live report arrived from the receiver."""
+        was_cached = self.cached
+        self.cached = False
+        self.last_report = utcnow()
+        self.latency.report_received(self.reported_state)
+
+        if self.stale:
+            self.stale = False
+            LOGGER.info("Receiver %s is reporting again", self.topic)
+            self.async_availability_changed()
+        elif was_cached:
+            # Entities drop the cached flag, even those skipping this update
+            self.async_availability_changed()
+
+    @callback
+    def check_stale(self, now: datetime) -> None:
+        """Flag the data as stale if no report arrived within the timeout."""
+        since = self.last_report or self.subscribed_at
+        if (
+            self.stale
+            or not self.stale_timeout
+            or since is None
+            or now - since <= timedelta(minutes=self.stale_timeout)
+        ):
+            return
+
+        self.stale = True
+        LOGGER.warning(
+            "No report from %s for %s minutes, marking it unavailable",
+            self.topic,
+            self.stale_timeout,
+        )
+        self.async_availability_changed()
+
+    @callback
+    def handle_mqtt_attribute(self, message: ReceiveMessage) -> None:
+        """Handle a single attribute published on its own subtopic."""
+        attribute = message.topic.rpartition("/")[2]
+
+        if (schedule := self._schedule_keys.get(attribute)) is not None:
+            payload = cast(str, message.payload)
+            self.trace.received((attribute, payload))
+            try:
+                self.handle_schedule_report(schedule, json.loads(payload))
+            except json.JSONDecodeError:
+                self.errors.error(
+                    f"invalid_{attribute}",
+                    "Failed to parse %s from MQTT payload: %s",
+                    attribute,
+                    payload,
                 )
-                reported_boost_temperature = parsed_data[
-                    "occupied_heating_setpoint_heat"
-                ]
-                self.running_state_heat = cast(
-                    str,
-                    parsed_data.get("running_state_heat")
-                    if parsed_data.get("running_state_heat")
-                    else "preheating",
+            return
+
+        # Also skips our own set/get topics and availability
+        if (decoder := self._attribute_decoders.get(attribute)) is None:
+            # An attribute only another model publishes switches to it
+            self.async_detect_model({attribute: message.payload})
+            return
+        if self.model_switching:
+            return
+
+        payload = cast(str, message.payload)
+        self.trace.received((attribute, payload))
+
+        try:
+            value = decoder(payload)
+        except ValueError:
+            self.validator.reject({attribute: f"could not decode {payload!r}"})
+            self.errors.error(
+                f"invalid_{attribute}",
+                "Failed to parse %s from MQTT payload: %s",
+                attribute,
+                payload,
+            )
+            return
+
+        # Store last payload for diagnostics
+        self.last_mqtt_payload = {attribute: value}
+        self.errors.resolved()
+
+        try:
+            # Triggers only fire between live reports
+            before = self.trigger_state() if self.last_report is not None else None
+            changed = self.merge_state({attribute: value})
+            self.report_received()
+            if not changed:
+                return
+
+            self.schedule_save()
+
+            corrected = self.apply_changes(changed)
+            if before is not None:
+                self.fire_triggers(before)
+            if corrected:
+                return  # Correction made, exit to avoid state update loop
+
+            self.async_update_listeners()
+        except Exception as err:  # noqa: BLE001
+            self.errors.error(
+                "message_error",
+                "Error handling MQTT message from %s: %s",
+                message.topic,
+                err,
+            )
+
+    async def async_load_cache(self) -> None:
+        """Seed the coordinator from the persisted state cache."""
+        if not (data := await self._store.async_load()):
+            return
+
+        for key, value in data.get("settings", {}).items():
+            if key in SETTINGS_KEYS:
+                setattr(self, key, value)
+                self.restored_settings.add(key)
+
+        boost = data.get("boost", {})
+        if started := boost.get("heat_boost_started"):
+            self.heat_boost_started = parse_datetime(started)
+            self.heat_boost_started_duration = boost.get(
+                "heat_boost_started_duration", 0
+            )
+        if started := boost.get("water_boost_started"):
+            self.water_boost_started = parse_datetime(started)
+            self.water_boost_started_duration = boost.get(
+                "water_boost_started_duration", 0
+            )
+
+        for channel, days in data.get("schedules", {}).items():
+            if channel in self.schedules:
+                self.schedules[channel].load(days)
+
+        if reported_state := data.get("reported_state"):
+            self.reported_state = dict(reported_state)
+            self.apply_changes(set(self._input_keys), send_corrections=False)
+            self.cached = True
+            self.cached_at = parse_datetime(data.get("saved", ""))
+
+        LOGGER.debug(
+            "Loaded cached state for %s, saved at %s", self.topic, self.cached_at
+        )
+
+    @callback
+    def schedule_save(self) -> None:
+        """Schedule a debounced save of the state cache."""
+        self._store.async_delay_save(self._data_to_save, STATE_CACHE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the state cache to persist."""
+        return {
+            "saved": utcnow().isoformat(),
+            "reported_state": self.reported_state,
+            "settings": {key: getattr(self, key) for key in SETTINGS_KEYS},
+            "boost": {
+                "heat_boost_started": self.heat_boost_started.isoformat()
+                if self.heat_boost_started
+                else None,
+                "heat_boost_started_duration": self.heat_boost_started_duration,
+                "water_boost_started": self.water_boost_started.isoformat()
+                if self.water_boost_started
+                else None,
+                "water_boost_started_duration": self.water_boost_started_duration,
+            },
+            "schedules": {
+                channel: schedule.to_storage()
+                for channel, schedule in self.schedules.items()
+            },
+        }
+
+    @callback
+    def handle_schedule_report(self, schedule: WeeklySchedule, value: Any) -> None:
+        """Merge a reported group of days into a weekly schedule."""
+        if schedule.update_from_report(value):
+            self.schedule_save()
+        self._schedule_reported.set()
+
+    async def async_request_schedule(self, channel: str) -> bool:
+        """Ask the receiver for a weekly schedule and wait for every day.
+
+        Returns False if the receiver did not report every day in time, the
+        days it did report are still merged in.
+        """
+        schedule = self.schedules[channel]
+        schedule.reported.clear()
+        payload = json.dumps({schedule.key: ""})
+        self.trace.record(TRACE_REQUEST, payload)
+        await mqtt_client.async_publish(self.hass, self.topic_get, payload)
+
+        try:
+            async with timeout(SCHEDULE_REQUEST_TIMEOUT):
+                while not schedule.reported_all:
+                    self._schedule_reported.clear()
+                    await self._schedule_reported.wait()
+        except TimeoutError:
+            return False
+        return True
+
+    async def async_set_schedule(
+        self, channel: str, days: dict[str, DaySchedule], *, force: bool = False
+    ) -> tuple[list[str], list[str]]:
+        """Write the days of a weekly schedule that changed.
+
+        Days sharing the same transitions are written by one command. Writes
+        are not queued, once a publish fails the remaining days are not sent.
+        Returns the days that were sent, which are then taken as the known
+        schedule, and the changed days that failed.
+        """
+        schedule = self.schedules[channel]
+        changed = schedule.changed_days(days, force=force)
+
+        sent: list[str] = []
+        for command in schedule.commands(changed):
+            try:
+                await self._async_publish(command)
+            except HomeAssistantError as err:
+                LOGGER.warning(
+                    "Failed to write %s schedule to %s: %s", channel, self.topic, err
                 )
+                break
+            for day in command[schedule.key]["dayofweek"]:
+                schedule.days[day] = changed[day]
+                sent.append(day)
+
+        if sent:
+            self.schedule_save()
+        return sent, [day for day in changed if day not in sent]
+
+    @callback
+    def set_setting(self, key: str, value: float) -> None:
+        """Store a number entity value and persist it."""
+        setattr(self, key, value)
+        self.schedule_save()
+
+    def merge_state(self, data: dict[str, Any]) -> set[str]:
+        """Merge a (possibly partial) payload into the last known state.
+
+        Returns the keys whose value changed, or every input key on the first
+        report so that all derived values are computed once.
+        """
+        initial = not self.reported_state
+        changed = {
+            key
+            for key, value in data.items()
+            if key not in self.reported_state or self.reported_state[key] != value
+        }
+        self.reported_state.update(data)
+
+        if initial:
+            return changed | self._input_keys
+        return changed
+
+    def apply_changes(  # noqa: PLR0912
+        self,
+        changed: set[str],
+        send_corrections: bool = True,  # noqa: FBT001, FBT002
+    ) -> bool:
+        """Recompute derived values whose inputs changed.
+
+        Returns True if a boost correction was sent.
+        """
+        state = self.reported_state
+        keys = self._heat_keys
+
+        if keys.running_state in changed:
+            self.running_state_heat = cast(
+                str, state.get(keys.running_state) or "preheating"
+            )
+        if keys.local_temperature in changed:
+            self.current_temperature = state.get(keys.local_temperature)
+
+        setpoint = state.get(keys.setpoint)
+        if keys.setpoint in changed or setpoint == 1:
+            if setpoint == 1:
+                self.target_temperature = self.heating_frost_prevention
+            else:
+                self.target_temperature = setpoint
+
+        system_mode = state.get(keys.system_mode)
+        if keys.system_mode in changed or keys.hold in changed:
+            self.decode_heat_mode(system_mode, state.get(keys.hold))
+
+        if (
+            system_mode is not None
+            and system_mode != "emergency_heating"
+            and not changed.isdisjoint((keys.system_mode, keys.hold, keys.setpoint))
+        ):
+            self.pre_boost_occupied_heating_setpoint_heat = self.target_temperature
+            self.pre_boost_hvac_mode = self.hvac_mode
+
+        if self.model == MODEL_SLR2:
+            if WATER_KEYS.running_state in changed:
                 self.running_state_water = cast(
-                    str,
-                    parsed_data.get("running_state_water")
-                    if parsed_data.get("running_state_water")
-                    else "preheating",
+                    str, state.get(WATER_KEYS.running_state) or "preheating"
                 )
-                self.current_temperature = parsed_data["local_temperature_heat"]
-                if parsed_data["occupied_heating_setpoint_heat"] == 1:
-                    self.target_temperature = self.heating_frost_prevention
-                else:
-                    self.target_temperature = parsed_data[
-                        "occupied_heating_setpoint_heat"
-                    ]
-                self.preset_mode = self.climate_preset(parsed_data["system_mode_heat"])
-                if parsed_data["system_mode_heat"] == "heat":
-                    if (
-                        parsed_data["temperature_setpoint_hold_heat"] is False
-                        and self.show_heating_schedule_mode
-                    ):
-                        self.hvac_mode = HVACMode.AUTO
-                    else:
-                        self.hvac_mode = HVACMode.HEAT
-                if parsed_data["system_mode_heat"] == "emergency_heating":
-                    self.hvac_mode = HVACMode.HEAT
-                    self.heat_boost = True
-                if parsed_data["system_mode_heat"] == "off":
-                    self.hvac_mode = HVACMode.OFF
-
-                if parsed_data["system_mode_heat"] != "emergency_heating":
-                    self.pre_boost_occupied_heating_setpoint_heat = (
-                        self.target_temperature
-                    )
-                    self.pre_boost_hvac_mode = self.hvac_mode
-                if parsed_data["system_mode_water"] == "heat":
-                    if parsed_data["temperature_setpoint_hold_water"] is False:
-                        if self.show_water_schedule_mode:
-                            self.water_mode = "auto"
-                        else:
-                            self.water_mode = "heat"
-                    else:
-                        self.water_mode = "heat"
-                if parsed_data["system_mode_water"] == "emergency_heating":
-                    self.water_mode = "boost"
-                    self.water_boost = True
-                if parsed_data["system_mode_water"] == "off":
-                    self.water_mode = "off"
-
-                if parsed_data["system_mode_water"] != "emergency_heating":
+
+            water_system_mode = state.get(WATER_KEYS.system_mode)
+            if WATER_KEYS.system_mode in changed or WATER_KEYS.hold in changed:
+                self.decode_water_mode(water_system_mode, state.get(WATER_KEYS.hold))
+                if (
+                    water_system_mode is not None
+                    and water_system_mode != "emergency_heating"
+                ):
                     self.pre_boost_water_mode = self.water_mode
-            else:
-                reported_boost_remaining_heat = cast(
-                    int,
-                    parsed_data["temperature_setpoint_hold_duration"]
-                    if parsed_data["system_mode"] == "emergency_heating"
-                    else 0,
-                )
-                reported_boost_temperature = parsed_data["occupied_heating_setpoint"]
-                self.running_state_heat = cast(
-                    str,
-                    parsed_data.get("running_state")
-                    if parsed_data.get("running_state")
-                    else "preheating",
-                )
-                self.current_temperature = parsed_data["local_temperature"]
-                if parsed_data["occupied_heating_setpoint"] == 1:
-                    self.target_temperature = self.heating_frost_prevention
-                else:
-                    self.target_temperature = parsed_data["occupied_heating_setpoint"]
-                self.preset_mode = self.climate_preset(parsed_data["system_mode"])
-
-                if parsed_data["system_mode"] == "heat":
-                    if (
-                        parsed_data["temperature_setpoint_hold"] is False
-                        and self.show_heating_schedule_mode
-                    ):
-                        self.hvac_mode = HVACMode.AUTO
-                    else:
-                        self.hvac_mode = HVACMode.HEAT
-                if parsed_data["system_mode"] == "emergency_heating":
-                    self.hvac_mode = HVACMode.HEAT
-                    self.heat_boost = True
-                if parsed_data["system_mode"] == "off":
-                    self.hvac_mode = HVACMode.OFF
-
-                if parsed_data["system_mode"] != "emergency_heating":
-                    self.pre_boost_occupied_heating_setpoint_heat = (
-                        self.target_temperature
-                    )
-                    self.pre_boost_hvac_mode = self.hvac_mode
 
+        # Both channels are checked, changed keys are not seen again later
+        corrected = False
+        if keys.system_mode in changed or keys.hold_duration in changed:
+            reported_boost_remaining_heat = cast(
+                int,
+                (state.get(keys.hold_duration) or 0)
+                if system_mode == "emergency_heating"
+                else 0,
+            )
             if self.correct_heat_boost(
-                reported_boost_remaining_heat, reported_boost_temperature
+                reported_boost_remaining_heat, setpoint, send_corrections
             ):
-                return  # Correction made, exit to avoid state update loop
-            self.record_heat_boost_state()
-
-            if self.model == MODEL_SLR2:
-                if self.correct_water_boost(reported_boost_remaining_water):
-                    return  # Correction made, exit to avoid state update loop
+                corrected = send_corrections
+            else:
+                self.record_heat_boost_state()
+
+        if self.model == MODEL_SLR2 and (
+            WATER_KEYS.system_mode in changed or WATER_KEYS.hold_duration in changed
+        ):
+            reported_boost_remaining_water = cast(
+                int,
+                (state.get(WATER_KEYS.hold_duration) or 0)
+                if state.get(WATER_KEYS.system_mode) == "emergency_heating"
+                else 0,
+            )
+            if self.correct_water_boost(
+                reported_boost_remaining_water, send_corrections
+            ):
+                corrected = corrected or send_corrections
+            else:
                 self.record_water_boost_state()
 
-            self.async_set_updated_data(parsed_data)
-        except json.JSONDecodeError:
-            LOGGER.error("Failed to parse JSON from MQTT payload: %s", payload)
-        except Exception as err:  # noqa: BLE001
-            LOGGER.error("Error handling MQTT message: %s", err)
+        return corrected
 
-    def valid_data_for_model(self, data: dict[str, Any]) -> bool:
-        """Check if data is valid for the current model."""
-        if self.model == MODEL_SLR2:
-            if "system_mode_water" not in data:
-                LOGGER.error(
-                    "Received data does not contain 'system_mode_water' for SLR2, check you have the correct model set"
-                )
-                return False
-        elif "system_mode_water" in data:
-            LOGGER.error(
-                "Received data contains 'system_mode_water' for SLR1/OTR1, check you have the correct model set"
+    def decode_heat_mode(self, system_mode: str | None, hold: Any) -> None:
+        """Derive hvac mode, preset and boost flag from the heating mode."""
+        self.preset_mode = (
+            self.climate_preset(system_mode) if system_mode is not None else None
+        )
+        self.heat_boost = system_mode == "emergency_heating"
+        self.hvac_mode = self.heat_hvac_mode(system_mode, hold)
+
+    def heat_hvac_mode(self, system_mode: str | None, hold: Any) -> HVACMode | None:
+        """Return the hvac mode of a reported heating mode and hold."""
+        if system_mode == "heat":
+            if hold is False and self.show_heating_schedule_mode:
+                return HVACMode.AUTO
+            return HVACMode.HEAT
+        if system_mode == "emergency_heating":
+            return HVACMode.HEAT
+        if system_mode == "off":
+            return HVACMode.OFF
+        return None
+
+    def decode_water_mode(self, system_mode: str | None, hold: Any) -> None:
+        """Derive water mode and boost flag from the water mode."""
+        self.water_boost = system_mode == "emergency_heating"
+
+        if system_mode == "heat":
+            if hold is False and self.show_water_schedule_mode:
+                self.water_mode = "auto"
+            else:
+                self.water_mode = "heat"
+        elif system_mode == "emergency_heating":
+            self.water_mode = "boost"
+        elif system_mode == "off":
+            self.water_mode = "off"
+        else:
+            self.water_mode = None
+
+    def trigger_state(self) -> tuple[bool, bool, bool, HVACMode | None]:
+        """Return the values whose transitions fire device triggers.
+
+        They are read from the reported state, not from the values set
+        optimistically when a command is sent, so only transitions confirmed
+        by a report fire.
+        """
+        state = self.reported_state
+        keys = self._heat_keys
+        system_mode = state.get(keys.system_mode)
+        return (
+            system_mode == "emergency_heating",
+            state.get(WATER_KEYS.system_mode) == "emergency_heating",
+            state.get(keys.running_state) == "heat",
+            self.heat_hvac_mode(system_mode, state.get(keys.hold)),
+        )
+
+    @callback
+    def fire_triggers(self, before: tuple[bool, bool, bool, HVACMode | None]) -> None:
+        """Fire the device triggers for the values a report changed."""
+        heat_boost, water_boost, heating, hvac_mode = self.trigger_state()
+        was_heat_boost, was_water_boost, was_heating, was_hvac_mode = before
+        fired: list[str] = []
+        if heat_boost != was_heat_boost:
+            fired.append(
+                TRIGGER_HEAT_BOOST_STARTED if heat_boost else TRIGGER_HEAT_BOOST_ENDED
             )
+        if water_boost != was_water_boost:
+            fired.append(
+                TRIGGER_WATER_BOOST_STARTED
+                if water_boost
+                else TRIGGER_WATER_BOOST_ENDED
+            )
+        if heating != was_heating:
+            fired.append(
+                TRIGGER_HEATING_STARTED if heating else TRIGGER_HEATING_STOPPED
+            )
+        if hvac_mode != was_hvac_mode:
+            fired.append(TRIGGER_HVAC_MODE_CHANGED)
+
+        for trigger_type in fired:
+            async_dispatcher_send(
+                self.hass,
+                SIGNAL_TRIGGER.format(self.entry_id, trigger_type),
+                {"from": was_hvac_mode, "to": hvac_mode}
+                if trigger_type == TRIGGER_HVAC_MODE_CHANGED
+                else {},
+            )
+
+    @callback
+    def async_detect_model(self, data: dict[str, Any]) -> bool:
+        """Switch to the model a payload is from, until the first valid report.
+
+        The model is saved to the config entry options, and the update
+        listener reloads the entry with the matching keys and platforms.
+        Returns True if the model is being switched, payloads are then
+        dropped until the entry reloads.
+        """
+        if self.model_switching:
+            return True
+
+        entry = self.config_entry
+        if (
+            self.last_report is not None
+            or entry is None
+            or (model := detect_model(data)) is None
+            or model == self.model
+        ):
             return False
+
+        LOGGER.warning(
+            "Receiver %s reports as %s but is configured as %s, switching model",
+            self.topic,
+            model,
+            self.model,
+        )
+        self.model_switching = True
+        self.hass.config_entries.async_update_entry(
+            entry, options={**entry.options, CONF_MODEL: model}
+        )
         return True
 
+    def report_rejected(
+        self,
+        errors: dict[str, str],
+        model_mismatch: bool,  # noqa: FBT001
+    ) -> None:
+        """Report the fields rejected from a payload."""
+        if model_mismatch:
+            self.errors.error(
+                "model_mismatch",
+                "Rejected payload from %s for %s: %s, check you have the correct model set",
+                self.topic,
+                self.model,
+                errors,
+            )
+            self.errors.problem(ISSUE_MODEL_MISMATCH, model=self.model)
+        elif PAYLOAD_FIELD in errors:
+            self.errors.error(
+                "invalid_payload",
+                "Rejected payload from %s: %s",
+                self.topic,
+                errors[PAYLOAD_FIELD],
+            )
+            self.errors.problem(ISSUE_INVALID_PAYLOAD)
+        else:
+            self.errors.error(
+                "invalid_fields", "Ignored fields from %s: %s", self.topic, errors
+            )
+
     def correct_heat_boost(
-        self, reported_boost_remaining_heat: int, reported_boost_temperature: float
+        self,
+        reported_boost_remaining_heat: int,
+        reported_boost_temperature: float | None,
+        send: bool = True,  # noqa: FBT001, FBT002
     ) -> bool:
         """Check and correct boost remaining heat if necessary."""
         if reported_boost_remaining_heat > BOOST_ERROR:
@@ -332,7 +1191,13 @@ class HiveCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 reported_boost_remaining_heat,
                 self.heat_boost_remaining,
             )
-            if self.config_entry is not None:
+            if send:
+                self.trace.record(
+                    TRACE_CORRECTION,
+                    ("heat", reported_boost_remaining_heat, self.heat_boost_remaining),
+                )
+                self.trace.dump("heat boost correction")
+            if send and self.config_entry is not None:
                 self.config_entry.async_create_task(
                     self.hass,
                     self.async_heating_boost(
@@ -343,7 +1208,11 @@ class HiveCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.heat_boost_remaining = reported_boost_remaining_heat
         return False
 
-    def correct_water_boost(self, reported_boost_remaining_water: int) -> bool:
+    def correct_water_boost(
+        self,
+        reported_boost_remaining_water: int,
+        send: bool = True,  # noqa: FBT001, FBT002
+    ) -> bool:
         """Check and correct boost remaining water if necessary."""
         if reported_boost_remaining_water > BOOST_ERROR:
             # Calculate remaining boost time based on when it started
@@ -360,7 +1229,17 @@ class HiveCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 reported_boost_remaining_water,
                 self.water_boost_remaining,
             )
-            if self.config_entry is not None:
+            if send:
+                self.trace.record(
+                    TRACE_CORRECTION,
+                    (
+                        "water",
+                        reported_boost_remaining_water,
+                        self.water_boost_remaining,
+                    ),
+                )
+                self.trace.dump("water boost correction")
+            if send and self.config_entry is not None:
                 self.config_entry.async_create_task(
                     self.hass, self.async_water_boost(self.water_boost_remaining)
                 )
@@ -402,13 +1281,93 @@ class HiveCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             self.water_boost_started = None
             self.water_boost_started_duration = 0
 
-    async def _async_publish_set(self, payload: str) -> None:
-        """Publish MQTT set message."""
-        LOGGER.debug("Sending to %s message %s", self.topic_set, payload)
+    async def _async_publish_set(self, payload: str, *, force: bool = False) -> None:
+        """Publish MQTT set message, queueing it if it cannot be sent now."""
+        try:
+            command: dict[str, Any] = json.loads(payload)
+        except json.JSONDecodeError:
+            LOGGER.error("Not sending invalid JSON to %s: %s", self.topic_set, payload)
+            return
+
+        if not force and self.command_redundant(command):
+            self.trace.record(TRACE_SUPPRESSED, payload)
+            self.commands_suppressed += 1
+            return
+
+        # Commands queue behind earlier ones so they are never sent out of order
+        if not self.can_publish or self.command_queue:
+            LOGGER.info(
+                "Receiver %s cannot be reached, queueing message %s",
+                self.topic,
+                payload,
+            )
+            self.trace.record(TRACE_QUEUED, payload)
+            self.command_queue.enqueue(command)
+            await self.async_replay_commands()
+            return
+
+        await self._async_send(command)
+
+    async def _async_publish(self, command: dict[str, Any]) -> None:
+        """Publish a command to the receiver's set topic."""
+        payload = json.dumps(command, separators=(",", ":"))
+        self.trace.record(TRACE_SENT, payload)
+        self.track_command(command)
         await mqtt_client.async_publish(self.hass, self.topic_set, payload)
 
+    async def _async_send(self, command: dict[str, Any]) -> bool:
+        """Publish a command, putting it back in the queue if that fails."""
+        try:
+            await self._async_publish(command)
+        except HomeAssistantError as err:
+            LOGGER.warning(
+                "Failed to send to %s, queued for replay: %s", self.topic, err
+            )
+            self.command_queue.requeue(command)
+            return False
+        return True
+
+    def command_redundant(self, command: dict[str, Any]) -> bool:
+        """Return True if the last confirmed state already matches a command.
+
+        Only live state with no commands in flight or queued is trusted, a
+        command that looks redundant may otherwise revert one not yet applied.
+        """
+        # Lost commands are only dropped from pending when checked
+        self.latency.expire()
+        if (
+            self.cached
+            or self.stale
+            or self.latency.pending
+            or self.command_queue
+            or not self.reported_state
+        ):
+            return False
+
+        return reflects(self.reported_state, command)
+
+    def track_command(self, command: dict[str, Any]) -> None:
+        """Start round trip tracking for the modes, holds and setpoint in a command."""
+        expected = {
+            key: command[key]
+            for key in (*self._mode_keys, *self._hold_keys, self._heat_keys.setpoint)
+            if key in command
+        }
+        if not expected:
+            return
+
+        modes = [command[key] for key in self._mode_keys if key in command]
+        if "emergency_heating" in modes:
+            command_type = COMMAND_BOOST
+        elif modes:
+            command_type = COMMAND_MODE
+        else:
+            command_type = COMMAND_SETPOINT
+
+        self.latency.command_sent(command_type, expected, self.reported_state)
+
     async def async_water_boost(
-        self, boost_duration_minutes: int | None = None
+        self, boost_duration_minutes: int | None = None, *, force: bool = False
     ) -> None:
         """Send water boost command."""
 
@@ -425,40 +1384,42 @@ class HiveCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.water_boost_started = utcnow()
         self.water_boost_started_duration = int(duration)
 
-        await self._async_publish_set(payload)
+        await self._async_publish_set(payload, force=force)
 
-    async def async_water_boost_cancel(self) -> None:
+    async def async_water_boost_cancel(self, *, force: bool = False) -> None:
         """Cancel water boost command."""
 
         if self.pre_boost_water_mode == "auto":
-            await self.async_water_scheduled()
+            await self.async_water_scheduled(force=force)
         elif self.pre_boost_water_mode == "heat":
-            await self.async_water_always_on()
+            await self.async_water_always_on(force=force)
         else:
-            await self.async_water_always_off()
+            await self.async_water_always_off(force=force)
 
-    async def async_water_scheduled(self) -> None:
+    async def async_water_scheduled(self, *, force: bool = False) -> None:
         """Send water scheduled command."""
 
         payload = r'{"system_mode_water":"heat","temperature_setpoint_hold_water":"0","temperature_setpoint_hold_duration_water":"0"}'
-        await self._async_publish_set(payload)
+        await self._async_publish_set(payload, force=force)
 
-    async def async_water_always_on(self) -> None:
+    async def async_water_always_on(self, *, force: bool = False) -> None:
         """Send water always on command."""
 
         payload = r'{"system_mode_water":"heat","temperature_setpoint_hold_water":1}'
-        await self._async_publish_set(payload)
+        await self._async_publish_set(payload, force=force)
 
-    async def async_water_always_off(self) -> None:
+    async def async_water_always_off(self, *, force: bool = False) -> None:
         """Send water always off command."""
 
         payload = r'{"system_mode_water":"off","temperature_setpoint_hold_water":0}'
-        await self._async_publish_set(payload)
+        await self._async_publish_set(payload, force=force)
 
     async def async_heating_boost(
         self,
         boost_duration_minutes: int | None = None,
         boost_temperature: float | None = None,
+        *,
+        force: bool = False,
     ) -> None:
         """Send heating boost command."""
 
@@ -489,24 +1450,28 @@ class HiveCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.heat_boost_started = utcnow()
         self.heat_boost_started_duration = int(duration)
 
-        await self._async_publish_set(payload)
+        await self._async_publish_set(payload, force=force)
 
-    async def async_heating_boost_cancel(self) -> None:
+    async def async_heating_boost_cancel(self, *, force: bool = False) -> None:
         """Cancel heating boost command."""
 
         if self.pre_boost_hvac_mode == HVACMode.AUTO:
-            await self.async_set_hvac_mode_auto()
+            await self.async_set_hvac_mode_auto(force=force)
         elif self.pre_boost_hvac_mode == HVACMode.HEAT:
             if self.pre_boost_occupied_heating_setpoint_heat is not None:
                 await self.async_set_hvac_mode_heat(
-                    self.pre_boost_occupied_heating_setpoint_heat
+                    self.pre_boost_occupied_heating_setpoint_heat, force=force
                 )
             else:
-                await self.async_set_hvac_mode_heat(self.heating_frost_prevention)
+                await self.async_set_hvac_mode_heat(
+                    self.heating_frost_prevention, force=force
+                )
         else:
-            await self.async_set_hvac_mode_off()
+            await self.async_set_hvac_mode_off(force=force)
 
-    async def async_set_temperature(self, temperature: float) -> None:
+    async def async_set_temperature(
+        self, temperature: float, *, force: bool = False
+    ) -> None:
         """Set temperature."""
 
         if self.model == MODEL_SLR2:
@@ -514,9 +1479,9 @@ class HiveCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         else:
             payload = r'{"occupied_heating_setpoint":' + str(temperature) + r"}"
 
-        await self._async_publish_set(payload)
+        await self._async_publish_set(payload, force=force)
 
-    async def async_set_hvac_mode_off(self) -> None:
+    async def async_set_hvac_mode_off(self, *, force: bool = False) -> None:
         """Set HVAC mode to off."""
 
         if self.model == MODEL_SLR2:
@@ -525,7 +1490,7 @@ class HiveCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             payload = r'{"system_mode":"off","temperature_setpoint_hold":"0"}'
 
         self.hvac_mode = HVACMode.OFF
-        await self._async_publish_set(payload)
+        await self._async_publish_set(payload, force=force)
 
         await sleep(0.5)
 
@@ -533,18 +1498,18 @@ class HiveCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             payload = (
                 r'{"occupied_heating_setpoint_heat":'
                 + str(self.heating_frost_prevention)
-                + r',"temperature_setpoint_hold_heat":"1","temperature_setpoint_hold_duration_heat:"65535"}'
+                + r',"temperature_setpoint_hold_heat":"1","temperature_setpoint_hold_duration_heat":"65535"}'
             )
         else:
             payload = (
                 r'{"occupied_heating_setpoint":'
                 + str(self.heating_frost_prevention)
-                + r',"temperature_setpoint_hold":"1","temperature_setpoint_hold_duration:"65535"}'
+                + r',"temperature_setpoint_hold":"1","temperature_setpoint_hold_duration":"65535"}'
             )
 
-        await self._async_publish_set(payload)
+        await self._async_publish_set(payload, force=force)
 
-    async def async_set_hvac_mode_auto(self) -> None:
+    async def async_set_hvac_mode_auto(self, *, force: bool = False) -> None:
         """Set HVAC mode to auto."""
 
         if self.model == MODEL_SLR2:
@@ -553,12 +1518,14 @@ class HiveCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             payload = r'{"system_mode":"heat","temperature_setpoint_hold":"0","temperature_setpoint_hold_duration":"0"}'
 
         self.hvac_mode = HVACMode.AUTO
-        await self._async_publish_set(payload)
+        await self._async_publish_set(payload, force=force)
 
     async def async_set_hvac_mode_heat(
         self,
         temperature: float,
         set_from_temperature: bool = False,  # noqa: FBT001, FBT002
+        *,
+        force: bool = False,
     ) -> None:
         """Set HVAC mode to heat."""
 
@@ -588,8 +1555,8 @@ class HiveCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
 
         self.hvac_mode = HVACMode.HEAT
-        await self._async_publish_set(payload)
+        await self._async_publish_set(payload, force=force)
 
         if not set_from_temperature:
             await sleep(0.5)
-            await self._async_publish_set(payload_heating_setpoint)
+            await self._async_publish_set(payload_heating_setpoint, force=force)
@@ -0,0 +1,91 @@
+"""Index of receiver coordinators for Hive Local Thermostat services."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, ServiceCall, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .coordinator import HiveCoordinator
+
+DATA_INDEX: HassKey[HiveCoordinatorIndex] = HassKey(f"{DOMAIN}_index")
+
+
+class HiveCoordinatorIndex:
+    """Maps config entries and devices to their running coordinators.
+
+    Receivers and groups are added when their entry is set up and removed
+    when it unloads, so resolving a service target is a dict lookup per
+    device or entity instead of a scan of the config entries.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self.hass = hass
+        self.by_entry: dict[str, HiveCoordinator] = {}
+        self.by_device: dict[str, HiveCoordinator] = {}
+
+    @callback
+    def async_register(self, coordinator: HiveCoordinator) -> CALLBACK_TYPE:
+        """Index a coordinator, returns a callback to remove it."""
+        entry_id = coordinator.entry_id
+        self.by_entry[entry_id] = coordinator
+
+        # The device is created when the entry's entities are added
+        device = dr.async_get(self.hass).async_get_device(
+            identifiers={(DOMAIN, entry_id)}
+        )
+        device_id = device.id if device is not None else None
+        if device_id is not None:
+            self.by_device[device_id] = coordinator
+
+        @callback
+        def _async_unregister() -> None:
+            self.by_entry.pop(entry_id, None)
+            if device_id is not None:
+                self.by_device.pop(device_id, None)
+
+        return _async_unregister
+
+    @callback
+    def async_resolve(self, call: ServiceCall) -> list[HiveCoordinator]:
+        """Return the coordinators targeted by a service call.
+
+        Areas are expanded to their devices and entities by Home Assistant,
+        targets belonging to other integrations are ignored.
+        """
+        selected = async_extract_referenced_entity_ids(
+            self.hass, call, expand_group=False
+        )
+        coordinators: dict[str, HiveCoordinator] = {}
+
+        for device_id in selected.referenced_devices:
+            if (coordinator := self.by_device.get(device_id)) is not None:
+                coordinators[coordinator.entry_id] = coordinator
+
+        entity_registry = er.async_get(self.hass)
+        for entity_id in selected.referenced | selected.indirectly_referenced:
+            if (
+                (entity := entity_registry.async_get(entity_id)) is not None
+                and entity.config_entry_id is not None
+                and entity.config_entry_id not in coordinators
+                and (coordinator := self.by_entry.get(entity.config_entry_id))
+                is not None
+            ):
+                coordinators[coordinator.entry_id] = coordinator
+
+        return list(coordinators.values())
+
+
+@callback
+def async_get_index(hass: HomeAssistant) -> HiveCoordinatorIndex:
+    """Return the shared coordinator index, creating it on first use."""
+    if (index := hass.data.get(DATA_INDEX)) is None:
+        index = hass.data[DATA_INDEX] = HiveCoordinatorIndex(hass)
+    return index
@@ -0,0 +1,123 @@
+"""Device triggers for Hive Local Thermostat."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components.device_automation import DEVICE_TRIGGER_BASE_SCHEMA
+from homeassistant.const import CONF_DEVICE_ID, CONF_DOMAIN, CONF_PLATFORM, CONF_TYPE
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
+from homeassistant.helpers.typing import ConfigType
+
+from .const import (
+    CONF_ENTRY_TYPE,
+    CONF_MODEL,
+    DOMAIN,
+    MODEL_SLR2,
+    SIGNAL_TRIGGER,
+    TRIGGER_HEAT_BOOST_ENDED,
+    TRIGGER_HEAT_BOOST_STARTED,
+    TRIGGER_HEATING_STARTED,
+    TRIGGER_HEATING_STOPPED,
+    TRIGGER_HVAC_MODE_CHANGED,
+    TRIGGER_WATER_BOOST_ENDED,
+    TRIGGER_WATER_BOOST_STARTED,
+)
+
+HEAT_TRIGGER_TYPES = (
+    TRIGGER_HEAT_BOOST_STARTED,
+    TRIGGER_HEAT_BOOST_ENDED,
+    TRIGGER_HEATING_STARTED,
+    TRIGGER_HEATING_STOPPED,
+    TRIGGER_HVAC_MODE_CHANGED,
+)
+WATER_TRIGGER_TYPES = (TRIGGER_WATER_BOOST_STARTED, TRIGGER_WATER_BOOST_ENDED)
+
+TRIGGER_SCHEMA = DEVICE_TRIGGER_BASE_SCHEMA.extend(
+    {vol.Required(CONF_TYPE): vol.In(HEAT_TRIGGER_TYPES + WATER_TRIGGER_TYPES)}
+)
+
+
+def _entry_id(hass: HomeAssistant, device_id: str) -> str | None:
+    """Return the config entry of a receiver device."""
+    device = dr.async_get(hass).async_get(device_id)
+    if device is None:
+        return None
+
+    return next(
+        (identifier for domain, identifier in device.identifiers if domain == DOMAIN),
+        None,
+    )
+
+
+async def async_get_triggers(
+    hass: HomeAssistant, device_id: str
+) -> list[dict[str, Any]]:
+    """List the triggers of a receiver.
+
+    Groups and the house have no triggers, their members fire their own.
+    """
+    if (entry_id := _entry_id(hass, device_id)) is None or (
+        entry := hass.config_entries.async_get_entry(entry_id)
+    ) is None:
+        return []
+
+    if CONF_ENTRY_TYPE in entry.options:
+        return []
+
+    trigger_types: tuple[str, ...] = HEAT_TRIGGER_TYPES
+    if entry.options.get(CONF_MODEL) == MODEL_SLR2:
+        trigger_types += WATER_TRIGGER_TYPES
+
+    return [
+        {
+            CONF_PLATFORM: "device",
+            CONF_DOMAIN: DOMAIN,
+            CONF_DEVICE_ID: device_id,
+            CONF_TYPE: trigger_type,
+        }
+        for trigger_type in trigger_types
+    ]
+
+
+async def async_attach_trigger(
+    hass: HomeAssistant,
+    config: ConfigType,
+    action: TriggerActionType,
+    trigger_info: TriggerInfo,
+) -> CALLBACK_TYPE:
+    """Attach a trigger to the signal fired by the receiver's coordinator.
+
+    The coordinator detects the transitions as reports arrive, so a trigger
+    is a dispatcher connection and no state change listener is needed.
+    """
+    device_id = config[CONF_DEVICE_ID]
+    trigger_type = config[CONF_TYPE]
+    entry_id = _entry_id(hass, device_id)
+    job = HassJob(action, f"{DOMAIN} device trigger {trigger_info}")
+
+    @callback
+    def _async_fire(data: dict[str, Any]) -> None:
+        hass.async_run_hass_job(
+            job,
+            {
+                "trigger": {
+                    **trigger_info["trigger_data"],
+                    CONF_PLATFORM: "device",
+                    CONF_DOMAIN: DOMAIN,
+                    CONF_DEVICE_ID: device_id,
+                    CONF_TYPE: trigger_type,
+                    "description": f"{DOMAIN} {trigger_type}",
+                    **data,
+                }
+            },
+        )
+
+    return async_dispatcher_connect(
+        hass, SIGNAL_TRIGGER.format(entry_id, trigger_type), _async_fire
+    )
@@ -7,13 +7,20 @@ from typing import Any, cast
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from .common import HiveData
+from .common import HiveData, HiveHouseData
 from .const import (
+    CONF_ATTRIBUTE_OUTPUT,
+    CONF_ENTRY_TYPE,
     CONF_MODEL,
     CONF_MQTT_TOPIC,
     CONF_SHOW_HEAT_SCHEDULE_MODE,
     CONF_SHOW_WATER_SCHEDULE_MODE,
+    CONF_STALE_TIMEOUT,
+    CONF_TEMPERATURE_DEADBAND,
+    CONF_TEMPERATURE_HEARTBEAT,
+    ENTRY_TYPE_HOUSE,
 )
+from .group import HiveGroupCoordinator
 
 
 async def async_get_config_entry_diagnostics(
@@ -21,6 +28,19 @@ async def async_get_config_entry_diagnostics(
     entry: ConfigEntry,
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
+    if entry.options.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_HOUSE:
+        house = cast(HiveHouseData, entry.runtime_data).coordinator
+        return {
+            "config": {
+                "entry_type": entry.options.get(CONF_ENTRY_TYPE),
+                "entry_id": entry.entry_id,
+                "title": entry.title,
+            },
+            "aggregates": house.data,
+            "updates_ignored": house.updates_ignored,
+            "zones": house.zones_as_dict(),
+        }
+
     coordinator = cast(HiveData, entry.runtime_data).coordinator
 
     return {
@@ -31,6 +51,11 @@ async def async_get_config_entry_diagnostics(
             "show_water_schedule_mode": entry.options.get(
                 CONF_SHOW_WATER_SCHEDULE_MODE
             ),
+            "attribute_output": entry.options.get(CONF_ATTRIBUTE_OUTPUT),
+            "temperature_deadband": entry.options.get(CONF_TEMPERATURE_DEADBAND),
+            "temperature_heartbeat": entry.options.get(CONF_TEMPERATURE_HEARTBEAT),
+            "stale_timeout": entry.options.get(CONF_STALE_TIMEOUT),
+            "entry_type": entry.options.get(CONF_ENTRY_TYPE),
             "entry_id": entry.entry_id,
             "title": entry.title,
         },
@@ -57,4 +82,23 @@ async def async_get_config_entry_diagnostics(
             "pre_boost_water_mode": coordinator.pre_boost_water_mode,
         },
         "last_mqtt_payload": coordinator.last_mqtt_payload,
+        "reported_state": coordinator.reported_state,
+        "cached": coordinator.cached,
+        "cached_at": coordinator.cached_at,
+        "online": coordinator.online,
+        "stale": coordinator.stale,
+        "last_report": coordinator.last_report,
+        "command_latency": coordinator.latency.as_dict(),
+        "command_queue": coordinator.command_queue.as_dict(),
+        "commands_suppressed": coordinator.commands_suppressed,
+        "payload_validation": coordinator.validator.as_dict(),
+        "errors": coordinator.errors.as_dict(),
+        "trace": coordinator.trace.as_list(),
+        "schedules": {
+            channel: schedule.as_dict()
+            for channel, schedule in coordinator.schedules.items()
+        },
+        "group_members": coordinator.members_as_dict()
+        if isinstance(coordinator, HiveGroupCoordinator)
+        else None,
     }
@@ -0,0 +1,129 @@
+"""Discovery of Hive receivers from Zigbee2MQTT's device list."""
+
+from __future__ import annotations
+
+import json
+import re
+from asyncio import timeout
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.components import mqtt
+from homeassistant.core import HomeAssistant, callback
+
+from .const import LOGGER, MODEL_OTR1, MODEL_SLR1, MODEL_SLR2
+
+DEFAULT_BASE_TOPIC = "zigbee2mqtt"
+BRIDGE_DEVICES_TIMEOUT = 10
+
+# Zigbee2MQTT models by prefix, revisions such as SLR2b report their own model
+MODEL_PREFIXES = (MODEL_SLR2, MODEL_SLR1, MODEL_OTR1)
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+@dataclass(frozen=True, slots=True)
+class DiscoveredReceiver:
+    """A Hive receiver found in Zigbee2MQTT's device list."""
+
+    name: str
+    topic: str
+    model: str
+
+
+def iter_json_array(payload: str) -> Iterator[Any]:
+    """Yield the elements of a JSON array as they are decoded.
+
+    This is a plain parse of a payload already received in full, it does not
+    reduce memory use. Devices are checked as they are decoded instead of
+    after the whole list.
+    """
+    decoder = json.JSONDecoder()
+    end = len(payload)
+    index = _skip_whitespace(payload, 0)
+    if index == end or payload[index] != "[":
+        msg = "Expected a JSON array"
+        raise ValueError(msg)
+
+    index = _skip_whitespace(payload, index + 1)
+    if index < end and payload[index] == "]":
+        return
+
+    while index < end:
+        element, index = decoder.raw_decode(payload, index)
+        yield element
+
+        index = _skip_whitespace(payload, index)
+        if index < end and payload[index] == "]":
+            return
+        if index == end or payload[index] != ",":
+            msg = f"Expected ',' or ']' at {index}"
+            raise ValueError(msg)
+        index = _skip_whitespace(payload, index + 1)
+
+    msg = "Unterminated JSON array"
+    raise ValueError(msg)
+
+
+def _skip_whitespace(payload: str, index: int) -> int:
+    """Return the index of the next character that is not whitespace."""
+    return WHITESPACE.match(payload, index).end()  # type: ignore[union-attr]
+
+
+def receiver_model(device: Any) -> str | None:
+    """Return the model of a Hive receiver, or None for any other device."""
+    if not isinstance(device, dict):
+        return None
+
+    definition = device.get("definition") or {}
+    if definition.get("vendor") != "Hive":
+        return None
+
+    model = definition.get("model") or ""
+    return next((prefix for prefix in MODEL_PREFIXES if model.startswith(prefix)), None)
+
+
+def parse_bridge_devices(payload: str, base_topic: str) -> list[DiscoveredReceiver]:
+    """Return the Hive receivers in a Zigbee2MQTT bridge/devices payload."""
+    receivers = []
+    for device in iter_json_array(payload):
+        if (model := receiver_model(device)) is None:
+            continue
+        name = device.get("friendly_name") or device.get("ieee_address", "")
+        receivers.append(
+            DiscoveredReceiver(name=name, topic=f"{base_topic}/{name}", model=model)
+        )
+    return receivers
+
+
+async def async_discover_receivers(
+    hass: HomeAssistant, base_topic: str
+) -> list[DiscoveredReceiver] | None:
+    """Read the retained device list from Zigbee2MQTT.
+
+    Returns None if the device list was not received in time.
+    """
+    future = hass.loop.create_future()
+
+    @callback
+    def _async_message(message: mqtt.ReceiveMessage) -> None:
+        if not future.done():
+            future.set_result(message.payload)
+
+    unsubscribe = await mqtt.async_subscribe(
+        hass, f"{base_topic}/bridge/devices", _async_message
+    )
+    try:
+        async with timeout(BRIDGE_DEVICES_TIMEOUT):
+            payload = await future
+    except TimeoutError:
+        return None
+    finally:
+        unsubscribe()
+
+    try:
+        return parse_bridge_devices(payload, base_topic)
+    except ValueError as err:
+        LOGGER.warning("Invalid device list from %s: %s", base_topic, err)
+        return None
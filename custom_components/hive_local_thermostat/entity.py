@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
 
+from homeassistant.core import callback
 from homeassistant.helpers.entity import DeviceInfo, EntityDescription
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.update_coordinator import BaseCoordinatorEntity
+from homeassistant.util.dt import utcnow
 
-from .const import DOMAIN
+from .const import ATTR_CACHED, DOMAIN
 from .coordinator import HiveCoordinator
+from .house import HiveHouseCoordinator
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -18,12 +23,18 @@ class HiveEntityDescription(EntityDescription):
     entity_id: str | None = None
 
 
-class HiveEntity(CoordinatorEntity[HiveCoordinator]):
+class HiveEntity(BaseCoordinatorEntity[HiveCoordinator]):
     """HiveEntity class."""
 
     entity_description: HiveEntityDescription
     _attr_has_entity_name = True
 
+    _written_temperature: float | None = None
+    _written_temperature_at: datetime | None = None
+
+    # Entities showing receiver state flag values seeded from the state cache
+    _shows_receiver_state = True
+
     def __init__(
         self,
         description: HiveEntityDescription,
@@ -42,3 +53,84 @@ class HiveEntity(CoordinatorEntity[HiveCoordinator]):
         self.entity_description = description
         if description.entity_id:
             self.entity_id = description.entity_id
+
+    @property
+    def available(self) -> bool:
+        """Return True if the receiver is online and reporting."""
+        return super().available and self.coordinator.available
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Flag cached values until the first live report replaces them."""
+        if self._shows_receiver_state and self.coordinator.cached:
+            return {ATTR_CACHED: True}
+        return None
+
+    async def async_update(self) -> None:
+        """Ask the receiver for its state, used by the update entity action."""
+        await self.coordinator.async_request_state()
+
+    async def async_added_to_hass(self) -> None:
+        """Seed state from the coordinator cache when added."""
+        await super().async_added_to_hass()
+
+        self.async_on_remove(
+            self.coordinator.async_add_availability_listener(self.async_write_ha_state)
+        )
+
+        if self.coordinator.reported_state:
+            self._handle_coordinator_update()
+
+    def temperature_changed(self, temperature: float | None) -> bool:
+        """Return True if the temperature should be written to state.
+
+        Changes smaller than the configured deadband are held back until the
+        heartbeat interval has elapsed since the last written temperature.
+        """
+        now = utcnow()
+        if (
+            self.coordinator.temperature_deadband > 0
+            and temperature is not None
+            and self._written_temperature is not None
+            and self._written_temperature_at is not None
+            and abs(temperature - self._written_temperature)
+            < self.coordinator.temperature_deadband
+            and now - self._written_temperature_at
+            < timedelta(minutes=self.coordinator.temperature_heartbeat)
+        ):
+            return False
+
+        self._written_temperature = temperature
+        self._written_temperature_at = now
+        return True
+
+
+class HiveHouseEntity(BaseCoordinatorEntity[HiveHouseCoordinator]):
+    """Entity showing a house-level aggregate."""
+
+    entity_description: HiveEntityDescription
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        description: HiveEntityDescription,
+        coordinator: HiveHouseCoordinator,
+    ) -> None:
+        """Initialize."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{DOMAIN}_{description.name}_{description.key}".lower()
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, coordinator.entry_id)},
+            name=description.name if isinstance(description.name, str) else None,
+            model="House",
+            manufacturer="Hive",
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state when the house aggregates change."""
+        self.async_write_ha_state()
+
+    async def async_update(self) -> None:
+        """Do nothing, aggregates are pushed by the receivers."""
@@ -0,0 +1,178 @@
+"""Rate-limited error reporting for Hive Local Thermostat."""
+
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import issue_registry as ir
+
+from .const import (
+    DOMAIN,
+    ERROR_LOG_INTERVAL_MINUTES,
+    LOGGER,
+    REPAIR_ISSUE_THRESHOLD,
+)
+from .message_trace import TRACE_ERROR, TraceBuffer
+
+# Repair issues raised for persistent misconfiguration
+ISSUE_MODEL_MISMATCH = "model_mismatch"
+ISSUE_INVALID_PAYLOAD = "invalid_payload"
+ISSUES = (ISSUE_MODEL_MISMATCH, ISSUE_INVALID_PAYLOAD)
+
+
+def issue_id(issue: str, entry_id: str) -> str:
+    """Return the repair issue id for a config entry."""
+    return f"{issue}_{entry_id}"
+
+
+@callback
+def async_delete_issues(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete every repair issue raised for a config entry."""
+    for issue in ISSUES:
+        ir.async_delete_issue(hass, DOMAIN, issue_id(issue, entry_id))
+
+
+@dataclass(slots=True)
+class ReasonState:
+    """Logging state for one reason."""
+
+    logged_at: float
+    suppressed: int = 0
+
+
+class ErrorReporter:
+    """Per-coordinator error reporting.
+
+    The first error for a reason is logged, repeats within the interval are
+    only counted, and the count is logged as a summary once the interval has
+    passed. Suppressed errors cost a dict lookup and an increment, messages
+    are never formatted.
+
+    Every error is added to the message trace, and the trace is dumped
+    whenever an error is logged.
+
+    Payloads that show a misconfiguration are counted per issue. After enough
+    of them in a row a repair issue is raised, and it is deleted as soon as a
+    valid payload arrives.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        name: str,
+        interval_minutes: float = ERROR_LOG_INTERVAL_MINUTES,
+        issue_threshold: int = REPAIR_ISSUE_THRESHOLD,
+        trace: TraceBuffer | None = None,
+    ) -> None:
+        """Initialize the reporter."""
+        self.hass = hass
+        self.entry_id = entry_id
+        self.name = name
+        self.interval = interval_minutes * 60
+        self.issue_threshold = issue_threshold
+        self.trace = trace
+        self.totals: Counter[str] = Counter()
+        self.issues: set[str] = set()
+        self._reasons: dict[str, ReasonState] = {}
+        self._problems: Counter[str] = Counter()
+        # Issues may remain from before a restart until valid data arrives
+        self._resolve_pending = True
+
+    def error(self, reason: str, msg: str, *args: Any) -> None:
+        """Log an error unless the reason was logged within the interval."""
+        self._log(logging.ERROR, reason, msg, *args)
+
+    def warning(self, reason: str, msg: str, *args: Any) -> None:
+        """Log a warning unless the reason was logged within the interval."""
+        self._log(logging.WARNING, reason, msg, *args)
+
+    def _log(self, level: int, reason: str, msg: str, *args: Any) -> None:
+        """Log or count an occurrence of a reason."""
+        self.totals[reason] += 1
+        if self.trace is not None:
+            self.trace.record(TRACE_ERROR, (reason, *args))
+        now = monotonic()
+        state = self._reasons.get(reason)
+        if state is not None and now - state.logged_at < self.interval:
+            state.suppressed += 1
+            return
+
+        if state is not None and state.suppressed:
+            LOGGER.log(
+                level,
+                f"{msg} (repeated %s times since last logged)",
+                *args,
+                state.suppressed,
+            )
+        else:
+            LOGGER.log(level, msg, *args)
+        self._reasons[reason] = ReasonState(now)
+
+        if self.trace is not None:
+            self.trace.dump(reason)
+
+    @callback
+    def flush(self) -> None:
+        """Log summaries for reasons whose interval has passed."""
+        now = monotonic()
+        for reason, state in list(self._reasons.items()):
+            if now - state.logged_at < self.interval:
+                continue
+            if state.suppressed:
+                LOGGER.warning(
+                    "Suppressed %s more %s errors from %s in the last %s minutes",
+                    state.suppressed,
+                    reason,
+                    self.name,
+                    round(self.interval / 60),
+                )
+                self._reasons[reason] = ReasonState(now)
+            else:
+                # Quiet for a whole interval, the next error is logged in full
+                del self._reasons[reason]
+
+    @callback
+    def problem(self, issue: str, **placeholders: str) -> None:
+        """Count a payload showing a misconfiguration."""
+        self._problems[issue] += 1
+        self._resolve_pending = True
+        if issue in self.issues or self._problems[issue] < self.issue_threshold:
+            return
+
+        self.issues.add(issue)
+        ir.async_create_issue(
+            self.hass,
+            DOMAIN,
+            issue_id(issue, self.entry_id),
+            is_fixable=False,
+            severity=ir.IssueSeverity.ERROR,
+            translation_key=issue,
+            translation_placeholders={"topic": self.name, **placeholders},
+        )
+
+    @callback
+    def resolved(self) -> None:
+        """Clear problems and repair issues once valid data arrives."""
+        if not self._resolve_pending:
+            return
+
+        self._resolve_pending = False
+        self._problems.clear()
+        self.issues.clear()
+        async_delete_issues(self.hass, self.entry_id)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return error counts for diagnostics."""
+        return {
+            "totals": dict(self.totals),
+            "suppressed": {
+                reason: state.suppressed for reason, state in self._reasons.items()
+            },
+            "issues": sorted(self.issues),
+        }
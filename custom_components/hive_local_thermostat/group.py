@@ -0,0 +1,146 @@
+"""Zigbee2MQTT group support for Hive Local Thermostat."""
+
+from __future__ import annotations
+
+from asyncio import gather
+from collections.abc import Iterable
+from statistics import fmean
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .coordinator import HiveCoordinator
+
+
+def common_value[T](values: Iterable[T]) -> T | None:
+    """Return the value shared by all members, or None if they differ."""
+    distinct = set(values)
+    return distinct.pop() if len(distinct) == 1 else None
+
+
+def mean_value(values: Iterable[float | None]) -> float | None:
+    """Return the mean of the known values, rounded to one decimal."""
+    known = [value for value in values if value is not None]
+    return round(fmean(known), 1) if known else None
+
+
+class HiveGroupCoordinator(HiveCoordinator):
+    """Coordinator for a Zigbee2MQTT group of Hive receivers.
+
+    Commands are built exactly as for a single receiver and published once to
+    the group topic, Zigbee2MQTT sends them as a single groupcast. Zigbee2MQTT
+    does not publish receiver attributes on group topics, so state is
+    aggregated from the member coordinators instead.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        model: str,
+        topic: str,
+        show_heat_schedule_mode: bool,  # noqa: FBT001
+        show_water_schedule_mode: bool,  # noqa: FBT001
+        members: list[HiveCoordinator],
+    ) -> None:
+        """Initialize the group coordinator."""
+        super().__init__(
+            hass,
+            entry_id,
+            model,
+            topic,
+            show_heat_schedule_mode,
+            show_water_schedule_mode,
+        )
+        self.members = members
+
+    @property
+    def available(self) -> bool:
+        """Return True if any member receiver is available."""
+        return any(member.available for member in self.members)
+
+    async def async_subscribe(self) -> None:
+        """Listen to the member coordinators instead of MQTT state topics."""
+        for member in self.members:
+            self._unsubscribes.append(
+                member.async_add_listener(self.handle_member_update)
+            )
+            self._unsubscribes.append(
+                member.async_add_availability_listener(self.async_availability_changed)
+            )
+        self.handle_member_update()
+
+    async def async_request_state(self) -> None:
+        """Ask every member receiver to publish its current state."""
+        for member in self.members:
+            await member.async_request_state()
+
+    @callback
+    def handle_member_update(self) -> None:
+        """Aggregate the state of the member receivers."""
+        members = [member for member in self.members if member.reported_state]
+        if not members:
+            return
+
+        self.hvac_mode = common_value(member.hvac_mode for member in members)
+        self.preset_mode = common_value(member.preset_mode for member in members)
+        self.current_temperature = mean_value(
+            member.current_temperature for member in members
+        )
+        self.target_temperature = mean_value(
+            member.target_temperature for member in members
+        )
+
+        running_states = {member.running_state_heat for member in members}
+        self.running_state_heat = (
+            "heat" if "heat" in running_states else common_value(running_states) or ""
+        )
+
+        self.heat_boost = any(member.heat_boost for member in members)
+        self.heat_boost_remaining = max(
+            member.heat_boost_remaining for member in members
+        )
+
+        self.water_mode = common_value(member.water_mode for member in members)
+        water_states = {member.running_state_water for member in members}
+        self.running_state_water = (
+            "heat" if "heat" in water_states else common_value(water_states) or ""
+        )
+        self.water_boost = any(member.water_boost for member in members)
+        self.water_boost_remaining = max(
+            member.water_boost_remaining for member in members
+        )
+
+        self.async_update_listeners()
+
+    async def async_heating_boost_cancel(self, *, force: bool = False) -> None:
+        """Restore each member to the heating mode it had before the boost.
+
+        The group's mode is unknown when members differ and its setpoint is
+        their mean, so members are restored from their own pre-boost state.
+        """
+        await gather(
+            *(member.async_heating_boost_cancel(force=force) for member in self.members)
+        )
+
+    async def async_water_boost_cancel(self, *, force: bool = False) -> None:
+        """Restore each member to the hot water mode it had before the boost."""
+        await gather(
+            *(member.async_water_boost_cancel(force=force) for member in self.members)
+        )
+
+    def track_command(self, command: dict[str, Any]) -> None:
+        """Track the group command round trip on each member receiver."""
+        for member in self.members:
+            member.track_command(command)
+
+    def members_as_dict(self) -> list[dict[str, Any]]:
+        """Return the group membership for diagnostics."""
+        return [
+            {
+                "entry_id": member.entry_id,
+                "topic": member.topic,
+                "available": member.available,
+            }
+            for member in self.members
+        ]
@@ -0,0 +1,219 @@
+"""House-level aggregate of all Hive receivers."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from functools import partial
+from typing import Any
+
+from homeassistant.components.climate import HVACMode
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import SIGNAL_RECEIVER_ADDED, SIGNAL_RECEIVER_REMOVED
+from .coordinator import HiveCoordinator
+from .push import HivePushCoordinator
+from .watchdog import async_get_watchdog
+
+
+@dataclass(frozen=True, slots=True)
+class ZoneState:
+    """The receiver fields that feed the house aggregates."""
+
+    heating: bool
+    boost: bool
+    below_target: bool
+    temperature: float | None
+
+    @classmethod
+    def from_coordinator(cls, coordinator: HiveCoordinator) -> ZoneState | None:
+        """Return the zone state, or None if the receiver has nothing to add."""
+        if not coordinator.available or not coordinator.reported_state:
+            return None
+
+        temperature = coordinator.current_temperature
+        target = coordinator.target_temperature
+        return cls(
+            heating=coordinator.running_state_heat == "heat",
+            boost=bool(coordinator.heat_boost or coordinator.water_boost),
+            below_target=coordinator.hvac_mode != HVACMode.OFF
+            and temperature is not None
+            and target is not None
+            and temperature < target,
+            temperature=temperature,
+        )
+
+
+class HiveHouseCoordinator(HivePushCoordinator):
+    """Coordinator aggregating every receiver into house-level values.
+
+    Each receiver is reduced to a ZoneState when it updates. Updates that do
+    not change a zone's state are ignored, otherwise the zone's old
+    contribution is swapped for the new one, so counts and the mean are
+    maintained without walking every zone. Minimum and maximum are only
+    recomputed when the zone holding them moves away. Entities are only
+    notified when an aggregate changes, and read the aggregates from data.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the house coordinator."""
+        super().__init__(hass)
+        self.entry_id = entry_id
+        self.zones: dict[HiveCoordinator, ZoneState | None] = {}
+        self.zones_reporting = 0
+        self.zones_heating = 0
+        self.zones_boosting = 0
+        self.zones_below_target = 0
+        self.min_temperature: float | None = None
+        self.max_temperature: float | None = None
+        self.updates_ignored = 0
+        self._temperature_sum = 0.0
+        self._temperature_count = 0
+        self._zone_unsubscribes: dict[HiveCoordinator, list[CALLBACK_TYPE]] = {}
+        self._unsubscribes: list[CALLBACK_TYPE] = []
+        self.data: dict[str, Any] = self.aggregates()
+
+    async def async_subscribe(self) -> None:
+        """Follow all running receivers, and those set up later."""
+        self._unsubscribes = [
+            async_dispatcher_connect(
+                self.hass, SIGNAL_RECEIVER_ADDED, self.async_add_zone
+            ),
+            async_dispatcher_connect(
+                self.hass, SIGNAL_RECEIVER_REMOVED, self.async_remove_zone
+            ),
+        ]
+        for coordinator in async_get_watchdog(self.hass).coordinators:
+            self.async_add_zone(coordinator)
+
+    @callback
+    def async_unsubscribe(self) -> None:
+        """Stop following receivers."""
+        for unsubscribe in self._unsubscribes:
+            unsubscribe()
+        self._unsubscribes = []
+        for coordinator in list(self._zone_unsubscribes):
+            self.async_remove_zone(coordinator)
+
+    @callback
+    def async_add_zone(self, coordinator: HiveCoordinator) -> None:
+        """Start following a receiver."""
+        if coordinator in self._zone_unsubscribes:
+            return
+
+        handle_update = partial(self.handle_zone_update, coordinator)
+        self._zone_unsubscribes[coordinator] = [
+            coordinator.async_add_listener(handle_update),
+            coordinator.async_add_availability_listener(handle_update),
+        ]
+        self.zones[coordinator] = None
+        self.handle_zone_update(coordinator)
+
+    @callback
+    def async_remove_zone(self, coordinator: HiveCoordinator) -> None:
+        """Stop following a receiver and drop its contribution."""
+        if (unsubscribes := self._zone_unsubscribes.pop(coordinator, None)) is None:
+            return
+
+        for unsubscribe in unsubscribes:
+            unsubscribe()
+        self._replace_zone(coordinator, None)
+        del self.zones[coordinator]
+        self._publish()
+
+    @callback
+    def handle_zone_update(self, coordinator: HiveCoordinator) -> None:
+        """Fold a receiver update into the aggregates if it matters."""
+        zone = ZoneState.from_coordinator(coordinator)
+        if zone == self.zones.get(coordinator):
+            self.updates_ignored += 1
+            return
+
+        self._replace_zone(coordinator, zone)
+        self._publish()
+
+    def _replace_zone(
+        self, coordinator: HiveCoordinator, zone: ZoneState | None
+    ) -> None:
+        """Swap a zone's contribution to the aggregates."""
+        old = self.zones.get(coordinator)
+        self.zones[coordinator] = zone
+        if old is not None:
+            self._count(old, -1)
+        if zone is not None:
+            self._count(zone, 1)
+
+        old_temperature = old.temperature if old else None
+        new_temperature = zone.temperature if zone else None
+        if old_temperature == new_temperature:
+            return
+
+        if old_temperature is not None and old_temperature in (
+            self.min_temperature,
+            self.max_temperature,
+        ):
+            # The zone held an extreme, only now do all zones need checking
+            temperatures = [
+                state.temperature
+                for state in self.zones.values()
+                if state is not None and state.temperature is not None
+            ]
+            self.min_temperature = min(temperatures, default=None)
+            self.max_temperature = max(temperatures, default=None)
+        elif new_temperature is not None:
+            if self.min_temperature is None or new_temperature < self.min_temperature:
+                self.min_temperature = new_temperature
+            if self.max_temperature is None or new_temperature > self.max_temperature:
+                self.max_temperature = new_temperature
+
+    def _count(self, zone: ZoneState, sign: int) -> None:
+        """Add (sign 1) or remove (sign -1) a zone from the counts and sums."""
+        self.zones_reporting += sign
+        self.zones_heating += sign * zone.heating
+        self.zones_boosting += sign * zone.boost
+        self.zones_below_target += sign * zone.below_target
+        if zone.temperature is not None:
+            self._temperature_count += sign
+            self._temperature_sum += sign * zone.temperature
+            if not self._temperature_count:
+                # Reset rather than carry float rounding into the next zone
+                self._temperature_sum = 0.0
+
+    @property
+    def mean_temperature(self) -> float | None:
+        """Return the mean temperature of the reporting zones."""
+        if not self._temperature_count:
+            return None
+        return round(self._temperature_sum / self._temperature_count, 1)
+
+    def aggregates(self) -> dict[str, Any]:
+        """Return the house-level values."""
+        return {
+            "zones": self.zones_reporting,
+            "zones_heating": self.zones_heating,
+            "zones_boosting": self.zones_boosting,
+            "zones_below_target": self.zones_below_target,
+            "min_temperature": self.min_temperature,
+            "max_temperature": self.max_temperature,
+            "mean_temperature": self.mean_temperature,
+            "heating": self.zones_heating > 0,
+            "boost": self.zones_boosting > 0,
+        }
+
+    def _publish(self) -> None:
+        """Update entities if any aggregate has changed."""
+        aggregates = self.aggregates()
+        if aggregates != self.data:
+            self.data = aggregates
+            self.async_update_listeners()
+
+    def zones_as_dict(self) -> list[dict[str, Any]]:
+        """Return the followed receivers for diagnostics."""
+        return [
+            {
+                "entry_id": coordinator.entry_id,
+                "topic": coordinator.topic,
+                "zone": asdict(zone) if zone else None,
+            }
+            for coordinator, zone in self.zones.items()
+        ]
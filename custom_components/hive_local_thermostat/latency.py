@@ -0,0 +1,208 @@
+"""Command round trip latency tracking for Hive Local Thermostat."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Any
+
+COMMAND_BOOST = "boost"
+COMMAND_MODE = "mode"
+COMMAND_SETPOINT = "setpoint"
+
+COMMAND_TYPES = (COMMAND_BOOST, COMMAND_MODE, COMMAND_SETPOINT)
+
+# Upper bounds in seconds, the last bucket catches everything slower
+LATENCY_BUCKETS = (0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0)
+
+COMMAND_TIMEOUT = 120.0
+
+
+def normalize_value(value: Any) -> Any:
+    """Normalize a command or reported value for comparison.
+
+    Commands send holds as "1" or 1 and numbers as strings, reports use
+    booleans and numbers.
+    """
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, int | float):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return value
+    return value
+
+
+def reflects(state: Mapping[str, Any], expected: Mapping[str, Any]) -> bool:
+    """Return True if a reported state has every expected value."""
+    return all(
+        key in state and normalize_value(state[key]) == normalize_value(value)
+        for key, value in expected.items()
+    )
+
+
+@dataclass(slots=True)
+class PendingCommand:
+    """A command waiting for the receiver to confirm it."""
+
+    command_type: str
+    expected: dict[str, Any]
+    sent: float
+
+
+@dataclass(slots=True)
+class LatencyStats:
+    """Round trip statistics for one command type."""
+
+    confirmed: int = 0
+    lost: int = 0
+    superseded: int = 0
+    last: float | None = None
+    minimum: float | None = None
+    maximum: float | None = None
+    total: float = 0.0
+    histogram: list[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1)
+    )
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean round trip time."""
+        return self.total / self.confirmed if self.confirmed else None
+
+    def record(self, latency: float) -> None:
+        """Record a confirmed round trip."""
+        self.confirmed += 1
+        self.last = latency
+        self.total += latency
+        self.minimum = latency if self.minimum is None else min(self.minimum, latency)
+        self.maximum = latency if self.maximum is None else max(self.maximum, latency)
+
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if latency <= bound:
+                self.histogram[index] += 1
+                return
+        self.histogram[-1] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics for diagnostics."""
+        return {
+            "confirmed": self.confirmed,
+            "lost": self.lost,
+            "superseded": self.superseded,
+            "last": self.last,
+            "min": self.minimum,
+            "max": self.maximum,
+            "mean": self.mean,
+            "histogram": {
+                **{
+                    f"<={bound}s": count
+                    for bound, count in zip(
+                        LATENCY_BUCKETS, self.histogram, strict=False
+                    )
+                },
+                f">{LATENCY_BUCKETS[-1]}s": self.histogram[-1],
+            },
+        }
+
+
+class CommandLatencyTracker:
+    """Correlate outbound commands with the first report that reflects them."""
+
+    def __init__(self, timeout: float = COMMAND_TIMEOUT) -> None:
+        """Initialize the tracker."""
+        self.timeout = timeout
+        self.pending: list[PendingCommand] = []
+        self.last: float | None = None
+        self.stats: dict[str, LatencyStats] = {
+            command_type: LatencyStats() for command_type in COMMAND_TYPES
+        }
+
+    @property
+    def lost(self) -> int:
+        """Return the number of commands never confirmed."""
+        self.expire()
+        return sum(stats.lost for stats in self.stats.values())
+
+    def command_sent(
+        self,
+        command_type: str,
+        expected: dict[str, Any],
+        state: Mapping[str, Any],
+    ) -> None:
+        """Start tracking a command.
+
+        Pending commands expecting a different value for any of the same keys
+        can no longer be confirmed and are counted as superseded. A command
+        repeating values that are already pending keeps the earlier send time.
+        A command the reported state already reflects is not tracked, as no
+        report would show it taking effect.
+        """
+        now = monotonic()
+        self.expire(now)
+
+        repeated = False
+        still_pending = []
+        for pending in self.pending:
+            overlap = pending.expected.keys() & expected.keys()
+            if any(
+                normalize_value(pending.expected[key]) != normalize_value(expected[key])
+                for key in overlap
+            ):
+                self.stats[pending.command_type].superseded += 1
+                continue
+            if reflects(pending.expected, expected):
+                repeated = True
+            still_pending.append(pending)
+
+        if not repeated and not reflects(state, expected):
+            still_pending.append(PendingCommand(command_type, expected, now))
+        self.pending = still_pending
+
+    def report_received(self, state: Mapping[str, Any]) -> None:
+        """Confirm pending commands that the reported state now reflects."""
+        if not self.pending:
+            return
+
+        now = monotonic()
+        still_pending = []
+        for pending in self.pending:
+            if reflects(state, pending.expected):
+                self.last = now - pending.sent
+                self.stats[pending.command_type].record(self.last)
+            elif now - pending.sent > self.timeout:
+                self.stats[pending.command_type].lost += 1
+            else:
+                still_pending.append(pending)
+        self.pending = still_pending
+
+    def expire(self, now: float | None = None) -> None:
+        """Count pending commands older than the timeout as lost."""
+        if not self.pending:
+            return
+
+        now = monotonic() if now is None else now
+        still_pending = []
+        for pending in self.pending:
+            if now - pending.sent > self.timeout:
+                self.stats[pending.command_type].lost += 1
+            else:
+                still_pending.append(pending)
+        self.pending = still_pending
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return latency statistics for diagnostics."""
+        self.expire()
+        return {
+            "pending": len(self.pending),
+            "last": self.last,
+            "timeout": self.timeout,
+            "commands": {
+                command_type: stats.as_dict()
+                for command_type, stats in self.stats.items()
+            },
+        }
@@ -0,0 +1,90 @@
+"""In-memory message trace for Hive Local Thermostat."""
+
+from __future__ import annotations
+
+from collections import deque
+from datetime import UTC, datetime
+from time import time
+from typing import Any
+
+from homeassistant.core import callback
+
+from .const import DEFAULT_TRACE_SAMPLE_RATE, LOGGER, TRACE_BUFFER_SIZE
+
+# Record kinds
+TRACE_RECEIVED = "rx"
+TRACE_SENT = "tx"
+TRACE_REQUEST = "get"
+TRACE_SUPPRESSED = "suppressed"
+TRACE_QUEUED = "queued"
+TRACE_CORRECTION = "correction"
+TRACE_ERROR = "error"
+
+type TraceRecord = tuple[float, str, Any]
+
+
+class TraceBuffer:
+    """Bounded buffer of compact message records for one config entry.
+
+    Records are (timestamp, kind, data) tuples holding references to the
+    payloads as received or sent, nothing is formatted until the buffer is
+    dumped. Received messages are sampled, 1 in sample_rate is kept and 0
+    keeps none; sent commands, corrections and errors are always kept. The
+    buffer is written to the log when an error or correction occurs or on
+    request, and is included in diagnostics.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        sample_rate: int = DEFAULT_TRACE_SAMPLE_RATE,
+        maxlen: int = TRACE_BUFFER_SIZE,
+    ) -> None:
+        """Initialize the buffer."""
+        self.name = name
+        self.sample_rate = sample_rate
+        self.records: deque[TraceRecord] = deque(maxlen=maxlen)
+        self._received = 0
+
+    def received(self, data: Any) -> None:
+        """Record a received message, if it is sampled."""
+        if not self.sample_rate:
+            return
+        self._received += 1
+        if self._received >= self.sample_rate:
+            self._received = 0
+            self.records.append((time(), TRACE_RECEIVED, data))
+
+    def record(self, kind: str, data: Any) -> None:
+        """Record an event."""
+        self.records.append((time(), kind, data))
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Return the records, oldest first."""
+        return [
+            {
+                "time": datetime.fromtimestamp(timestamp, UTC).isoformat(
+                    timespec="milliseconds"
+                ),
+                "kind": kind,
+                "data": data,
+            }
+            for timestamp, kind, data in self.records
+        ]
+
+    @callback
+    def dump(self, reason: str) -> list[dict[str, Any]]:
+        """Write the records to the log and clear the buffer."""
+        records = self.as_list()
+        self.records.clear()
+        if records:
+            LOGGER.warning(
+                "Trace for %s (%s):\n%s",
+                self.name,
+                reason,
+                "\n".join(
+                    f"  {record['time']} {record['kind']} {record['data']}"
+                    for record in records
+                ),
+            )
+        return records
@@ -120,6 +120,7 @@ class HiveNumber(HiveEntity, RestoreNumber):
     """hive_local_thermostat Number class."""
 
     entity_description: HiveNumberEntityDescription
+    _shows_receiver_state = False
     _state: float | None
     _last_updated: datetime | None
 
@@ -144,7 +145,9 @@ class HiveNumber(HiveEntity, RestoreNumber):
         """Handle entity which will be added."""
         await super().async_added_to_hass()
 
-        if (last_state := await self.async_get_last_state()) and (
+        if self.entity_description.key in self.coordinator.restored_settings:
+            self._state = getattr(self.coordinator, self.entity_description.key)
+        elif (last_state := await self.async_get_last_state()) and (
             last_number_data := await self.async_get_last_number_data()
         ):
             if last_state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN):
@@ -159,6 +162,11 @@ class HiveNumber(HiveEntity, RestoreNumber):
 
         LOGGER.debug(f"Restored {self.entity_description.key} state: {self._state}")
 
+    @property
+    def available(self) -> bool:
+        """Settings are held locally and stay available while offline."""
+        return True
+
     @property
     def native_value(self) -> float | None:
         """Return value of number."""
@@ -170,12 +178,11 @@ class HiveNumber(HiveEntity, RestoreNumber):
         self._last_updated = utcnow()
 
         # Store value in coordinator
-        setattr(self.coordinator, self.entity_description.key, value)
+        self.coordinator.set_setting(self.entity_description.key, value)
 
         self.async_write_ha_state()
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         # Number entities don't need to process MQTT data updates
-        # They only update through user input
-        self.async_write_ha_state()
+        # They only update through user input, so there is no state to write
@@ -0,0 +1,49 @@
+"""Push coordinator base for Hive Local Thermostat."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant import config_entries
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+
+class HivePushCoordinator:
+    """Minimal coordinator for state pushed over MQTT.
+
+    Provides the listener API used by coordinator entities without the
+    polling machinery of DataUpdateCoordinator: there is no refresh to
+    schedule or debounce and no data dict is kept, receiver state lives on
+    the coordinator. Listeners are held in a tuple that is replaced when a
+    listener is added or removed, so an update is a plain loop with no copy.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the coordinator."""
+        self.hass = hass
+        self.config_entry = config_entries.current_entry.get()
+        self._listeners: tuple[CALLBACK_TYPE, ...] = ()
+
+    @callback
+    def async_add_listener(
+        self,
+        update_callback: CALLBACK_TYPE,
+        context: Any = None,  # noqa: ARG002
+    ) -> Callable[[], None]:
+        """Listen for updates, returns a callback to stop."""
+        self._listeners = (*self._listeners, update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            listeners = list(self._listeners)
+            listeners.remove(update_callback)
+            self._listeners = tuple(listeners)
+
+        return remove_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify all listeners of an update."""
+        for update_callback in self._listeners:
+            update_callback()
@@ -0,0 +1,158 @@
+"""Weekly schedules for Hive Local Thermostat."""
+
+from __future__ import annotations
+
+from datetime import time
+from typing import Any
+
+DAYS = (
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+)
+
+SCHEDULE_HEAT = "heat"
+SCHEDULE_WATER = "water"
+
+# Transitions per command allowed by the Zigbee thermostat cluster
+MAX_TRANSITIONS = 10
+
+SCHEDULE_REQUEST_TIMEOUT = 30
+
+# Minutes after midnight and setpoint of one transition
+type Transition = tuple[int, float]
+type DaySchedule = tuple[Transition, ...]
+
+
+def format_time(minutes: int) -> str:
+    """Return minutes after midnight as HH:MM."""
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def minutes_after_midnight(value: time) -> int:
+    """Return a time of day as minutes after midnight."""
+    return value.hour * 60 + value.minute
+
+
+def day_schedule(transitions: list[dict[str, Any]]) -> DaySchedule:
+    """Return the transitions of a day, as validated from a service call."""
+    return tuple(
+        sorted(
+            (minutes_after_midnight(transition["time"]), transition["temperature"])
+            for transition in transitions
+        )
+    )
+
+
+class WeeklySchedule:
+    """Last known weekly schedule of one channel, by day.
+
+    Zigbee2MQTT reports the schedule one group of days at a time, each report
+    replacing the previous one, so days are merged in as they are reported.
+    Writes compare the requested days with the known ones and send only
+    those that changed, one command per group of days sharing transitions.
+    """
+
+    def __init__(self, key: str) -> None:
+        """Initialize the schedule for a payload key."""
+        self.key = key
+        self.days: dict[str, DaySchedule] = {}
+        # Days reported since the schedule was last requested
+        self.reported: set[str] = set()
+
+    @property
+    def complete(self) -> bool:
+        """Return True if every day is known."""
+        return len(self.days) == len(DAYS)
+
+    @property
+    def reported_all(self) -> bool:
+        """Return True if every day was reported since the last request."""
+        return len(self.reported) == len(DAYS)
+
+    def update_from_report(self, value: Any) -> set[str]:
+        """Merge a reported group of days, returning the days that changed."""
+        if not isinstance(value, dict):
+            return set()
+
+        try:
+            schedule = tuple(
+                sorted(
+                    (int(transition["time"]), float(transition["heating_setpoint"]))
+                    for transition in value.get("transitions", [])
+                )
+            )
+        except (KeyError, TypeError, ValueError):
+            return set()
+
+        changed = set()
+        for day in value.get("days", []):
+            if day not in DAYS:
+                continue
+            self.reported.add(day)
+            if self.days.get(day) != schedule:
+                self.days[day] = schedule
+                changed.add(day)
+        return changed
+
+    def changed_days(
+        self, requested: dict[str, DaySchedule], *, force: bool = False
+    ) -> dict[str, DaySchedule]:
+        """Return the requested days that differ from the known schedule."""
+        return {
+            day: schedule
+            for day, schedule in requested.items()
+            if force or self.days.get(day) != schedule
+        }
+
+    def commands(self, days: dict[str, DaySchedule]) -> list[dict[str, Any]]:
+        """Return the /set commands writing the given days."""
+        groups: dict[DaySchedule, list[str]] = {}
+        for day in DAYS:
+            if day in days:
+                groups.setdefault(days[day], []).append(day)
+
+        return [
+            {
+                self.key: {
+                    "dayofweek": group,
+                    "transitions": [
+                        {"transitionTime": minutes, "heatSetpoint": setpoint}
+                        for minutes, setpoint in schedule
+                    ],
+                }
+            }
+            for schedule, group in groups.items()
+        ]
+
+    def as_dict(self) -> dict[str, list[dict[str, Any]]]:
+        """Return the known days, as accepted by the set schedule action."""
+        return {
+            day: [
+                {"time": format_time(minutes), "temperature": setpoint}
+                for minutes, setpoint in self.days[day]
+            ]
+            for day in DAYS
+            if day in self.days
+        }
+
+    def to_storage(self) -> dict[str, list[list[float]]]:
+        """Return the known days for the state cache."""
+        return {
+            day: [[minutes, setpoint] for minutes, setpoint in schedule]
+            for day, schedule in self.days.items()
+        }
+
+    def load(self, data: dict[str, list[list[float]]]) -> None:
+        """Load the known days from the state cache."""
+        self.days = {
+            day: tuple(
+                (int(minutes), float(setpoint)) for minutes, setpoint in schedule
+            )
+            for day, schedule in data.items()
+            if day in DAYS
+        }
@@ -29,6 +29,13 @@ class HiveSelectEntityDescription(
     show_schedule_mode: bool = True
 
 
+def water_modes(show_schedule_mode: bool) -> list[str]:  # noqa: FBT001
+    """Return the water modes offered, depending on schedule mode visibility."""
+    if show_schedule_mode:
+        return ["auto", "heat", "off", "boost"]
+    return ["heat", "off", "boost"]
+
+
 async def async_setup_entry(
     hass: HomeAssistant,  # noqa: ARG001
     config_entry: HiveConfigEntry,
@@ -41,17 +48,12 @@ async def async_setup_entry(
     if coordinator.model in [MODEL_SLR1, MODEL_OTR1]:
         return
 
-    if coordinator.show_water_schedule_mode:
-        water_modes = ["auto", "heat", "off", "boost"]
-    else:
-        water_modes = ["heat", "off", "boost"]
-
     entity_descriptions = (
         HiveSelectEntityDescription(
             key="system_mode_water",
             translation_key="system_mode_water",
             name=config_entry.title,
-            options=water_modes,
+            options=water_modes(coordinator.show_water_schedule_mode),
         ),
     )
 
@@ -91,8 +93,12 @@ class HiveSelect(HiveEntity, SelectEntity, RestoreEntity):
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        self._attr_options = water_modes(self.coordinator.show_water_schedule_mode)
         new_value = self.coordinator.water_mode
 
+        if new_value is None:
+            return
+
         if new_value not in self.options:
             msg = f"Invalid option for {self.entity_id}: {new_value}"
             raise ValueError(msg)
@@ -114,6 +120,10 @@ class HiveSelect(HiveEntity, SelectEntity, RestoreEntity):
         """Restore last state when added."""
         await super().async_added_to_hass()
 
+        # The cached coordinator state is newer than the recorder state
+        if self._attr_current_option is not None:
+            return
+
         last_state = await self.async_get_last_state()
         if last_state:
             self._attr_current_option = last_state.state
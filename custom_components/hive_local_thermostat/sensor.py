@@ -3,28 +3,34 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import cast
+from typing import Any, cast
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
+    SensorStateClass,
 )
 from homeassistant.const import (
     PRECISION_TENTHS,
     UnitOfTemperature,
+    UnitOfTime,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.temperature import display_temp as show_temp
 
-from .common import HiveConfigEntry
+from .common import HiveConfigEntry, HiveHouseConfigEntry
 from .const import (
+    BOOST_REMAINING_SAMPLE_MINUTES,
+    CONF_ENTRY_TYPE,
     DOMAIN,
+    ENTRY_TYPE_HOUSE,
     MODEL_SLR2,
 )
 from .coordinator import HiveCoordinator
-from .entity import HiveEntity, HiveEntityDescription
+from .entity import HiveEntity, HiveEntityDescription, HiveHouseEntity
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -35,6 +41,7 @@ class HiveSensorEntityDescription(
     """Class describing Hive sensor entities."""
 
     icons_by_state: dict[str, str] | None = None
+    sample_step: float | None = None
 
 
 async def async_setup_entry(
@@ -44,6 +51,12 @@ async def async_setup_entry(
 ) -> None:
     """Set up the sensor platform."""
 
+    if config_entry.options.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_HOUSE:
+        async_setup_house_entry(
+            cast(HiveHouseConfigEntry, config_entry), async_add_entities
+        )
+        return
+
     coordinator = config_entry.runtime_data.coordinator
 
     if coordinator.model == MODEL_SLR2:
@@ -70,11 +83,13 @@ async def async_setup_entry(
                 key="boost_remaining_heat",
                 translation_key="boost_remaining_heat",
                 name=config_entry.title,
+                sample_step=BOOST_REMAINING_SAMPLE_MINUTES,
             ),
             HiveSensorEntityDescription(
                 key="boost_remaining_water",
                 translation_key="boost_remaining_water",
                 name=config_entry.title,
+                sample_step=BOOST_REMAINING_SAMPLE_MINUTES,
             ),
         ]
     else:
@@ -96,10 +111,43 @@ async def async_setup_entry(
                 key="boost_remaining_heat",
                 translation_key="boost_remaining_heat",
                 name=config_entry.title,
+                sample_step=BOOST_REMAINING_SAMPLE_MINUTES,
                 suggested_display_precision=1,
             ),
         ]
 
+    entity_descriptions.extend(
+        [
+            HiveSensorEntityDescription(
+                key="command_latency",
+                translation_key="command_latency",
+                name=config_entry.title,
+                device_class=SensorDeviceClass.DURATION,
+                state_class=SensorStateClass.MEASUREMENT,
+                native_unit_of_measurement=UnitOfTime.SECONDS,
+                suggested_display_precision=1,
+                entity_category=EntityCategory.DIAGNOSTIC,
+                entity_registry_enabled_default=False,
+            ),
+            HiveSensorEntityDescription(
+                key="commands_lost",
+                translation_key="commands_lost",
+                name=config_entry.title,
+                state_class=SensorStateClass.TOTAL_INCREASING,
+                entity_category=EntityCategory.DIAGNOSTIC,
+                entity_registry_enabled_default=False,
+            ),
+            HiveSensorEntityDescription(
+                key="commands_suppressed",
+                translation_key="commands_suppressed",
+                name=config_entry.title,
+                state_class=SensorStateClass.TOTAL_INCREASING,
+                entity_category=EntityCategory.DIAGNOSTIC,
+                entity_registry_enabled_default=False,
+            ),
+        ]
+    )
+
     _entities = [
         HiveSensor(
             entity_description=entity_description,
@@ -111,6 +159,42 @@ async def async_setup_entry(
     async_add_entities(sensorEntity for sensorEntity in _entities)
 
 
+def async_setup_house_entry(
+    config_entry: HiveHouseConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the house-level aggregate sensors."""
+
+    coordinator = config_entry.runtime_data.coordinator
+
+    temperature_descriptions = [
+        HiveSensorEntityDescription(
+            key=key,
+            translation_key=key,
+            name=config_entry.title,
+            device_class=SensorDeviceClass.TEMPERATURE,
+            state_class=SensorStateClass.MEASUREMENT,
+            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+            suggested_display_precision=1,
+        )
+        for key in ("min_temperature", "max_temperature", "mean_temperature")
+    ]
+    zone_descriptions = [
+        HiveSensorEntityDescription(
+            key=key,
+            translation_key=key,
+            name=config_entry.title,
+            state_class=SensorStateClass.MEASUREMENT,
+        )
+        for key in ("zones", "zones_heating", "zones_below_target")
+    ]
+
+    async_add_entities(
+        HiveHouseSensor(entity_description, coordinator)
+        for entity_description in [*temperature_descriptions, *zone_descriptions]
+    )
+
+
 class HiveSensor(HiveEntity, SensorEntity):
     """hive_local_thermostat Sensor class."""
 
@@ -143,6 +227,9 @@ class HiveSensor(HiveEntity, SensorEntity):
                 new_value = ""
 
         if self.entity_description.device_class == SensorDeviceClass.TEMPERATURE:
+            if not self.temperature_changed(cast(float | None, new_value)):
+                return
+
             new_value = show_temp(
                 self.hass,
                 cast(float, new_value),
@@ -151,5 +238,35 @@ class HiveSensor(HiveEntity, SensorEntity):
                 PRECISION_TENTHS,
             )
 
+        if self.sampled_out(new_value):
+            return
+
         self._attr_native_value = new_value
         self.async_write_ha_state()
+
+    def sampled_out(self, new_value: Any) -> bool:
+        """Return True if the change is too small to be written to state.
+
+        Changes to or from zero are always written so start and end are recorded.
+        """
+        step = self.entity_description.sample_step
+        old_value = self._attr_native_value
+        return (
+            step is not None
+            and isinstance(new_value, int | float)
+            and isinstance(old_value, int | float)
+            and new_value != 0
+            and old_value != 0
+            and abs(new_value - old_value) < step
+        )
+
+
+class HiveHouseSensor(HiveHouseEntity, SensorEntity):
+    """hive_local_thermostat house aggregate Sensor class."""
+
+    entity_description: HiveSensorEntityDescription
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the aggregate value."""
+        return cast(float | None, self.coordinator.data[self.entity_description.key])
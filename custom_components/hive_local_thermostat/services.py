@@ -1,15 +1,18 @@
 """Define services for the Hive Local Thermostat integration."""
 
 import logging
-from typing import cast
+from asyncio import gather
+from typing import Any, cast
 
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.const import ATTR_AREA_ID, ATTR_DEVICE_ID, ATTR_ENTITY_ID
 from homeassistant.core import (
     HomeAssistant,
     ServiceCall,
     ServiceResponse,
+    SupportsResponse,
     callback,
 )
 from homeassistant.exceptions import ServiceValidationError
@@ -17,37 +20,152 @@ from homeassistant.helpers import config_validation as cv
 
 from .common import HiveData
 from .const import (
+    CONF_ENTRY_TYPE,
     DOMAIN,
+    ENTRY_TYPE_HOUSE,
     MODEL_SLR2,
 )
+from .coordinator import HiveCoordinator
+from .coordinator_index import async_get_index
+from .group import HiveGroupCoordinator
+from .schedule import (
+    DAYS,
+    MAX_TRANSITIONS,
+    SCHEDULE_HEAT,
+    SCHEDULE_WATER,
+    day_schedule,
+)
+from .snapshot import async_get_states, async_restore, async_snapshot, snapshot_store
 
 SERVICE_HEATING_BOOST = "boost_heating"
 SERVICE_WATER_BOOST = "boost_water"
 SERVICE_HEATING_BOOST_CANCEL = "cancel_boost_heating"
 SERVICE_WATER_BOOST_CANCEL = "cancel_boost_water"
+SERVICE_SNAPSHOT = "snapshot"
+SERVICE_RESTORE = "restore"
+SERVICE_DUMP_TRACE = "dump_trace"
+SERVICE_GET_STATES = "get_states"
+SERVICE_GET_SCHEDULE = "get_schedule"
+SERVICE_SET_SCHEDULE = "set_schedule"
 
 SERVICE_DATA_HEATING_BOOST_MINUTES = "minutes_to_boost"
 SERVICE_DATA_HEATING_BOOST_TEMPERATURE = "temperature_to_boost"
 SERVICE_DATA_WATER_BOOST_MINUTES = "minutes_to_boost"
+SERVICE_DATA_SNAPSHOT_NAME = "name"
+SERVICE_DATA_STAGGER = "stagger"
+SERVICE_DATA_CHANNEL = "channel"
+SERVICE_DATA_REFRESH = "refresh"
+SERVICE_DATA_SCHEDULE = "schedule"
+
+DEFAULT_SNAPSHOT_NAME = "default"
+DEFAULT_STAGGER_SECONDS = 1.0
 
 ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_FORCE = "force"
 
-SERVICE_BASE_SCHEMA = vol.Schema(
+SERVICE_ENTRY_SCHEMA = vol.Schema(
     {
         vol.Required(ATTR_CONFIG_ENTRY_ID): str,
     }
 )
 
-SERVICE_HEATING_BOOST_SCHEMA = SERVICE_BASE_SCHEMA.extend(
+# Boost services take a config entry, a target, or both
+SERVICE_TARGET_FIELDS = {
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): str,
+    **cv.TARGET_SERVICE_FIELDS,
+}
+
+SERVICE_BASE_FIELDS = {
+    **SERVICE_TARGET_FIELDS,
+    vol.Optional(ATTR_FORCE, default=False): cv.boolean,
+}
+
+TARGET_KEYS = (ATTR_CONFIG_ENTRY_ID, ATTR_ENTITY_ID, ATTR_DEVICE_ID, ATTR_AREA_ID)
+
+has_target = cv.has_at_least_one_key(*TARGET_KEYS)
+
+SERVICE_BASE_SCHEMA = vol.All(vol.Schema(SERVICE_BASE_FIELDS), has_target)
+
+SERVICE_HEATING_BOOST_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            **SERVICE_BASE_FIELDS,
+            vol.Optional(SERVICE_DATA_HEATING_BOOST_MINUTES): cv.positive_int,
+            vol.Optional(SERVICE_DATA_HEATING_BOOST_TEMPERATURE): cv.positive_float,
+        }
+    ),
+    has_target,
+)
+
+SERVICE_WATER_BOOST_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            **SERVICE_BASE_FIELDS,
+            vol.Optional(SERVICE_DATA_WATER_BOOST_MINUTES): cv.positive_int,
+        }
+    ),
+    has_target,
+)
+
+SERVICE_GET_STATES_SCHEMA = vol.Schema(SERVICE_TARGET_FIELDS)
+
+SERVICE_SCHEDULE_FIELDS: dict[Any, Any] = {
+    **SERVICE_TARGET_FIELDS,
+    vol.Optional(SERVICE_DATA_CHANNEL, default=SCHEDULE_HEAT): vol.In(
+        [SCHEDULE_HEAT, SCHEDULE_WATER]
+    ),
+}
+
+SERVICE_GET_SCHEDULE_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            **SERVICE_SCHEDULE_FIELDS,
+            vol.Optional(SERVICE_DATA_REFRESH, default=False): cv.boolean,
+        }
+    ),
+    has_target,
+)
+
+TRANSITION_SCHEMA = vol.Schema(
     {
-        vol.Optional(SERVICE_DATA_HEATING_BOOST_MINUTES): cv.positive_int,
-        vol.Optional(SERVICE_DATA_HEATING_BOOST_TEMPERATURE): cv.positive_float,
+        vol.Required("time"): cv.time,
+        vol.Required("temperature"): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=32)
+        ),
     }
 )
 
-SERVICE_WATER_BOOST_SCHEMA = SERVICE_BASE_SCHEMA.extend(
+SERVICE_SET_SCHEDULE_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            **SERVICE_SCHEDULE_FIELDS,
+            vol.Required(SERVICE_DATA_SCHEDULE): vol.Schema(
+                {
+                    vol.In(DAYS): vol.All(
+                        cv.ensure_list,
+                        [TRANSITION_SCHEMA],
+                        vol.Length(min=1, max=MAX_TRANSITIONS),
+                    )
+                }
+            ),
+            vol.Optional(ATTR_FORCE, default=False): cv.boolean,
+        }
+    ),
+    has_target,
+)
+
+SERVICE_SNAPSHOT_SCHEMA = vol.Schema(
     {
-        vol.Optional(SERVICE_DATA_WATER_BOOST_MINUTES): cv.positive_int,
+        vol.Optional(SERVICE_DATA_SNAPSHOT_NAME, default=DEFAULT_SNAPSHOT_NAME): str,
+    }
+)
+
+SERVICE_RESTORE_SCHEMA = SERVICE_SNAPSHOT_SCHEMA.extend(
+    {
+        vol.Optional(SERVICE_DATA_STAGGER, default=DEFAULT_STAGGER_SECONDS): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=60)
+        ),
+        vol.Optional(ATTR_FORCE, default=False): cv.boolean,
     }
 )
 
@@ -69,9 +187,51 @@ def async_get_entry(hass: HomeAssistant, config_entry_id: str) -> ConfigEntry:
             translation_key="not_loaded",
             translation_placeholders={"target": entry.title},
         )
+    if entry.options.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_HOUSE:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="wrong_model",
+        )
     return entry
 
 
+def async_get_coordinators(
+    call: ServiceCall, *, model: str | None = None, groups: bool = True
+) -> list[HiveCoordinator]:
+    """Get the coordinators targeted by a service call.
+
+    With a model, or without groups, other targets are skipped, and an error
+    is raised only when none are left.
+    """
+    coordinators = async_get_index(call.hass).async_resolve(call)
+    if config_entry_id := call.data.get(ATTR_CONFIG_ENTRY_ID):
+        entry = async_get_entry(call.hass, config_entry_id)
+        coordinator = cast(HiveData, entry.runtime_data).coordinator
+        if coordinator not in coordinators:
+            coordinators.append(coordinator)
+
+    if not coordinators:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="no_receivers",
+        )
+
+    if model is not None or not groups:
+        coordinators = [
+            coordinator
+            for coordinator in coordinators
+            if model in (None, coordinator.model)
+            and (groups or not isinstance(coordinator, HiveGroupCoordinator))
+        ]
+        if not coordinators:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="wrong_model",
+            )
+
+    return coordinators
+
+
 @callback
 def async_setup_services(hass: HomeAssistant) -> None:
     """Set up the services for the hive_local_thermostat integration."""
@@ -104,78 +264,257 @@ def async_setup_services(hass: HomeAssistant) -> None:
         schema=SERVICE_BASE_SCHEMA,
     )
 
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SNAPSHOT,
+        _async_snapshot,
+        schema=SERVICE_SNAPSHOT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
 
-async def _async_heating_boost(call: ServiceCall) -> ServiceResponse:
-    """Handle the service call."""
-    entry = async_get_entry(call.hass, call.data[ATTR_CONFIG_ENTRY_ID])
-    coordinator = cast(HiveData, entry.runtime_data).coordinator
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RESTORE,
+        _async_restore,
+        schema=SERVICE_RESTORE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
 
-    boost_minutes = cast(
-        int,
-        call.data.get(
-            SERVICE_DATA_HEATING_BOOST_MINUTES,
-            coordinator.heating_boost_duration,
-        ),
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_DUMP_TRACE,
+        _async_dump_trace,
+        schema=SERVICE_ENTRY_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
     )
 
-    boost_temperature = cast(
-        float,
-        call.data.get(
-            SERVICE_DATA_HEATING_BOOST_TEMPERATURE,
-            coordinator.heating_boost_temperature,
-        ),
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_STATES,
+        _async_get_states,
+        schema=SERVICE_GET_STATES_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
     )
 
-    await coordinator.async_heating_boost(boost_minutes, boost_temperature)
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_SCHEDULE,
+        _async_get_schedule,
+        schema=SERVICE_GET_SCHEDULE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_SCHEDULE,
+        _async_set_schedule,
+        schema=SERVICE_SET_SCHEDULE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+async def _async_heating_boost(call: ServiceCall) -> ServiceResponse:
+    """Handle the service call."""
+    force = call.data[ATTR_FORCE]
+
+    await gather(
+        *(
+            coordinator.async_heating_boost(
+                cast(
+                    int,
+                    call.data.get(
+                        SERVICE_DATA_HEATING_BOOST_MINUTES,
+                        coordinator.heating_boost_duration,
+                    ),
+                ),
+                cast(
+                    float,
+                    call.data.get(
+                        SERVICE_DATA_HEATING_BOOST_TEMPERATURE,
+                        coordinator.heating_boost_temperature,
+                    ),
+                ),
+                force=force,
+            )
+            for coordinator in async_get_coordinators(call)
+        )
+    )
 
     return None
 
 
 async def _async_heating_boost_cancel(call: ServiceCall) -> ServiceResponse:
     """Handle the service call to cancel heating boost."""
-    entry = async_get_entry(call.hass, call.data[ATTR_CONFIG_ENTRY_ID])
-    coordinator = cast(HiveData, entry.runtime_data).coordinator
+    force = call.data[ATTR_FORCE]
 
-    await coordinator.async_heating_boost_cancel()
+    await gather(
+        *(
+            coordinator.async_heating_boost_cancel(force=force)
+            for coordinator in async_get_coordinators(call)
+        )
+    )
 
     return None
 
 
 async def _async_water_boost(call: ServiceCall) -> ServiceResponse:
     """Handle the service call."""
-    entry = async_get_entry(call.hass, call.data[ATTR_CONFIG_ENTRY_ID])
-    coordinator = cast(HiveData, entry.runtime_data).coordinator
+    force = call.data[ATTR_FORCE]
+
+    await gather(
+        *(
+            coordinator.async_water_boost(
+                cast(
+                    int,
+                    call.data.get(
+                        SERVICE_DATA_WATER_BOOST_MINUTES,
+                        coordinator.water_boost_duration,
+                    ),
+                ),
+                force=force,
+            )
+            for coordinator in async_get_coordinators(call, model=MODEL_SLR2)
+        )
+    )
 
-    boost_minutes = cast(
-        int,
-        call.data.get(
-            SERVICE_DATA_WATER_BOOST_MINUTES,
-            coordinator.water_boost_duration,
-        ),
+    return None
+
+
+async def _async_water_boost_cancel(call: ServiceCall) -> ServiceResponse:
+    """Handle the service call to cancel water boost."""
+    force = call.data[ATTR_FORCE]
+
+    await gather(
+        *(
+            coordinator.async_water_boost_cancel(force=force)
+            for coordinator in async_get_coordinators(call, model=MODEL_SLR2)
+        )
     )
 
-    if coordinator.model != MODEL_SLR2:
+    return None
+
+
+async def _async_snapshot(call: ServiceCall) -> ServiceResponse:
+    """Handle the service call to snapshot all receivers."""
+    snapshot = async_snapshot(call.hass)
+
+    store = snapshot_store(call.hass)
+    snapshots = await store.async_load() or {}
+    snapshots[call.data[SERVICE_DATA_SNAPSHOT_NAME]] = snapshot
+    await store.async_save(snapshots)
+
+    return snapshot if call.return_response else None
+
+
+async def _async_restore(call: ServiceCall) -> ServiceResponse:
+    """Handle the service call to restore all receivers from a snapshot."""
+    name = call.data[SERVICE_DATA_SNAPSHOT_NAME]
+    snapshots = await snapshot_store(call.hass).async_load() or {}
+
+    if (snapshot := snapshots.get(name)) is None:
         raise ServiceValidationError(
             translation_domain=DOMAIN,
-            translation_key="wrong_model",
+            translation_key="snapshot_not_found",
+            translation_placeholders={"name": name},
         )
 
-    await coordinator.async_water_boost(boost_minutes)
+    result = await async_restore(
+        call.hass,
+        snapshot["receivers"],
+        call.data[SERVICE_DATA_STAGGER],
+        force=call.data[ATTR_FORCE],
+    )
 
-    return None
+    return result if call.return_response else None
 
 
-async def _async_water_boost_cancel(call: ServiceCall) -> ServiceResponse:
-    """Handle the service call to cancel water boost."""
+async def _async_dump_trace(call: ServiceCall) -> ServiceResponse:
+    """Handle the service call to write a receiver's message trace to the log."""
     entry = async_get_entry(call.hass, call.data[ATTR_CONFIG_ENTRY_ID])
     coordinator = cast(HiveData, entry.runtime_data).coordinator
 
-    if coordinator.model != MODEL_SLR2:
-        raise ServiceValidationError(
-            translation_domain=DOMAIN,
-            translation_key="wrong_model",
+    response: dict[str, Any] = {"records": coordinator.trace.dump("requested")}
+
+    return response if call.return_response else None
+
+
+async def _async_get_states(call: ServiceCall) -> ServiceResponse:
+    """Handle the service call to read the state of receivers."""
+    if any(key in call.data for key in TARGET_KEYS):
+        return async_get_states(call.hass, async_get_coordinators(call))
+
+    return async_get_states(call.hass)
+
+
+def async_get_schedule_coordinators(call: ServiceCall) -> list[HiveCoordinator]:
+    """Get the receivers targeted by a schedule service call.
+
+    Groups have no schedule of their own, and only the SLR2 has a water
+    schedule.
+    """
+    return async_get_coordinators(
+        call,
+        model=MODEL_SLR2 if call.data[SERVICE_DATA_CHANNEL] == SCHEDULE_WATER else None,
+        groups=False,
+    )
+
+
+async def _async_get_schedule(call: ServiceCall) -> ServiceResponse:
+    """Handle the service call to read weekly schedules."""
+    channel = call.data[SERVICE_DATA_CHANNEL]
+    coordinators = async_get_schedule_coordinators(call)
+
+    # Receivers are only asked when the cached schedule will not do
+    await gather(
+        *(
+            coordinator.async_request_schedule(channel)
+            for coordinator in coordinators
+            if call.data[SERVICE_DATA_REFRESH]
+            or not coordinator.schedules[channel].complete
         )
+    )
 
-    await coordinator.async_water_boost_cancel()
+    response: dict[str, Any] = {
+        coordinator.entry_id: {
+            "complete": coordinator.schedules[channel].complete,
+            "days": coordinator.schedules[channel].as_dict(),
+        }
+        for coordinator in coordinators
+    }
+    return response
+
+
+async def _async_set_schedule(call: ServiceCall) -> ServiceResponse:
+    """Handle the service call to write weekly schedules."""
+    channel = call.data[SERVICE_DATA_CHANNEL]
+    coordinators = async_get_schedule_coordinators(call)
+
+    # Schedule writes are not queued, so nothing is sent unless all can be
+    for coordinator in coordinators:
+        if not coordinator.can_publish:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="not_reachable",
+                translation_placeholders={"target": coordinator.topic},
+            )
+
+    days = {
+        day: day_schedule(transitions)
+        for day, transitions in call.data[SERVICE_DATA_SCHEDULE].items()
+    }
+    results = await gather(
+        *(
+            coordinator.async_set_schedule(channel, days, force=call.data[ATTR_FORCE])
+            for coordinator in coordinators
+        )
+    )
 
-    return None
+    response: dict[str, Any] = {
+        coordinator.entry_id: {
+            "sent": sent,
+            "failed": failed,
+            "unchanged": [day for day in days if day not in sent and day not in failed],
+        }
+        for coordinator, (sent, failed) in zip(coordinators, results, strict=True)
+    }
+    return response if call.return_response else None
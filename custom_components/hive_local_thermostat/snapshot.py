@@ -0,0 +1,235 @@
+"""Fleet snapshot, restore and state reads for Hive Local Thermostat."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+
+from homeassistant.components.climate import HVACMode
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util.dt import utcnow
+
+from .const import (
+    CONF_ENTRY_TYPE,
+    DOMAIN,
+    ENTRY_TYPE_GROUP,
+    ENTRY_TYPE_HOUSE,
+    LOGGER,
+    MODEL_SLR2,
+    STORAGE_VERSION,
+)
+from .coordinator import HiveCoordinator
+
+SNAPSHOT_HVAC_MODE = "hvac_mode"
+SNAPSHOT_TEMPERATURE = "temperature"
+SNAPSHOT_WATER_MODE = "water_mode"
+
+# Coordinator method (without the async_ prefix) for each restored water mode
+WATER_MODE_COMMANDS = {
+    "auto": "water_scheduled",
+    "heat": "water_always_on",
+    "off": "water_always_off",
+}
+
+type RestoreCommand = tuple[str, tuple[Any, ...]]
+
+
+def snapshot_store(hass: HomeAssistant) -> Store[dict[str, Any]]:
+    """Return the persisted snapshots."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.snapshots")
+
+
+@callback
+def async_get_receivers(hass: HomeAssistant) -> dict[str, HiveCoordinator]:
+    """Return the coordinators of all loaded receivers, keyed by entry id."""
+    return {
+        entry.entry_id: entry.runtime_data.coordinator
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.state is ConfigEntryState.LOADED
+        and entry.options.get(CONF_ENTRY_TYPE)
+        not in (ENTRY_TYPE_GROUP, ENTRY_TYPE_HOUSE)
+    }
+
+
+def snapshot_receiver(coordinator: HiveCoordinator) -> dict[str, Any]:
+    """Return the modes and setpoint to restore for a receiver.
+
+    A boost is temporary, so the values from before the boost are captured.
+    """
+    if coordinator.heat_boost:
+        hvac_mode = coordinator.pre_boost_hvac_mode
+        temperature = coordinator.pre_boost_occupied_heating_setpoint_heat
+    else:
+        hvac_mode = coordinator.hvac_mode
+        temperature = coordinator.target_temperature
+
+    water_mode = (
+        coordinator.pre_boost_water_mode
+        if coordinator.water_boost
+        else coordinator.water_mode
+    )
+
+    snapshot: dict[str, Any] = {
+        SNAPSHOT_HVAC_MODE: hvac_mode,
+        SNAPSHOT_TEMPERATURE: temperature,
+    }
+    if coordinator.model == MODEL_SLR2:
+        snapshot[SNAPSHOT_WATER_MODE] = water_mode
+
+    # Only keep what is known, unknown values are left alone on restore
+    return {key: value for key, value in snapshot.items() if value is not None}
+
+
+def restore_commands(
+    coordinator: HiveCoordinator, snapshot: dict[str, Any], *, force: bool = False
+) -> list[RestoreCommand]:
+    """Return the minimal commands that bring a receiver back to a snapshot.
+
+    With force, commands are returned for every value in the snapshot.
+    """
+    commands: list[RestoreCommand] = []
+
+    hvac_mode = snapshot.get(SNAPSHOT_HVAC_MODE)
+    temperature = snapshot.get(SNAPSHOT_TEMPERATURE)
+    mode_changed = force or hvac_mode != coordinator.hvac_mode or coordinator.heat_boost
+
+    if hvac_mode == HVACMode.OFF and mode_changed:
+        commands.append(("set_hvac_mode_off", ()))
+    elif hvac_mode == HVACMode.AUTO and mode_changed:
+        commands.append(("set_hvac_mode_auto", ()))
+    elif hvac_mode == HVACMode.HEAT and temperature is not None:
+        if mode_changed:
+            # One payload sets the mode and the setpoint together
+            commands.append(("set_hvac_mode_heat", (temperature, True)))
+        elif temperature != coordinator.target_temperature:
+            commands.append(("set_temperature", (temperature,)))
+
+    water_mode = snapshot.get(SNAPSHOT_WATER_MODE)
+    if (
+        coordinator.model == MODEL_SLR2
+        and water_mode in WATER_MODE_COMMANDS
+        and (force or water_mode != coordinator.water_mode)
+    ):
+        commands.append((WATER_MODE_COMMANDS[water_mode], ()))
+
+    return commands
+
+
+async def async_restore_receiver(
+    coordinator: HiveCoordinator,
+    commands: list[RestoreCommand],
+    delay: float,
+    *,
+    force: bool = False,
+) -> None:
+    """Send the restore commands for one receiver after a staggered delay."""
+    if delay:
+        await asyncio.sleep(delay)
+
+    for name, args in commands:
+        LOGGER.debug("Restoring %s with %s%s", coordinator.topic, name, args)
+        await getattr(coordinator, f"async_{name}")(*args, force=force)
+
+
+async def async_restore(
+    hass: HomeAssistant,
+    receivers: dict[str, dict[str, Any]],
+    stagger: float,
+    *,
+    force: bool = False,
+) -> dict[str, Any]:
+    """Restore receivers to a snapshot, returning what was sent."""
+    coordinators = async_get_receivers(hass)
+
+    plans = {
+        entry_id: restore_commands(coordinators[entry_id], snapshot, force=force)
+        for entry_id, snapshot in receivers.items()
+        if entry_id in coordinators
+    }
+    changed = {entry_id: commands for entry_id, commands in plans.items() if commands}
+
+    # Receivers are restored concurrently, each starting a little later
+    await asyncio.gather(
+        *(
+            async_restore_receiver(
+                coordinators[entry_id], commands, index * stagger, force=force
+            )
+            for index, (entry_id, commands) in enumerate(changed.items())
+        )
+    )
+
+    return {
+        "restored": {
+            entry_id: [name for name, _args in commands]
+            for entry_id, commands in changed.items()
+        },
+        "unchanged": [entry_id for entry_id in plans if entry_id not in changed],
+        "missing": [entry_id for entry_id in receivers if entry_id not in plans],
+    }
+
+
+@callback
+def async_snapshot(hass: HomeAssistant) -> dict[str, Any]:
+    """Capture every loaded receiver in one pass."""
+    return {
+        "created": utcnow().isoformat(),
+        "receivers": {
+            entry_id: snapshot_receiver(coordinator)
+            for entry_id, coordinator in async_get_receivers(hass).items()
+        },
+    }
+
+
+def receiver_values(coordinator: HiveCoordinator) -> dict[str, Any]:
+    """Return the current state of a receiver, read from its coordinator."""
+    values: dict[str, Any] = {
+        "topic": coordinator.topic,
+        "model": coordinator.model,
+        "available": coordinator.available,
+        "hvac_mode": coordinator.hvac_mode,
+        "target_temperature": coordinator.target_temperature,
+        "current_temperature": coordinator.current_temperature,
+        "running_state_heat": coordinator.running_state_heat or None,
+        "boost_remaining_heat": coordinator.boost_remaining_heat,
+    }
+    if coordinator.model == MODEL_SLR2:
+        values["water_mode"] = coordinator.water_mode
+        values["running_state_water"] = coordinator.running_state_water or None
+        values["boost_remaining_water"] = coordinator.boost_remaining_water
+    return values
+
+
+def receiver_state(coordinator: HiveCoordinator, now: datetime) -> dict[str, Any]:
+    """Return the current state of a receiver with the age of its last report.
+
+    The age is in seconds, or None if the receiver has not reported since
+    Home Assistant started.
+    """
+    state = receiver_values(coordinator)
+    state["last_report_age"] = (
+        round((now - coordinator.last_report).total_seconds())
+        if coordinator.last_report is not None
+        else None
+    )
+    return state
+
+
+@callback
+def async_get_states(
+    hass: HomeAssistant, coordinators: Iterable[HiveCoordinator] | None = None
+) -> dict[str, Any]:
+    """Return the state of the given receivers, or of every loaded receiver."""
+    if coordinators is None:
+        coordinators = async_get_receivers(hass).values()
+
+    now = utcnow()
+    return {
+        "receivers": {
+            coordinator.entry_id: receiver_state(coordinator, now)
+            for coordinator in coordinators
+        }
+    }
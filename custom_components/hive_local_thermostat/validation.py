@@ -0,0 +1,120 @@
+"""Payload validation for Hive Local Thermostat."""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+NoneType = type(None)
+
+# Accepted types per field, checked by exact type so booleans are not numbers.
+# Zigbee2MQTT reports null for values the receiver has not sent yet.
+STRING: frozenset[type] = frozenset((str, NoneType))
+BOOLEAN: frozenset[type] = frozenset((bool, NoneType))
+NUMBER: frozenset[type] = frozenset((int, float, NoneType))
+OBJECT: frozenset[type] = frozenset((dict, NoneType))
+
+REASON_MISSING = "missing"
+REASON_UNEXPECTED = "not reported by this model"
+REASON_NOT_OBJECT = "not a JSON object"
+
+PAYLOAD_FIELD = "payload"
+
+
+@dataclass(slots=True)
+class PayloadValidation:
+    """Result of validating a payload.
+
+    valid holds the fields that passed, or None if the whole payload was
+    rejected. model_mismatch is set when the payload is from another model.
+    """
+
+    valid: dict[str, Any] | None
+    errors: dict[str, str] = field(default_factory=dict)
+    model_mismatch: bool = False
+
+
+class PayloadValidator:
+    """Validator for the payloads of one receiver model.
+
+    The accepted types are resolved once per model, so validating is a single
+    pass over the payload doing a dict lookup and a set membership test per
+    field. Fields with an unexpected type are dropped and reported, the rest
+    of the payload is still applied. Payloads that look like another model's
+    are rejected whole, as every field would be misread.
+    """
+
+    def __init__(
+        self,
+        field_types: Mapping[str, frozenset[type]],
+        *,
+        unexpected: frozenset[str] = frozenset(),
+        required: Mapping[str, frozenset[str]] | None = None,
+    ) -> None:
+        """Initialize the validator.
+
+        unexpected fields are never reported by the model. required maps a
+        field to the fields that, when present, mean it must be present too.
+        """
+        self.field_types = dict(field_types)
+        self.unexpected = unexpected
+        self.required = dict(required or {})
+        self.rejected_payloads = 0
+        self.rejections: Counter[str] = Counter()
+        self.last_errors: dict[str, str] = {}
+
+    def validate(self, data: Any) -> PayloadValidation:
+        """Validate a decoded payload."""
+        if type(data) is not dict:
+            return self._reject_payload({PAYLOAD_FIELD: REASON_NOT_OBJECT})
+
+        if self.unexpected and not self.unexpected.isdisjoint(data):
+            return self._reject_payload(
+                dict.fromkeys(self.unexpected & data.keys(), REASON_UNEXPECTED),
+                model_mismatch=True,
+            )
+
+        for key, triggers in self.required.items():
+            if key not in data and not triggers.isdisjoint(data):
+                return self._reject_payload({key: REASON_MISSING}, model_mismatch=True)
+
+        field_types = self.field_types
+        errors: dict[str, str] | None = None
+        for key, value in data.items():
+            allowed = field_types.get(key)
+            if allowed is not None and type(value) not in allowed:
+                if errors is None:
+                    errors = {}
+                errors[key] = f"unexpected type {type(value).__name__}"
+
+        if errors is None:
+            return PayloadValidation(data)
+
+        self.reject(errors)
+        return PayloadValidation(
+            {key: value for key, value in data.items() if key not in errors},
+            errors,
+        )
+
+    def reject(self, errors: dict[str, str]) -> None:
+        """Count rejected fields."""
+        self.rejections.update(errors.keys())
+        self.last_errors = errors
+
+    def _reject_payload(
+        self, errors: dict[str, str], *, model_mismatch: bool = False
+    ) -> PayloadValidation:
+        """Count a payload rejected as a whole."""
+        self.rejected_payloads += 1
+        self.reject(errors)
+        return PayloadValidation(None, errors, model_mismatch)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return rejection counts for diagnostics."""
+        return {
+            "rejected_payloads": self.rejected_payloads,
+            "rejected_fields": dict(self.rejections),
+            "last_errors": self.last_errors,
+        }
@@ -0,0 +1,79 @@
+"""Stale data watchdog for Hive Local Thermostat."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util.hass_dict import HassKey
+
+from .const import (
+    DOMAIN,
+    LOGGER,
+    SIGNAL_RECEIVER_ADDED,
+    SIGNAL_RECEIVER_REMOVED,
+    WATCHDOG_INTERVAL_SECONDS,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import HiveCoordinator
+
+DATA_WATCHDOG: HassKey[HiveWatchdog] = HassKey(f"{DOMAIN}_watchdog")
+
+
+class HiveWatchdog:
+    """Integration-wide timer checking every coordinator for stale data.
+
+    The watchdog also holds the set of running receiver coordinators, and
+    signals when one is registered or unregistered.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the watchdog."""
+        self.hass = hass
+        self.coordinators: set[HiveCoordinator] = set()
+        self._unsub_timer: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_register(self, coordinator: HiveCoordinator) -> CALLBACK_TYPE:
+        """Watch a coordinator, returns a callback to stop watching it."""
+        self.coordinators.add(coordinator)
+        async_dispatcher_send(self.hass, SIGNAL_RECEIVER_ADDED, coordinator)
+
+        if self._unsub_timer is None:
+            LOGGER.debug("Starting stale data watchdog")
+            self._unsub_timer = async_track_time_interval(
+                self.hass,
+                self._async_check,
+                timedelta(seconds=WATCHDOG_INTERVAL_SECONDS),
+                name=f"{DOMAIN} stale data watchdog",
+            )
+
+        @callback
+        def _async_unregister() -> None:
+            self.coordinators.discard(coordinator)
+            async_dispatcher_send(self.hass, SIGNAL_RECEIVER_REMOVED, coordinator)
+            if not self.coordinators and self._unsub_timer is not None:
+                LOGGER.debug("Stopping stale data watchdog")
+                self._unsub_timer()
+                self._unsub_timer = None
+
+        return _async_unregister
+
+    @callback
+    def _async_check(self, now: datetime) -> None:
+        """Check all coordinators for stale data and log error summaries."""
+        for coordinator in self.coordinators:
+            coordinator.check_stale(now)
+            coordinator.errors.flush()
+
+
+@callback
+def async_get_watchdog(hass: HomeAssistant) -> HiveWatchdog:
+    """Return the shared watchdog, creating it on first use."""
+    if (watchdog := hass.data.get(DATA_WATCHDOG)) is None:
+        watchdog = hass.data[DATA_WATCHDOG] = HiveWatchdog(hass)
+    return watchdog
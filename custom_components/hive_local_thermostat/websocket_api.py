@@ -0,0 +1,158 @@
+"""Websocket API for Hive Local Thermostat."""
+
+from __future__ import annotations
+
+from functools import partial
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import DOMAIN, SIGNAL_RECEIVER_ADDED, SIGNAL_RECEIVER_REMOVED
+from .coordinator import HiveCoordinator
+from .snapshot import receiver_values
+from .watchdog import async_get_watchdog
+
+ATTR_ENTRY_IDS = "entry_ids"
+ATTR_RECEIVERS = "receivers"
+
+
+@callback
+def async_setup_websocket(hass: HomeAssistant) -> None:
+    """Register the websocket commands."""
+    websocket_api.async_register_command(hass, websocket_subscribe_states)
+
+
+def state_delta(old: dict[str, Any], new: dict[str, Any]) -> dict[str, Any]:
+    """Return the fields of new that differ from old."""
+    return {
+        key: value for key, value in new.items() if key not in old or old[key] != value
+    }
+
+
+class HiveStateStream:
+    """One websocket subscription to receiver state.
+
+    The full state of each receiver is sent once, after that only the fields
+    that changed. Receivers notify on change only, so an update is a diff of
+    a dozen fields against the last sent values. Receivers that are set up
+    later are added, and a removed receiver is sent as null.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        connection: websocket_api.ActiveConnection,
+        msg_id: int,
+        entry_ids: set[str] | None,
+    ) -> None:
+        """Initialize the stream."""
+        self.hass = hass
+        self.connection = connection
+        self.msg_id = msg_id
+        self.entry_ids = entry_ids
+        self.sent: dict[HiveCoordinator, dict[str, Any]] = {}
+        self._receiver_unsubscribes: dict[HiveCoordinator, list[CALLBACK_TYPE]] = {}
+        self._unsubscribes: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_start(self) -> None:
+        """Follow the selected receivers and send their full state."""
+        self._unsubscribes = [
+            async_dispatcher_connect(
+                self.hass, SIGNAL_RECEIVER_ADDED, self.async_add_receiver
+            ),
+            async_dispatcher_connect(
+                self.hass, SIGNAL_RECEIVER_REMOVED, self.async_remove_receiver
+            ),
+        ]
+        receivers: dict[str, Any] = {}
+        for coordinator in async_get_watchdog(self.hass).coordinators:
+            if self.follow(coordinator):
+                receivers[coordinator.entry_id] = self.sent[coordinator]
+        self._send(receivers)
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop following receivers."""
+        for unsubscribe in self._unsubscribes:
+            unsubscribe()
+        self._unsubscribes = []
+        for unsubscribes in self._receiver_unsubscribes.values():
+            for unsubscribe in unsubscribes:
+                unsubscribe()
+        self._receiver_unsubscribes.clear()
+        self.sent.clear()
+
+    def follow(self, coordinator: HiveCoordinator) -> bool:
+        """Start following a receiver if it is selected."""
+        if coordinator in self.sent or (
+            self.entry_ids is not None and coordinator.entry_id not in self.entry_ids
+        ):
+            return False
+
+        handle_update = partial(self.handle_receiver_update, coordinator)
+        self._receiver_unsubscribes[coordinator] = [
+            coordinator.async_add_listener(handle_update),
+            coordinator.async_add_availability_listener(handle_update),
+        ]
+        self.sent[coordinator] = receiver_values(coordinator)
+        return True
+
+    @callback
+    def async_add_receiver(self, coordinator: HiveCoordinator) -> None:
+        """Follow a receiver that was set up, sending its full state."""
+        if self.follow(coordinator):
+            self._send({coordinator.entry_id: self.sent[coordinator]})
+
+    @callback
+    def async_remove_receiver(self, coordinator: HiveCoordinator) -> None:
+        """Stop following a receiver that was unloaded."""
+        if (unsubscribes := self._receiver_unsubscribes.pop(coordinator, None)) is None:
+            return
+
+        for unsubscribe in unsubscribes:
+            unsubscribe()
+        del self.sent[coordinator]
+        self._send({coordinator.entry_id: None})
+
+    @callback
+    def handle_receiver_update(self, coordinator: HiveCoordinator) -> None:
+        """Send the fields of a receiver that changed."""
+        values = receiver_values(coordinator)
+        if not (delta := state_delta(self.sent[coordinator], values)):
+            return
+
+        self.sent[coordinator] = values
+        self._send({coordinator.entry_id: delta})
+
+    def _send(self, receivers: dict[str, Any]) -> None:
+        """Send an event to the subscriber."""
+        self.connection.send_message(
+            websocket_api.event_message(self.msg_id, {ATTR_RECEIVERS: receivers})
+        )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe_states",
+        vol.Optional(ATTR_ENTRY_IDS): [str],
+    }
+)
+@callback
+def websocket_subscribe_states(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Stream state deltas for the selected receivers, or all of them."""
+    entry_ids = msg.get(ATTR_ENTRY_IDS)
+    stream = HiveStateStream(
+        hass, connection, msg["id"], set(entry_ids) if entry_ids else None
+    )
+    connection.subscriptions[msg["id"]] = stream.async_stop
+    connection.send_result(msg["id"])
+    stream.async_start()
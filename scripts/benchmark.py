@@ -0,0 +1,187 @@
+# ruff: noqa: INP001
+"""Micro-benchmarks for the Hive Local Thermostat message hot path.
+
+Run from the repository root with `uv run python scripts/benchmark.py`.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from functools import partial
+from pathlib import Path
+from timeit import Timer
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.hive_local_thermostat.const import (
+    LOGGER,
+    MODEL_SLR1,
+    MODEL_SLR2,
+)
+from custom_components.hive_local_thermostat.coordinator import (
+    HiveCoordinator,
+    payload_validator,
+)
+
+from homeassistant.core import CALLBACK_TYPE
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+# Entities listening to an SLR2 coordinator
+LISTENERS = 13
+REPLAY_ROUNDS = 7
+
+# Full state reports as published by Zigbee2MQTT
+PAYLOADS = {
+    MODEL_SLR1: {
+        "linkquality": 120,
+        "local_temperature": 19.84,
+        "occupied_heating_setpoint": 20,
+        "running_state": "heat",
+        "system_mode": "heat",
+        "temperature_setpoint_hold": True,
+        "temperature_setpoint_hold_duration": 0,
+        "weekly_schedule": {},
+    },
+    MODEL_SLR2: {
+        "linkquality": 120,
+        "local_temperature_heat": 19.84,
+        "local_temperature_water": 0,
+        "occupied_heating_setpoint_heat": 20,
+        "occupied_heating_setpoint_water": 22,
+        "running_state_heat": "heat",
+        "running_state_water": "idle",
+        "system_mode_heat": "heat",
+        "system_mode_water": "heat",
+        "temperature_setpoint_hold_duration_heat": 0,
+        "temperature_setpoint_hold_duration_water": 0,
+        "temperature_setpoint_hold_heat": True,
+        "temperature_setpoint_hold_water": False,
+        "weekly_schedule_heat": {},
+        "weekly_schedule_water": {},
+    },
+}
+
+
+class DataUpdateHiveCoordinator(HiveCoordinator):
+    """HiveCoordinator notifying through a DataUpdateCoordinator, as before."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the coordinator."""
+        super().__init__(*args, **kwargs)
+        self.data_coordinator: DataUpdateCoordinator[dict[str, Any]] = (
+            DataUpdateCoordinator(self.hass, LOGGER, name="benchmark")
+        )
+
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> CALLBACK_TYPE:
+        """Listen through the DataUpdateCoordinator."""
+        return self.data_coordinator.async_add_listener(update_callback, context)
+
+    def async_update_listeners(self) -> None:
+        """Notify through the DataUpdateCoordinator."""
+        self.data_coordinator.async_set_updated_data(self.reported_state)
+
+
+def replay_messages() -> list[SimpleNamespace]:
+    """Return SLR2 reports with the temperature drifting up and back down."""
+    temperatures = [round(18 + step / 10, 1) for step in range(30)]
+    messages = []
+    for index, temperature in enumerate([*temperatures, *reversed(temperatures)]):
+        payload = dict(PAYLOADS[MODEL_SLR2])
+        payload["local_temperature_heat"] = temperature
+        payload["running_state_heat"] = "idle" if index // 10 % 2 else "heat"
+        messages.append(
+            SimpleNamespace(topic="zigbee2mqtt/hive", payload=json.dumps(payload))
+        )
+    return messages
+
+
+def replay_coordinator(coordinator_class: type[HiveCoordinator]) -> HiveCoordinator:
+    """Return a coordinator with listeners, as set up for an SLR2."""
+    coordinator = coordinator_class(
+        MagicMock(),
+        "benchmark",
+        MODEL_SLR2,
+        "zigbee2mqtt/hive",
+        show_heat_schedule_mode=True,
+        show_water_schedule_mode=True,
+    )
+    coordinator.schedule_save = lambda: None  # type: ignore[method-assign]
+    for _ in range(LISTENERS):
+        coordinator.async_add_listener(lambda: None)
+    return coordinator
+
+
+def per_call(timer: Timer) -> float:
+    """Return the best time per call in microseconds."""
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e6
+
+
+def benchmark_validation() -> bool:
+    """Compare payload validation with decoding the payload."""
+    fast_enough = True
+    for model, payload in PAYLOADS.items():
+        validator = payload_validator(model)
+
+        decode = per_call(Timer(partial(json.loads, json.dumps(payload))))
+        validate = per_call(Timer(partial(validator.validate, payload)))
+
+        print(  # noqa: T201
+            f"{model}: json.loads {decode:.2f} us, validate {validate:.2f} us "
+            f"({validate / decode:.0%} of decode)"
+        )
+        fast_enough &= validate < decode
+    return fast_enough
+
+
+def replay(coordinator: HiveCoordinator, messages: list[SimpleNamespace]) -> None:
+    """Feed the replayed reports to a coordinator."""
+    for message in messages:
+        coordinator.handle_mqtt_message(message)  # type: ignore[arg-type]
+
+
+def benchmark_coordinator() -> bool:
+    """Compare the push coordinator with DataUpdateCoordinator.
+
+    Replays are timed alternately, so drift in machine load affects both
+    coordinators alike.
+    """
+    messages = replay_messages()
+    names = {
+        DataUpdateHiveCoordinator: "DataUpdateCoordinator",
+        HiveCoordinator: "push coordinator",
+    }
+    timers = {
+        coordinator_class: Timer(
+            partial(replay, replay_coordinator(coordinator_class), messages)
+        )
+        for coordinator_class in names
+    }
+    number, _ = timers[HiveCoordinator].autorange()
+    best = dict.fromkeys(names, float("inf"))
+    for _ in range(REPLAY_ROUNDS):
+        for coordinator_class, timer in timers.items():
+            elapsed = timer.timeit(number) / number / len(messages) * 1e6
+            best[coordinator_class] = min(best[coordinator_class], elapsed)
+
+    for coordinator_class, name in names.items():
+        update = per_call(
+            Timer(replay_coordinator(coordinator_class).async_update_listeners)
+        )
+        print(  # noqa: T201
+            f"{name}: {best[coordinator_class]:.2f} us per replayed message, "
+            f"{update:.2f} us per update of {LISTENERS} listeners"
+        )
+    return best[HiveCoordinator] < best[DataUpdateHiveCoordinator]
+
+
+if __name__ == "__main__":
+    validation_ok = benchmark_validation()
+    coordinator_ok = benchmark_coordinator()
+    sys.exit(0 if validation_ok and coordinator_ok else 1)
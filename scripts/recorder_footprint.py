@@ -0,0 +1,218 @@
+# ruff: noqa: INP001
+"""Recorder footprint of the entities of one SLR2 receiver.
+
+Replays an hour of reports, one a minute with a heating and a hot water boost
+active, through the coordinator and the climate, temperature and boost
+remaining entities. Counts the state rows the recorder would write, one for
+each written state that differs from the previous one, and the bytes of the
+recorded climate attributes, once for each attribute set not seen before.
+
+Run from the repository root with `uv run python scripts/recorder_footprint.py`.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import sys
+from dataclasses import replace
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.hive_local_thermostat.climate import (
+    HiveClimateEntity,
+    HiveClimateEntityDescription,
+)
+from custom_components.hive_local_thermostat.const import DOMAIN, MODEL_SLR2
+from custom_components.hive_local_thermostat.coordinator import HiveCoordinator
+from custom_components.hive_local_thermostat.entity import HiveEntity
+from custom_components.hive_local_thermostat.sensor import (
+    HiveSensor,
+    HiveSensorEntityDescription,
+)
+
+from homeassistant.components.sensor import SensorDeviceClass
+from homeassistant.const import UnitOfTemperature
+from homeassistant.util.dt import utcnow
+from homeassistant.util.unit_system import METRIC_SYSTEM
+
+TOPIC = "zigbee2mqtt/hive"
+MINUTES = 60
+SEED = 1
+
+# Temperature drift per report, as a receiver reports it
+DRIFT = (-0.03, -0.02, -0.01, 0, 0.01, 0.02, 0.03)
+
+HEAT_BOOST_MINUTES = 120
+WATER_BOOST_MINUTES = 60
+BOOST_TEMPERATURE = 25
+
+
+class Clock:
+    """Replay time, advanced by one minute per report."""
+
+    def __init__(self) -> None:
+        """Initialize the clock."""
+        self.now = utcnow()
+
+    def __call__(self) -> datetime:
+        """Return the replay time."""
+        return self.now
+
+
+class RecordedEntity:
+    """Count the rows the recorder would write for an entity."""
+
+    def __init__(self, entity: HiveEntity) -> None:
+        """Start counting the state writes of an entity."""
+        self.entity = entity
+        self.rows = 0
+        self.attribute_bytes = 0
+        self._last: tuple[str, str] | None = None
+        self._attribute_sets: set[str] = set()
+        self._unrecorded = (
+            entity._entity_component_unrecorded_attributes  # noqa: SLF001
+            | entity._unrecorded_attributes  # noqa: SLF001
+        )
+        entity.async_write_ha_state = self.write  # type: ignore[method-assign]
+
+    def write(self) -> None:
+        """Record a state write."""
+        calculated = self.entity._async_calculate_state()  # noqa: SLF001
+        attributes = json.dumps(
+            {
+                key: value
+                for key, value in calculated.attributes.items()
+                if key not in self._unrecorded
+            },
+            sort_keys=True,
+            default=str,
+        )
+        if (calculated.state, attributes) == self._last:
+            return
+
+        self._last = (calculated.state, attributes)
+        self.rows += 1
+        if attributes not in self._attribute_sets:
+            self._attribute_sets.add(attributes)
+            self.attribute_bytes += len(attributes.encode())
+
+
+def report(minute: int, temperature: float) -> SimpleNamespace:
+    """Return the report sent by the receiver at a minute of the replay."""
+    return SimpleNamespace(
+        topic=TOPIC,
+        payload=json.dumps(
+            {
+                "local_temperature_heat": round(temperature, 2),
+                "occupied_heating_setpoint_heat": BOOST_TEMPERATURE,
+                "running_state_heat": "heat",
+                "system_mode_heat": "emergency_heating",
+                "temperature_setpoint_hold_heat": True,
+                "temperature_setpoint_hold_duration_heat": HEAT_BOOST_MINUTES - minute,
+                "local_temperature_water": 0,
+                "running_state_water": "heat",
+                "system_mode_water": "emergency_heating",
+                "temperature_setpoint_hold_water": True,
+                "temperature_setpoint_hold_duration_water": WATER_BOOST_MINUTES
+                - minute,
+            }
+        ),
+    )
+
+
+def entities(
+    coordinator: HiveCoordinator, *, sampled: bool
+) -> dict[str, RecordedEntity]:
+    """Return the recorded entities of the receiver."""
+    hass = coordinator.hass
+    platform: Any = MagicMock(
+        platform_name=DOMAIN,
+        platform_translations={},
+        default_language_platform_translations={},
+    )
+    climate = HiveClimateEntity(
+        entity_description=HiveClimateEntityDescription(
+            key="climate", translation_key="climate", name="Hive"
+        ),
+        coordinator=coordinator,
+    )
+    sensors: dict[str, HiveEntity] = {
+        "temperature": HiveSensor(
+            entity_description=HiveSensorEntityDescription(
+                key="local_temperature_heat",
+                translation_key="local_temperature_heat",
+                name="Hive",
+                device_class=SensorDeviceClass.TEMPERATURE,
+                native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+                suggested_display_precision=1,
+            ),
+            coordinator=coordinator,
+        )
+    }
+    for key in ("boost_remaining_heat", "boost_remaining_water"):
+        description = HiveSensorEntityDescription(
+            key=key, translation_key=key, name="Hive", sample_step=5
+        )
+        if not sampled:
+            description = replace(description, sample_step=None)
+        sensors[key] = HiveSensor(
+            entity_description=description, coordinator=coordinator
+        )
+
+    recorded = {}
+    for name, entity in {"climate": climate, **sensors}.items():
+        entity.hass = hass
+        entity.platform = platform
+        entity.entity_id = f"{'climate' if entity is climate else 'sensor'}.{name}"
+        coordinator.async_add_listener(entity._handle_coordinator_update)  # noqa: SLF001
+        recorded[name] = RecordedEntity(entity)
+    return recorded
+
+
+def replay(*, sampled: bool, deadband: float) -> dict[str, RecordedEntity]:
+    """Replay an hour of reports, returning the recorded entities."""
+    hass: Any = MagicMock()
+    hass.config.units = METRIC_SYSTEM
+    coordinator = HiveCoordinator(
+        hass,
+        "footprint",
+        MODEL_SLR2,
+        TOPIC,
+        show_heat_schedule_mode=True,
+        show_water_schedule_mode=True,
+        temperature_deadband=deadband,
+    )
+    coordinator.schedule_save = lambda: None  # type: ignore[method-assign]
+    recorded = entities(coordinator, sampled=sampled)
+
+    clock = Clock()
+    drift = random.Random(SEED)  # noqa: S311
+    temperature = 19.0
+    with patch("custom_components.hive_local_thermostat.entity.utcnow", clock):
+        for minute in range(MINUTES):
+            temperature += drift.choice(DRIFT)
+            coordinator.handle_mqtt_message(report(minute, temperature))  # type: ignore[arg-type]
+            clock.now += timedelta(minutes=1)
+    return recorded
+
+
+def summary(name: str, recorded: dict[str, RecordedEntity]) -> None:
+    """Print the rows and climate attribute bytes of a replay."""
+    rows = ", ".join(f"{key} {entity.rows}" for key, entity in recorded.items())
+    total = sum(entity.rows for entity in recorded.values())
+    print(  # noqa: T201
+        f"{name}: {total} rows ({rows}), "
+        f"climate attributes {recorded['climate'].attribute_bytes} bytes"
+    )
+
+
+if __name__ == "__main__":
+    summary("unsampled boost remaining", replay(sampled=False, deadband=0))
+    summary("default options", replay(sampled=True, deadband=0))
+    summary("0.1 °C deadband", replay(sampled=True, deadband=0.1))
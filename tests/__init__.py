@@ -0,0 +1 @@
+"""Tests for the Hive Local Thermostat integration."""
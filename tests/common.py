@@ -0,0 +1,84 @@
+"""Helpers for Hive Local Thermostat tests."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+from custom_components.hive_local_thermostat.const import (
+    CONF_MODEL,
+    CONF_MQTT_TOPIC,
+    CONFIG_VERSION,
+    DOMAIN,
+    MODEL_SLR2,
+)
+from custom_components.hive_local_thermostat.coordinator import HiveCoordinator
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.components.mqtt.models import ReceiveMessage
+from homeassistant.core import HomeAssistant
+
+TOPIC = "zigbee2mqtt/receiver"
+
+# Full report from an SLR2 in manual heat, not heating
+SLR2_IDLE = {
+    "system_mode_heat": "heat",
+    "temperature_setpoint_hold_heat": True,
+    "temperature_setpoint_hold_duration_heat": 0,
+    "occupied_heating_setpoint_heat": 20,
+    "local_temperature_heat": 19.5,
+    "running_state_heat": "idle",
+    "system_mode_water": "heat",
+    "temperature_setpoint_hold_water": True,
+    "temperature_setpoint_hold_duration_water": 0,
+    "running_state_water": "idle",
+}
+
+
+def receiver_entry(hass: HomeAssistant, **options: Any) -> MockConfigEntry:
+    """Add a receiver config entry, an SLR2 on TOPIC unless options differ."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Hive",
+        version=CONFIG_VERSION,
+        options={CONF_MODEL: MODEL_SLR2, CONF_MQTT_TOPIC: TOPIC, **options},
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+async def async_setup_receiver(hass: HomeAssistant, entry: MockConfigEntry) -> None:
+    """Set up a receiver entry without waiting to request its state."""
+    with patch("custom_components.hive_local_thermostat.sleep", AsyncMock()):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+
+def receive(coordinator: HiveCoordinator, payload: dict[str, Any]) -> None:
+    """Deliver a JSON state report to a coordinator."""
+    coordinator.handle_mqtt_message(
+        ReceiveMessage(
+            topic=coordinator.topic,
+            payload=json.dumps(payload),
+            qos=1,
+            retain=False,
+            subscribed_topic=coordinator.topic,
+            timestamp=0.0,
+        )
+    )
+
+
+def receive_attribute(coordinator: HiveCoordinator, attribute: str, value: str) -> None:
+    """Deliver one attribute as published in attribute output mode."""
+    topic = f"{coordinator.topic}/{attribute}"
+    coordinator.handle_mqtt_attribute(
+        ReceiveMessage(
+            topic=topic,
+            payload=value,
+            qos=1,
+            retain=False,
+            subscribed_topic=f"{coordinator.topic}/+",
+            timestamp=0.0,
+        )
+    )
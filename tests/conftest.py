@@ -0,0 +1,30 @@
+"""Fixtures for Hive Local Thermostat tests."""
+
+from __future__ import annotations
+
+import pytest
+from custom_components.hive_local_thermostat.const import MODEL_SLR2
+from custom_components.hive_local_thermostat.coordinator import HiveCoordinator
+
+from homeassistant.core import HomeAssistant
+
+from .common import TOPIC
+
+
+@pytest.fixture
+def expected_lingering_timers() -> bool:
+    """Allow the MQTT client's periodic timer to outlive a test."""
+    return True
+
+
+@pytest.fixture
+def coordinator(hass: HomeAssistant) -> HiveCoordinator:
+    """Return an SLR2 coordinator that is not subscribed to MQTT."""
+    return HiveCoordinator(
+        hass,
+        "entry",
+        MODEL_SLR2,
+        TOPIC,
+        show_heat_schedule_mode=True,
+        show_water_schedule_mode=True,
+    )
@@ -0,0 +1,300 @@
+"""Hive receiver emulator for Hive Local Thermostat tests.
+
+Emulates how an SLR1, SLR2 or OTR1 receiver behind Zigbee2MQTT reacts to the
+commands sent by the coordinator, so command round trips can be exercised
+without hardware.
+
+The emulator subscribes to `<topic>/set` and `<topic>/get` and publishes its
+reports through the Home Assistant MQTT client. With the `mqtt_mock` fixture
+published messages are delivered straight back to subscribers, so commands
+and reports loop between the coordinator and the emulator.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from collections.abc import Callable
+from datetime import datetime
+from random import Random
+from typing import Any
+
+from custom_components.hive_local_thermostat.const import LOGGER, MODEL_SLR2
+from custom_components.hive_local_thermostat.coordinator import (
+    HEAT_KEYS_SLR1,
+    HEAT_KEYS_SLR2,
+    WATER_KEYS,
+    HivePayloadKeys,
+)
+
+from homeassistant.components.mqtt import client as mqtt_client
+from homeassistant.components.mqtt.models import ReceiveMessage
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util.dt import utcnow
+
+# Hold duration reported by receivers that have lost track of a boost
+BOOST_DURATION_UNKNOWN = 65535
+
+TEMPERATURE_STEP = 0.1
+
+
+def _hold_value(value: Any) -> bool:
+    """Interpret a hold flag as sent by the coordinator ("1", 1, true)."""
+    if isinstance(value, str):
+        return value.lower() in ("1", "true")
+    return bool(value)
+
+
+class HiveChannelEmulator:
+    """Emulated heating or water channel of a receiver."""
+
+    def __init__(self, keys: HivePayloadKeys, *, has_temperature: bool) -> None:
+        """Initialize the channel."""
+        self.keys = keys
+        self.has_temperature = has_temperature
+
+        self.system_mode = "heat"
+        self.hold = False
+        self.hold_duration = 0
+        self.setpoint = 20.0
+        self.local_temperature = 19.0
+
+        self.boost_started: datetime | None = None
+        self.pre_boost_system_mode = "heat"
+        self.pre_boost_hold = False
+
+    @property
+    def boost_remaining(self) -> int:
+        """Return the remaining boost minutes."""
+        if self.boost_started is None:
+            return 0
+        elapsed = (utcnow() - self.boost_started).total_seconds() / 60
+        return max(math.ceil(self.hold_duration - elapsed), 0)
+
+    @property
+    def running_state(self) -> str:
+        """Return the running state the receiver would report."""
+        if self.system_mode == "off":
+            return "off"
+        if not self.has_temperature:
+            return "heat"
+        return "heat" if self.local_temperature < self.setpoint else "idle"
+
+    def apply(self, command: dict[str, Any]) -> None:
+        """Apply a /set command to the channel."""
+        keys = self.keys
+
+        system_mode = command.get(keys.system_mode)
+        if (
+            system_mode == "emergency_heating"
+            and self.system_mode != "emergency_heating"
+        ):
+            # The boost command carries its own hold, keep the one it replaces
+            self.pre_boost_system_mode = self.system_mode
+            self.pre_boost_hold = self.hold
+
+        if keys.setpoint in command:
+            self.setpoint = float(command[keys.setpoint])
+        if keys.hold in command:
+            self.hold = _hold_value(command[keys.hold])
+        if keys.hold_duration in command:
+            self.hold_duration = int(command[keys.hold_duration])
+
+        if system_mode is None:
+            return
+
+        if system_mode == "emergency_heating":
+            self.boost_started = utcnow()
+            self.hold = True
+        else:
+            self.boost_started = None
+        self.system_mode = system_mode
+
+    def tick(self) -> None:
+        """Advance the channel, ending an expired boost and drifting temperature."""
+        if self.boost_started is not None and self.boost_remaining == 0:
+            self.system_mode = self.pre_boost_system_mode
+            self.hold = self.pre_boost_hold
+            self.hold_duration = 0
+            self.boost_started = None
+
+        if self.has_temperature:
+            if self.running_state == "heat":
+                self.local_temperature += TEMPERATURE_STEP
+            elif self.local_temperature > self.setpoint:
+                self.local_temperature -= TEMPERATURE_STEP
+            self.local_temperature = round(self.local_temperature, 2)
+
+    def report(self, *, report_unknown_boost: bool) -> dict[str, Any]:
+        """Return the payload keys reported for this channel."""
+        keys = self.keys
+        boosting = self.system_mode == "emergency_heating"
+
+        if boosting and report_unknown_boost:
+            hold_duration = BOOST_DURATION_UNKNOWN
+        elif boosting:
+            hold_duration = self.boost_remaining
+        else:
+            hold_duration = self.hold_duration
+
+        payload: dict[str, Any] = {
+            keys.system_mode: self.system_mode,
+            keys.hold: self.hold,
+            keys.hold_duration: hold_duration,
+            keys.running_state: self.running_state,
+        }
+        if self.has_temperature:
+            payload[keys.setpoint] = self.setpoint
+            payload[keys.local_temperature] = self.local_temperature
+        return payload
+
+
+class HiveReceiverEmulator:
+    """Emulated Hive receiver answering /set and /get over MQTT."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        topic: str,
+        model: str,
+        *,
+        mesh_delay: float = 0.0,
+        mesh_jitter: float = 0.0,
+        loss: float = 0.0,
+        attribute_output: bool = False,
+        report_unknown_boost: bool = False,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize the emulator.
+
+        mesh_delay and mesh_jitter are in seconds, loss is the probability
+        that a command is lost on the mesh and never applied.
+        """
+        self.hass = hass
+        self.topic = topic
+        self.model = model
+        self.mesh_delay = mesh_delay
+        self.mesh_jitter = mesh_jitter
+        self.loss = loss
+        self.attribute_output = attribute_output
+        self.report_unknown_boost = report_unknown_boost
+        self._random = Random(seed)  # noqa: S311
+
+        self.heat = HiveChannelEmulator(
+            HEAT_KEYS_SLR2 if model == MODEL_SLR2 else HEAT_KEYS_SLR1,
+            has_temperature=True,
+        )
+        self.water = (
+            HiveChannelEmulator(WATER_KEYS, has_temperature=False)
+            if model == MODEL_SLR2
+            else None
+        )
+
+        self.commands_received = 0
+        self.commands_lost = 0
+        self.reports_sent = 0
+
+        self._unsubscribes: list[CALLBACK_TYPE] = []
+
+    async def async_start(self) -> None:
+        """Subscribe to the receiver command topics."""
+        self._unsubscribes.append(
+            await mqtt_client.async_subscribe(
+                self.hass, self.topic + "/set", self.handle_set, 1
+            )
+        )
+        self._unsubscribes.append(
+            await mqtt_client.async_subscribe(
+                self.hass, self.topic + "/get", self.handle_get, 1
+            )
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Unsubscribe from the receiver command topics."""
+        while self._unsubscribes:
+            self._unsubscribes.pop()()
+
+    @property
+    def state(self) -> dict[str, Any]:
+        """Return the full state payload the receiver would publish."""
+        payload = self.heat.report(report_unknown_boost=self.report_unknown_boost)
+        if self.water is not None:
+            payload |= self.water.report(report_unknown_boost=self.report_unknown_boost)
+        return payload
+
+    @callback
+    def handle_set(self, message: ReceiveMessage) -> None:
+        """Handle a /set command from the coordinator."""
+        self.commands_received += 1
+
+        if self.loss and self._random.random() < self.loss:
+            self.commands_lost += 1
+            LOGGER.debug("Emulator dropped command to %s", self.topic)
+            return
+
+        try:
+            command: dict[str, Any] = json.loads(message.payload)
+        except json.JSONDecodeError:
+            LOGGER.warning(
+                "Emulator ignored invalid JSON on %s: %s",
+                message.topic,
+                message.payload,
+            )
+            return
+
+        self._schedule(lambda: self._apply_and_report(command))
+
+    @callback
+    def handle_get(self, message: ReceiveMessage) -> None:  # noqa: ARG002
+        """Handle a /get request from the coordinator."""
+        self._schedule(self.async_report)
+
+    @callback
+    def async_tick(self) -> None:
+        """Advance receiver time and publish a periodic report."""
+        self.heat.tick()
+        if self.water is not None:
+            self.water.tick()
+        self.async_report()
+
+    @callback
+    def async_report(self) -> None:
+        """Publish the current state as Zigbee2MQTT would."""
+        state = self.state
+        self.reports_sent += 1
+
+        if not self.attribute_output:
+            self._async_publish(self.topic, json.dumps(state))
+            return
+
+        for attribute, value in state.items():
+            if isinstance(value, bool):
+                value = str(value).lower()  # noqa: PLW2901
+            self._async_publish(f"{self.topic}/{attribute}", str(value))
+
+    def _apply_and_report(self, command: dict[str, Any]) -> None:
+        """Apply a command after the mesh delay and report the new state."""
+        self.heat.apply(command)
+        if self.water is not None:
+            self.water.apply(command)
+        self.async_report()
+
+    def _schedule(self, action: Callable[[], None]) -> None:
+        """Run an action after the emulated mesh delay."""
+        delay = self.mesh_delay
+        if self.mesh_jitter:
+            delay += self._random.uniform(0, self.mesh_jitter)
+
+        if delay <= 0:
+            action()
+            return
+
+        async_call_later(self.hass, delay, callback(lambda _now: action()))
+
+    def _async_publish(self, topic: str, payload: str) -> None:
+        """Publish a report."""
+        self.hass.async_create_task(
+            mqtt_client.async_publish(self.hass, topic, payload)
+        )
@@ -0,0 +1,81 @@
+"""Tests for the offline command queue."""
+
+from __future__ import annotations
+
+from custom_components.hive_local_thermostat.command_queue import CommandQueue
+
+MODE = "system_mode_heat"
+HOLD = "temperature_setpoint_hold_heat"
+DURATION = "temperature_setpoint_hold_duration_heat"
+SETPOINT = "occupied_heating_setpoint_heat"
+WATER_MODE = "system_mode_water"
+
+
+def queue() -> CommandQueue:
+    """Return a queue for an SLR2."""
+    return CommandQueue((MODE, WATER_MODE))
+
+
+def test_same_mode_is_merged() -> None:
+    """A mode sent in parts is replayed as one command keeping its hold."""
+    commands = queue()
+    commands.enqueue({MODE: "heat", SETPOINT: 21, HOLD: "1", DURATION: "0"})
+    commands.enqueue({MODE: "heat", SETPOINT: 21})
+
+    assert list(commands.commands) == [
+        {HOLD: "1", DURATION: "0", MODE: "heat", SETPOINT: 21}
+    ]
+    assert commands.stats.collapsed == 1
+
+
+def test_different_mode_replaces() -> None:
+    """A different mode drops the hold and boost of the mode it replaces."""
+    commands = queue()
+    commands.enqueue({MODE: "emergency_heating", DURATION: 30, HOLD: 1, SETPOINT: 22})
+    commands.enqueue({MODE: "heat", HOLD: "0", DURATION: "0"})
+
+    assert list(commands.commands) == [{MODE: "heat", HOLD: "0", DURATION: "0"}]
+
+
+def test_later_keys_win_over_merged_keys() -> None:
+    """A key queued after a merged command is not overridden by it."""
+    commands = queue()
+    commands.enqueue({MODE: "heat", HOLD: "1"})
+    commands.enqueue({HOLD: "0"})
+    commands.enqueue({MODE: "heat", SETPOINT: 21})
+
+    assert list(commands.commands) == [{HOLD: "0"}, {MODE: "heat", SETPOINT: 21}]
+
+
+def test_other_keys_are_removed_from_earlier_commands() -> None:
+    """Only the last setpoint is replayed, other channels are kept."""
+    commands = queue()
+    commands.enqueue({SETPOINT: 20})
+    commands.enqueue({WATER_MODE: "off"})
+    commands.enqueue({SETPOINT: 21})
+
+    assert list(commands.commands) == [{WATER_MODE: "off"}, {SETPOINT: 21}]
+
+
+def test_full_queue_drops_oldest() -> None:
+    """The oldest command is dropped when the queue is full."""
+    commands = CommandQueue((MODE,), maxlen=2)
+    for setpoint in (20, 21):
+        commands.enqueue({SETPOINT: setpoint})
+    commands.enqueue({WATER_MODE: "off"})
+    commands.enqueue({DURATION: "0"})
+
+    assert list(commands.commands) == [{WATER_MODE: "off"}, {DURATION: "0"}]
+    assert commands.stats.dropped == 1
+
+
+def test_requeue_goes_first() -> None:
+    """A command that failed to send is replayed before later ones."""
+    commands = queue()
+    commands.enqueue({WATER_MODE: "off"})
+    failed = commands.popleft()
+    commands.enqueue({SETPOINT: 21})
+    commands.requeue(failed)
+
+    assert list(commands.commands) == [{WATER_MODE: "off"}, {SETPOINT: 21}]
+    assert commands.stats.replayed == 1
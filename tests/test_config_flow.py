@@ -0,0 +1,70 @@
+"""Tests for the Hive Local Thermostat config flow."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+from custom_components.hive_local_thermostat.const import (
+    CONF_BASE_TOPIC,
+    CONF_MODEL,
+    CONF_MQTT_TOPIC,
+    CONF_RECEIVERS,
+    DOMAIN,
+    MODEL_SLR1,
+    MODEL_SLR2,
+)
+from custom_components.hive_local_thermostat.discovery import DiscoveredReceiver
+from pytest_homeassistant_custom_component.typing import MqttMockHAClient
+
+from homeassistant.config_entries import SOURCE_INTEGRATION_DISCOVERY, SOURCE_USER
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+HALLWAY = DiscoveredReceiver(name="Hallway", topic="z2m/Hallway", model=MODEL_SLR2)
+LANDING = DiscoveredReceiver(name="Landing", topic="z2m/Landing", model=MODEL_SLR1)
+
+
+async def test_discovered_receivers_are_confirmed(
+    hass: HomeAssistant,
+    mqtt_mock: MqttMockHAClient,
+    enable_custom_integrations: None,
+) -> None:
+    """The first selected receiver is added, the others await confirmation."""
+    with (
+        patch(
+            "custom_components.hive_local_thermostat.config_flow.async_discover_receivers",
+            AsyncMock(return_value=[HALLWAY, LANDING]),
+        ),
+        patch(
+            "custom_components.hive_local_thermostat.async_setup_entry",
+            AsyncMock(return_value=True),
+        ),
+    ):
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN, context={"source": SOURCE_USER}
+        )
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {"next_step_id": "discover"}
+        )
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {CONF_BASE_TOPIC: "z2m"}
+        )
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {CONF_RECEIVERS: [HALLWAY.topic, LANDING.topic]}
+        )
+        await hass.async_block_till_done()
+
+        assert result["type"] is FlowResultType.CREATE_ENTRY
+        assert result["options"][CONF_MQTT_TOPIC] == HALLWAY.topic
+
+        (flow,) = hass.config_entries.flow.async_progress_by_handler(DOMAIN)
+        assert flow["context"]["source"] == SOURCE_INTEGRATION_DISCOVERY
+        assert flow["step_id"] == "discovery_confirm"
+        assert len(hass.config_entries.async_entries(DOMAIN)) == 1
+
+        result = await hass.config_entries.flow.async_configure(flow["flow_id"], {})
+        await hass.async_block_till_done()
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert result["title"] == LANDING.name
+    assert result["options"][CONF_MODEL] == MODEL_SLR1
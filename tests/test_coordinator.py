@@ -0,0 +1,319 @@
+"""Tests for the Hive Local Thermostat coordinator."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import Mock
+
+import pytest
+from custom_components.hive_local_thermostat.const import (
+    CONF_MODEL,
+    CONF_MQTT_TOPIC,
+    CONF_SHOW_HEAT_SCHEDULE_MODE,
+    DOMAIN,
+    MODEL_SLR1,
+    MODEL_SLR2,
+)
+from custom_components.hive_local_thermostat.coordinator import (
+    HiveCoordinator,
+    detect_model,
+)
+from custom_components.hive_local_thermostat.latency import (
+    COMMAND_MODE,
+    COMMAND_TIMEOUT,
+)
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.typing import MqttMockHAClient
+
+from homeassistant.components.climate import HVACMode
+from homeassistant.components.mqtt.models import ReceiveMessage
+from homeassistant.core import HomeAssistant
+
+from .common import SLR2_IDLE, TOPIC, receive, receive_attribute
+
+
+def test_partial_report_merges_into_state(coordinator: HiveCoordinator) -> None:
+    """A partial report only changes the values it carries."""
+    receive(coordinator, SLR2_IDLE)
+    receive(coordinator, {"local_temperature_heat": 20.5})
+
+    assert coordinator.current_temperature == 20.5
+    assert coordinator.target_temperature == 20
+    assert coordinator.water_mode == "heat"
+
+
+def test_heat_correction_still_records_water_boost(
+    coordinator: HiveCoordinator,
+) -> None:
+    """A water boost in a report needing a heat correction is recorded."""
+    receive(coordinator, SLR2_IDLE)
+    receive(
+        coordinator,
+        {
+            "system_mode_heat": "emergency_heating",
+            "temperature_setpoint_hold_duration_heat": 65535,
+            "system_mode_water": "emergency_heating",
+            "temperature_setpoint_hold_duration_water": 30,
+        },
+    )
+
+    assert coordinator.heat_boost_remaining == 0
+    assert coordinator.water_boost
+    assert coordinator.water_boost_remaining == 30
+    assert coordinator.water_boost_started is not None
+    assert coordinator.water_boost_started_duration == 30
+
+
+def test_attributes_are_decoded(coordinator: HiveCoordinator) -> None:
+    """Attributes published on their own topics are decoded and merged."""
+    coordinator.attribute_output = True
+    receive(coordinator, SLR2_IDLE)
+
+    receive_attribute(coordinator, "local_temperature_heat", "20.5")
+    receive_attribute(coordinator, "temperature_setpoint_hold_heat", "false")
+    receive_attribute(coordinator, "linkquality", "120")
+
+    assert coordinator.current_temperature == 20.5
+    assert coordinator.hvac_mode == HVACMode.AUTO
+    assert coordinator.reported_state["temperature_setpoint_hold_heat"] is False
+    assert "linkquality" not in coordinator.reported_state
+
+
+def test_undecodable_attribute_is_rejected(coordinator: HiveCoordinator) -> None:
+    """An attribute that cannot be decoded leaves the state unchanged."""
+    coordinator.attribute_output = True
+    receive(coordinator, SLR2_IDLE)
+
+    receive_attribute(coordinator, "local_temperature_heat", "warm")
+
+    assert coordinator.current_temperature == 19.5
+    assert coordinator.errors.totals == {"invalid_local_temperature_heat": 1}
+
+
+def test_schedule_change_is_timed_by_hold(coordinator: HiveCoordinator) -> None:
+    """Switching HEAT to AUTO only changes the hold, which is tracked."""
+    receive(coordinator, SLR2_IDLE)
+    coordinator.track_command(
+        {
+            "system_mode_heat": "heat",
+            "temperature_setpoint_hold_heat": "0",
+            "temperature_setpoint_hold_duration_heat": "0",
+        }
+    )
+    receive(coordinator, {"local_temperature_heat": 19.6})
+
+    assert coordinator.latency.pending
+    assert coordinator.latency.stats[COMMAND_MODE].confirmed == 0
+
+    receive(coordinator, {"temperature_setpoint_hold_heat": False})
+
+    assert not coordinator.latency.pending
+    assert coordinator.latency.stats[COMMAND_MODE].confirmed == 1
+
+
+def test_lost_command_does_not_block_suppression(
+    coordinator: HiveCoordinator,
+) -> None:
+    """A command that timed out no longer stops redundant commands being dropped."""
+    receive(coordinator, SLR2_IDLE)
+    coordinator.track_command({"occupied_heating_setpoint_heat": 21})
+    assert not coordinator.command_redundant({"occupied_heating_setpoint_heat": 20})
+
+    for pending in coordinator.latency.pending:
+        pending.sent -= COMMAND_TIMEOUT + 1
+
+    assert coordinator.command_redundant({"occupied_heating_setpoint_heat": "20"})
+    assert coordinator.latency.lost == 1
+
+
+async def test_schedule_visibility_is_applied_in_place(
+    coordinator: HiveCoordinator,
+) -> None:
+    """Hiding the schedule mode remaps the reported mode without a reload."""
+    receive(coordinator, {**SLR2_IDLE, "temperature_setpoint_hold_heat": False})
+
+    assert coordinator.hvac_mode == HVACMode.AUTO
+
+    await coordinator.async_apply_options(
+        {CONF_MQTT_TOPIC: TOPIC, CONF_SHOW_HEAT_SCHEDULE_MODE: False}
+    )
+
+    assert coordinator.hvac_mode == HVACMode.HEAT
+    assert coordinator.water_mode == "heat"
+
+
+async def test_topic_change_forgets_old_receiver(
+    coordinator: HiveCoordinator, mqtt_mock: MqttMockHAClient
+) -> None:
+    """A new topic drops the old topic's reports and asks for the new state."""
+    receive(coordinator, SLR2_IDLE)
+
+    await coordinator.async_apply_options({CONF_MQTT_TOPIC: "zigbee2mqtt/other"})
+
+    assert coordinator.topic == "zigbee2mqtt/other"
+    assert not coordinator.reported_state
+    assert coordinator.last_report is None
+    assert coordinator.cached
+    assert mqtt_mock.async_publish.call_args.args[0] == "zigbee2mqtt/other/get"
+
+    receive(coordinator, SLR2_IDLE)
+
+    assert not coordinator.cached
+    coordinator.async_unsubscribe()
+
+
+def test_receiver_without_reports_goes_stale(coordinator: HiveCoordinator) -> None:
+    """No report within the stale timeout makes the receiver unavailable."""
+    changes = Mock()
+    coordinator.async_add_availability_listener(changes)
+    receive(coordinator, SLR2_IDLE)
+    reported = coordinator.last_report
+
+    coordinator.check_stale(reported + timedelta(minutes=59))
+
+    assert coordinator.available
+
+    coordinator.check_stale(reported + timedelta(minutes=61))
+
+    assert not coordinator.available
+    receive(coordinator, {"local_temperature_heat": 20})
+    assert coordinator.available
+    assert changes.call_count == 2
+
+
+@pytest.mark.parametrize("payload", ["offline", '{"state": "offline"}'])
+def test_availability_topic_marks_offline(
+    coordinator: HiveCoordinator, payload: str
+) -> None:
+    """Both Zigbee2MQTT availability formats are understood."""
+    receive(coordinator, SLR2_IDLE)
+
+    coordinator.handle_mqtt_availability(
+        ReceiveMessage(
+            topic=coordinator.topic_availability,
+            payload=payload,
+            qos=1,
+            retain=True,
+            subscribed_topic=coordinator.topic_availability,
+            timestamp=0.0,
+        )
+    )
+
+    assert coordinator.online is False
+    assert not coordinator.available
+
+
+def published(mqtt_mock: MqttMockHAClient) -> list[str]:
+    """Return the payloads published to the receiver's set topic."""
+    return [
+        call.args[1]
+        for call in mqtt_mock.async_publish.call_args_list
+        if call.args[0] == f"{TOPIC}/set"
+    ]
+
+
+async def test_command_matching_state_is_suppressed(
+    coordinator: HiveCoordinator, mqtt_mock: MqttMockHAClient
+) -> None:
+    """A command the receiver already reflects is not published."""
+    receive(coordinator, SLR2_IDLE)
+
+    await coordinator.async_set_temperature(20)
+
+    assert not published(mqtt_mock)
+    assert coordinator.commands_suppressed == 1
+
+
+async def test_forced_command_is_sent(
+    coordinator: HiveCoordinator, mqtt_mock: MqttMockHAClient
+) -> None:
+    """A forced command is published even when it looks redundant."""
+    receive(coordinator, SLR2_IDLE)
+
+    await coordinator.async_set_temperature(20, force=True)
+
+    assert published(mqtt_mock) == ['{"occupied_heating_setpoint_heat":20}']
+    assert coordinator.commands_suppressed == 0
+
+
+async def test_command_reverting_pending_one_is_sent(
+    coordinator: HiveCoordinator, mqtt_mock: MqttMockHAClient
+) -> None:
+    """A command is not suppressed while another is in flight."""
+    receive(coordinator, SLR2_IDLE)
+
+    await coordinator.async_set_temperature(21)
+    await coordinator.async_set_temperature(20)
+
+    assert published(mqtt_mock) == [
+        '{"occupied_heating_setpoint_heat":21}',
+        '{"occupied_heating_setpoint_heat":20}',
+    ]
+
+
+async def test_cached_state_does_not_suppress(
+    coordinator: HiveCoordinator, mqtt_mock: MqttMockHAClient
+) -> None:
+    """State seeded from the cache is not trusted to suppress commands."""
+    receive(coordinator, SLR2_IDLE)
+    coordinator.cached = True
+
+    await coordinator.async_set_temperature(20)
+
+    assert len(published(mqtt_mock)) == 1
+
+
+@pytest.mark.parametrize(
+    ("payload", "model"),
+    [
+        (SLR2_IDLE, MODEL_SLR2),
+        ({"system_mode_water": "off"}, MODEL_SLR2),
+        ({"local_temperature_heat": 19}, MODEL_SLR2),
+        ({"system_mode": "heat", "local_temperature": 19}, MODEL_SLR1),
+        ({"linkquality": 120}, None),
+    ],
+)
+def test_detect_model(payload: dict, model: str | None) -> None:
+    """The model is judged by the keys of a payload."""
+    assert detect_model(payload) == model
+
+
+def slr1_receiver(hass: HomeAssistant) -> tuple[HiveCoordinator, MockConfigEntry]:
+    """Return a receiver configured as an SLR1 and its config entry."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, options={CONF_MODEL: MODEL_SLR1, CONF_MQTT_TOPIC: TOPIC}
+    )
+    entry.add_to_hass(hass)
+    coordinator = HiveCoordinator(
+        hass,
+        entry.entry_id,
+        MODEL_SLR1,
+        TOPIC,
+        show_heat_schedule_mode=True,
+        show_water_schedule_mode=True,
+    )
+    coordinator.config_entry = entry
+    return coordinator, entry
+
+
+async def test_first_payload_switches_model(hass: HomeAssistant) -> None:
+    """A first payload from another model switches the entry to that model."""
+    coordinator, entry = slr1_receiver(hass)
+
+    receive(coordinator, SLR2_IDLE)
+
+    assert entry.options[CONF_MODEL] == MODEL_SLR2
+    assert coordinator.model_switching
+    assert not coordinator.reported_state
+
+
+async def test_model_is_kept_after_valid_report(hass: HomeAssistant) -> None:
+    """Once a valid report was seen, mismatching payloads are only rejected."""
+    coordinator, entry = slr1_receiver(hass)
+    receive(coordinator, {"system_mode": "heat", "local_temperature": 19})
+
+    receive(coordinator, SLR2_IDLE)
+
+    assert entry.options[CONF_MODEL] == MODEL_SLR1
+    assert not coordinator.model_switching
+    assert coordinator.validator.rejected_payloads == 1
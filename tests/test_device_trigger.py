@@ -0,0 +1,138 @@
+"""Tests for the device triggers fired by a receiver's coordinator."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from custom_components.hive_local_thermostat.const import (
+    SIGNAL_TRIGGER,
+    TRIGGER_HEAT_BOOST_ENDED,
+    TRIGGER_HEAT_BOOST_STARTED,
+    TRIGGER_HEATING_STARTED,
+    TRIGGER_HEATING_STOPPED,
+    TRIGGER_HVAC_MODE_CHANGED,
+    TRIGGER_WATER_BOOST_ENDED,
+    TRIGGER_WATER_BOOST_STARTED,
+)
+from custom_components.hive_local_thermostat.coordinator import HiveCoordinator
+from pytest_homeassistant_custom_component.typing import MqttMockHAClient
+
+from homeassistant.components.climate import HVACMode
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .common import SLR2_IDLE, receive
+
+TRIGGER_TYPES = (
+    TRIGGER_HEAT_BOOST_STARTED,
+    TRIGGER_HEAT_BOOST_ENDED,
+    TRIGGER_HEATING_STARTED,
+    TRIGGER_HEATING_STOPPED,
+    TRIGGER_HVAC_MODE_CHANGED,
+    TRIGGER_WATER_BOOST_STARTED,
+    TRIGGER_WATER_BOOST_ENDED,
+)
+
+HEAT_BOOST = {
+    "system_mode_heat": "emergency_heating",
+    "temperature_setpoint_hold_duration_heat": 30,
+    "occupied_heating_setpoint_heat": 22,
+}
+
+
+@pytest.fixture
+def fired(
+    hass: HomeAssistant, coordinator: HiveCoordinator
+) -> list[tuple[str, dict[str, Any]]]:
+    """Return the triggers fired by the coordinator, in order."""
+    fired: list[tuple[str, dict[str, Any]]] = []
+    for trigger_type in TRIGGER_TYPES:
+
+        @callback
+        def _async_fired(
+            data: dict[str, Any], trigger_type: str = trigger_type
+        ) -> None:
+            fired.append((trigger_type, data))
+
+        async_dispatcher_connect(
+            hass,
+            SIGNAL_TRIGGER.format(coordinator.entry_id, trigger_type),
+            _async_fired,
+        )
+    return fired
+
+
+async def test_first_report_does_not_fire(
+    coordinator: HiveCoordinator, fired: list
+) -> None:
+    """The first report after startup is not a transition."""
+    receive(coordinator, {**SLR2_IDLE, **HEAT_BOOST})
+
+    assert not fired
+
+
+async def test_reported_transitions_fire(
+    coordinator: HiveCoordinator, fired: list
+) -> None:
+    """Transitions between live reports fire their triggers."""
+    receive(coordinator, SLR2_IDLE)
+
+    receive(coordinator, {"running_state_heat": "heat"})
+    receive(coordinator, {"temperature_setpoint_hold_heat": False})
+    receive(
+        coordinator,
+        {
+            "system_mode_water": "emergency_heating",
+            "temperature_setpoint_hold_duration_water": 30,
+        },
+    )
+
+    assert fired == [
+        (TRIGGER_HEATING_STARTED, {}),
+        (TRIGGER_HVAC_MODE_CHANGED, {"from": HVACMode.HEAT, "to": HVACMode.AUTO}),
+        (TRIGGER_WATER_BOOST_STARTED, {}),
+    ]
+
+
+async def test_boost_fires_when_confirmed(
+    coordinator: HiveCoordinator, fired: list, mqtt_mock: MqttMockHAClient
+) -> None:
+    """A boost sent from Home Assistant fires when the receiver reports it."""
+    receive(coordinator, SLR2_IDLE)
+
+    await coordinator.async_heating_boost(30, 22)
+
+    assert not fired
+
+    receive(coordinator, HEAT_BOOST)
+    receive(coordinator, {"system_mode_heat": "heat"})
+
+    assert fired == [(TRIGGER_HEAT_BOOST_STARTED, {}), (TRIGGER_HEAT_BOOST_ENDED, {})]
+
+
+async def test_rejected_commands_do_not_fire(
+    coordinator: HiveCoordinator, fired: list, mqtt_mock: MqttMockHAClient
+) -> None:
+    """Commands the receiver never applies fire nothing."""
+    receive(coordinator, SLR2_IDLE)
+
+    await coordinator.async_heating_boost(30, 22)
+    await coordinator.async_water_boost(30)
+    await coordinator.async_set_hvac_mode_auto()
+    receive(coordinator, {"local_temperature_heat": 19.6})
+
+    assert not fired
+
+
+async def test_unknown_running_state_is_not_heating(
+    coordinator: HiveCoordinator, fired: list
+) -> None:
+    """Losing the running state stops heating, it never starts it."""
+    receive(coordinator, SLR2_IDLE)
+
+    receive(coordinator, {"running_state_heat": None})
+    receive(coordinator, {"running_state_heat": "heat"})
+    receive(coordinator, {"running_state_heat": None})
+
+    assert fired == [(TRIGGER_HEATING_STARTED, {}), (TRIGGER_HEATING_STOPPED, {})]
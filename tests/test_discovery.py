@@ -0,0 +1,83 @@
+"""Tests for discovering receivers from Zigbee2MQTT's device list."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from custom_components.hive_local_thermostat.const import (
+    MODEL_OTR1,
+    MODEL_SLR1,
+    MODEL_SLR2,
+)
+from custom_components.hive_local_thermostat.discovery import (
+    DiscoveredReceiver,
+    iter_json_array,
+    parse_bridge_devices,
+)
+
+
+@pytest.mark.parametrize(
+    ("payload", "elements"),
+    [
+        ("[]", []),
+        (" [ ] ", []),
+        ('[1, "two", {"three": [3]}]', [1, "two", {"three": [3]}]),
+        ('\n[\n  {"a": 1},\n  {"b": 2}\n]\n', [{"a": 1}, {"b": 2}]),
+    ],
+)
+def test_iter_json_array(payload: str, elements: list) -> None:
+    """Elements are decoded one at a time, whitespace is skipped."""
+    assert list(iter_json_array(payload)) == elements
+
+
+@pytest.mark.parametrize(
+    "payload",
+    ["", "{}", "[", "[1,", "[1 2]", "[1,]", '[{"a": }]'],
+)
+def test_iter_json_array_malformed(payload: str) -> None:
+    """Anything but a complete JSON array raises ValueError."""
+    with pytest.raises(ValueError):  # noqa: PT011
+        list(iter_json_array(payload))
+
+
+def test_parse_bridge_devices() -> None:
+    """Only Hive receivers are returned, named by friendly name."""
+    payload = json.dumps(
+        [
+            {"friendly_name": "Coordinator", "type": "Coordinator"},
+            {
+                "friendly_name": "Hallway",
+                "definition": {"vendor": "Hive", "model": "SLR2b"},
+            },
+            {
+                "ieee_address": "0x0001",
+                "definition": {"vendor": "Hive", "model": MODEL_SLR1},
+            },
+            {
+                "friendly_name": "Boiler",
+                "definition": {"vendor": "Hive", "model": MODEL_OTR1},
+            },
+            {
+                "friendly_name": "Remote",
+                "definition": {"vendor": "Hive", "model": "UK7004240"},
+            },
+            {
+                "friendly_name": "Other",
+                "definition": {"vendor": "Other", "model": MODEL_SLR2},
+            },
+            "not a device",
+        ]
+    )
+
+    assert parse_bridge_devices(payload, "z2m") == [
+        DiscoveredReceiver(name="Hallway", topic="z2m/Hallway", model=MODEL_SLR2),
+        DiscoveredReceiver(name="0x0001", topic="z2m/0x0001", model=MODEL_SLR1),
+        DiscoveredReceiver(name="Boiler", topic="z2m/Boiler", model=MODEL_OTR1),
+    ]
+
+
+def test_parse_bridge_devices_malformed() -> None:
+    """A truncated device list raises ValueError."""
+    with pytest.raises(ValueError, match="Unterminated"):
+        parse_bridge_devices('[{"friendly_name": "Hallway"}, ', "z2m")
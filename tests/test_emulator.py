@@ -0,0 +1,179 @@
+"""Closed-loop tests driving the coordinator against the receiver emulator."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator
+from datetime import timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from custom_components.hive_local_thermostat.const import MODEL_SLR2
+from custom_components.hive_local_thermostat.coordinator import HiveCoordinator
+from custom_components.hive_local_thermostat.latency import COMMAND_BOOST
+from pytest_homeassistant_custom_component.common import async_fire_mqtt_message
+from pytest_homeassistant_custom_component.typing import MqttMockHAClient
+
+from homeassistant.components.climate import HVACMode
+from homeassistant.core import HomeAssistant
+
+from .common import TOPIC
+from .emulator import HiveReceiverEmulator
+
+
+async def start(
+    hass: HomeAssistant, *, attribute_output: bool = False
+) -> tuple[HiveCoordinator, HiveReceiverEmulator]:
+    """Return a subscribed SLR2 coordinator and the emulated receiver."""
+    coordinator = HiveCoordinator(
+        hass,
+        "entry",
+        MODEL_SLR2,
+        TOPIC,
+        show_heat_schedule_mode=True,
+        show_water_schedule_mode=True,
+        attribute_output=attribute_output,
+    )
+    emulator = HiveReceiverEmulator(
+        hass, TOPIC, MODEL_SLR2, attribute_output=attribute_output
+    )
+    await emulator.async_start()
+    await coordinator.async_subscribe()
+    await coordinator.async_request_state()
+    await hass.async_block_till_done()
+    return coordinator, emulator
+
+
+@pytest.fixture
+async def receiver(
+    hass: HomeAssistant, mqtt_mock: MqttMockHAClient
+) -> AsyncGenerator[tuple[HiveCoordinator, HiveReceiverEmulator]]:
+    """Return a coordinator following an emulated receiver."""
+    coordinator, emulator = await start(hass)
+    yield coordinator, emulator
+    coordinator.async_unsubscribe()
+    emulator.async_stop()
+
+
+async def test_initial_state(
+    receiver: tuple[HiveCoordinator, HiveReceiverEmulator],
+) -> None:
+    """The state requested at startup is reported by the receiver."""
+    coordinator, _ = receiver
+
+    assert coordinator.hvac_mode == HVACMode.AUTO
+    assert coordinator.target_temperature == 20
+    assert coordinator.current_temperature == 19
+    assert coordinator.water_mode == "auto"
+
+
+async def test_heating_boost_round_trip(
+    hass: HomeAssistant,
+    receiver: tuple[HiveCoordinator, HiveReceiverEmulator],
+) -> None:
+    """A boost is confirmed by the receiver and ends when it runs out."""
+    coordinator, emulator = receiver
+
+    await coordinator.async_heating_boost(30, 22)
+    await hass.async_block_till_done()
+
+    assert emulator.heat.system_mode == "emergency_heating"
+    assert coordinator.heat_boost
+    assert coordinator.heat_boost_remaining == 30
+    assert coordinator.target_temperature == 22
+    assert coordinator.latency.stats[COMMAND_BOOST].confirmed == 1
+
+    assert emulator.heat.boost_started is not None
+    emulator.heat.boost_started -= timedelta(minutes=31)
+    emulator.async_tick()
+    await hass.async_block_till_done()
+
+    assert not coordinator.heat_boost
+    assert coordinator.heat_boost_started is None
+    assert coordinator.hvac_mode == HVACMode.AUTO
+
+
+async def test_heating_boost_cancel(
+    hass: HomeAssistant,
+    receiver: tuple[HiveCoordinator, HiveReceiverEmulator],
+) -> None:
+    """Cancelling a boost restores the mode the receiver had before."""
+    coordinator, emulator = receiver
+
+    await coordinator.async_heating_boost(30, 22)
+    await hass.async_block_till_done()
+    await coordinator.async_heating_boost_cancel()
+    await hass.async_block_till_done()
+
+    assert emulator.heat.system_mode == "heat"
+    assert not emulator.heat.hold
+    assert not coordinator.heat_boost
+    assert coordinator.hvac_mode == HVACMode.AUTO
+
+
+async def test_water_boost_round_trip(
+    hass: HomeAssistant,
+    receiver: tuple[HiveCoordinator, HiveReceiverEmulator],
+) -> None:
+    """A water boost is confirmed by the receiver and can be cancelled."""
+    coordinator, emulator = receiver
+
+    await coordinator.async_water_boost(45)
+    await hass.async_block_till_done()
+
+    assert coordinator.water_boost
+    assert coordinator.water_mode == "boost"
+    assert coordinator.water_boost_remaining == 45
+
+    await coordinator.async_water_boost_cancel()
+    await hass.async_block_till_done()
+
+    assert emulator.water is not None
+    assert emulator.water.system_mode == "heat"
+    assert not coordinator.water_boost
+    assert coordinator.water_mode == "auto"
+
+
+async def test_queued_heat_mode_keeps_hold(
+    hass: HomeAssistant,
+    receiver: tuple[HiveCoordinator, HiveReceiverEmulator],
+) -> None:
+    """Heat mode queued while offline is replayed with its hold."""
+    coordinator, emulator = receiver
+    availability = f"{TOPIC}/availability"
+
+    async_fire_mqtt_message(hass, availability, "offline")
+    await hass.async_block_till_done()
+    with patch(
+        "custom_components.hive_local_thermostat.coordinator.sleep", AsyncMock()
+    ):
+        await coordinator.async_set_hvac_mode_heat(21)
+        assert len(coordinator.command_queue) == 1
+
+        async_fire_mqtt_message(hass, availability, "online")
+        await coordinator.async_replay_commands()
+        await hass.async_block_till_done()
+
+    assert not coordinator.command_queue
+    assert emulator.heat.system_mode == "heat"
+    assert emulator.heat.hold
+    assert emulator.heat.hold_duration == 0
+    assert emulator.heat.setpoint == 21
+    assert coordinator.hvac_mode == HVACMode.HEAT
+    assert coordinator.target_temperature == 21
+
+
+async def test_attribute_output_round_trip(
+    hass: HomeAssistant, mqtt_mock: MqttMockHAClient
+) -> None:
+    """Receivers publishing one topic per attribute are followed too."""
+    coordinator, emulator = await start(hass, attribute_output=True)
+
+    assert coordinator.hvac_mode == HVACMode.AUTO
+
+    await coordinator.async_set_temperature(21.5)
+    await hass.async_block_till_done()
+
+    assert coordinator.target_temperature == 21.5
+
+    coordinator.async_unsubscribe()
+    emulator.async_stop()
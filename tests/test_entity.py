@@ -0,0 +1,76 @@
+"""Tests for the temperature deadband and heartbeat of receiver entities."""
+
+from __future__ import annotations
+
+import json
+from datetime import timedelta
+from unittest.mock import patch
+
+from custom_components.hive_local_thermostat.const import (
+    CONF_TEMPERATURE_DEADBAND,
+    CONF_TEMPERATURE_HEARTBEAT,
+)
+from pytest_homeassistant_custom_component.common import async_fire_mqtt_message
+from pytest_homeassistant_custom_component.typing import MqttMockHAClient
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util.dt import utcnow
+
+from .common import SLR2_IDLE, TOPIC, async_setup_receiver, receiver_entry
+
+SENSOR = "sensor.hive_current_temperature"
+CLIMATE = "climate.hive_climate"
+
+
+async def report_temperature(hass: HomeAssistant, temperature: float) -> None:
+    """Publish a temperature report from the receiver."""
+    async_fire_mqtt_message(
+        hass, TOPIC, json.dumps({**SLR2_IDLE, "local_temperature_heat": temperature})
+    )
+    await hass.async_block_till_done()
+
+
+async def test_small_changes_wait_for_heartbeat(
+    hass: HomeAssistant,
+    mqtt_mock: MqttMockHAClient,
+    enable_custom_integrations: None,
+) -> None:
+    """Changes within the deadband are written once the heartbeat is due."""
+    entry = receiver_entry(
+        hass, **{CONF_TEMPERATURE_DEADBAND: 0.5, CONF_TEMPERATURE_HEARTBEAT: 15}
+    )
+    await async_setup_receiver(hass, entry)
+
+    await report_temperature(hass, 19.5)
+    await report_temperature(hass, 19.7)
+
+    assert hass.states.get(SENSOR).state == "19.5"
+    assert hass.states.get(CLIMATE).attributes["current_temperature"] == 19.5
+
+    await report_temperature(hass, 20.0)
+
+    assert hass.states.get(SENSOR).state == "20.0"
+
+    with patch(
+        "custom_components.hive_local_thermostat.entity.utcnow",
+        return_value=utcnow() + timedelta(minutes=16),
+    ):
+        await report_temperature(hass, 20.1)
+
+    assert hass.states.get(SENSOR).state == "20.1"
+    assert hass.states.get(CLIMATE).attributes["current_temperature"] == 20.1
+
+
+async def test_no_deadband_writes_every_change(
+    hass: HomeAssistant,
+    mqtt_mock: MqttMockHAClient,
+    enable_custom_integrations: None,
+) -> None:
+    """A deadband of zero writes every reported temperature."""
+    entry = receiver_entry(hass, **{CONF_TEMPERATURE_DEADBAND: 0})
+    await async_setup_receiver(hass, entry)
+
+    await report_temperature(hass, 19.5)
+    await report_temperature(hass, 19.6)
+
+    assert hass.states.get(SENSOR).state == "19.6"
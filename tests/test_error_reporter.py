@@ -0,0 +1,61 @@
+"""Tests for rate-limited error reporting and repair issues."""
+
+from __future__ import annotations
+
+import pytest
+from custom_components.hive_local_thermostat.const import (
+    DOMAIN,
+    REPAIR_ISSUE_THRESHOLD,
+)
+from custom_components.hive_local_thermostat.coordinator import HiveCoordinator
+from custom_components.hive_local_thermostat.error_reporter import (
+    ISSUE_MODEL_MISMATCH,
+    ErrorReporter,
+    issue_id,
+)
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import issue_registry as ir
+
+from .common import SLR2_IDLE, receive
+
+SLR1_REPORT = {"system_mode": "heat", "local_temperature": 19}
+
+
+async def test_repeated_errors_are_counted_not_logged(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Only the first error for a reason is logged within the interval."""
+    errors = ErrorReporter(hass, "entry", "zigbee2mqtt/receiver")
+
+    for _ in range(3):
+        errors.error("bad", "Bad payload %s", "x")
+    errors.error("other", "Other problem")
+
+    assert caplog.text.count("Bad payload x") == 1
+    assert caplog.text.count("Other problem") == 1
+    assert errors.totals == {"bad": 3, "other": 1}
+    assert errors.as_dict()["suppressed"] == {"bad": 2, "other": 0}
+
+
+async def test_wrong_model_raises_repair_issue(
+    hass: HomeAssistant,
+    coordinator: HiveCoordinator,
+    issue_registry: ir.IssueRegistry,
+) -> None:
+    """Repeated payloads of another model raise an issue until one fits."""
+    receive(coordinator, SLR2_IDLE)
+    issue = issue_id(ISSUE_MODEL_MISMATCH, coordinator.entry_id)
+
+    for _ in range(REPAIR_ISSUE_THRESHOLD - 1):
+        receive(coordinator, SLR1_REPORT)
+
+    assert issue_registry.async_get_issue(DOMAIN, issue) is None
+
+    receive(coordinator, SLR1_REPORT)
+
+    assert issue_registry.async_get_issue(DOMAIN, issue) is not None
+
+    receive(coordinator, SLR2_IDLE)
+
+    assert issue_registry.async_get_issue(DOMAIN, issue) is None
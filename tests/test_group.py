@@ -0,0 +1,166 @@
+"""Tests for Zigbee2MQTT groups of receivers."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock, patch
+
+from custom_components.hive_local_thermostat.const import (
+    CONF_ENTRY_TYPE,
+    CONF_MEMBERS,
+    CONF_MODEL,
+    CONF_MQTT_TOPIC,
+    CONFIG_VERSION,
+    DOMAIN,
+    ENTRY_TYPE_GROUP,
+    MODEL_SLR2,
+)
+from custom_components.hive_local_thermostat.coordinator import HiveCoordinator
+from custom_components.hive_local_thermostat.group import HiveGroupCoordinator
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.typing import MqttMockHAClient
+
+from homeassistant.components.climate import HVACMode
+from homeassistant.core import HomeAssistant
+
+from .common import SLR2_IDLE, TOPIC, receive
+
+HEAT_BOOST = {
+    "system_mode_heat": "emergency_heating",
+    "temperature_setpoint_hold_duration_heat": 30,
+    "occupied_heating_setpoint_heat": 25,
+}
+
+
+async def group_of(
+    hass: HomeAssistant, *reports: dict
+) -> tuple[HiveGroupCoordinator, list[HiveCoordinator]]:
+    """Return a group of receivers that reported the given states."""
+    members = []
+    for number, report in enumerate(reports):
+        member = HiveCoordinator(
+            hass,
+            f"member{number}",
+            MODEL_SLR2,
+            f"zigbee2mqtt/receiver{number}",
+            show_heat_schedule_mode=True,
+            show_water_schedule_mode=True,
+        )
+        receive(member, report)
+        members.append(member)
+
+    group = HiveGroupCoordinator(
+        hass,
+        "group",
+        MODEL_SLR2,
+        "zigbee2mqtt/group",
+        show_heat_schedule_mode=True,
+        show_water_schedule_mode=True,
+        members=members,
+    )
+    await group.async_subscribe()
+    return group, members
+
+
+def sent(mqtt_mock: MqttMockHAClient) -> dict[str, list[dict]]:
+    """Return the commands published, by topic."""
+    commands: dict[str, list[dict]] = {}
+    for call in mqtt_mock.async_publish.call_args_list:
+        topic, payload = call.args[:2]
+        if topic.endswith("/set"):
+            commands.setdefault(topic, []).append(json.loads(payload))
+    return commands
+
+
+async def test_members_are_aggregated(hass: HomeAssistant) -> None:
+    """Modes are shown when members agree and setpoints are averaged."""
+    group, members = await group_of(
+        hass, SLR2_IDLE, {**SLR2_IDLE, "occupied_heating_setpoint_heat": 21}
+    )
+
+    assert group.hvac_mode == HVACMode.HEAT
+    assert group.target_temperature == 20.5
+
+    receive(members[1], {"temperature_setpoint_hold_heat": False})
+
+    assert group.hvac_mode is None
+
+
+async def test_boost_cancel_restores_each_member(
+    hass: HomeAssistant, mqtt_mock: MqttMockHAClient
+) -> None:
+    """Each member is restored to its own mode and setpoint."""
+    group, members = await group_of(
+        hass,
+        SLR2_IDLE,
+        {
+            **SLR2_IDLE,
+            "temperature_setpoint_hold_heat": False,
+            "occupied_heating_setpoint_heat": 18,
+        },
+    )
+    for member in members:
+        receive(member, HEAT_BOOST)
+    assert group.heat_boost
+    assert group.pre_boost_hvac_mode is None
+
+    with patch(
+        "custom_components.hive_local_thermostat.coordinator.sleep", AsyncMock()
+    ):
+        await group.async_heating_boost_cancel()
+
+    commands = sent(mqtt_mock)
+    assert "zigbee2mqtt/group/set" not in commands
+    assert commands["zigbee2mqtt/receiver0/set"][0] == {
+        "system_mode_heat": "heat",
+        "occupied_heating_setpoint_heat": 20,
+        "temperature_setpoint_hold_heat": "1",
+        "temperature_setpoint_hold_duration_heat": "0",
+    }
+    assert commands["zigbee2mqtt/receiver1/set"] == [
+        {
+            "system_mode_heat": "heat",
+            "temperature_setpoint_hold_heat": "0",
+            "temperature_setpoint_hold_duration_heat": "0",
+        }
+    ]
+
+
+async def test_member_reload_reloads_group_once(
+    hass: HomeAssistant,
+    mqtt_mock: MqttMockHAClient,
+    enable_custom_integrations: None,
+) -> None:
+    """Reloading the group does not leave callbacks behind on its members."""
+    member = MockConfigEntry(
+        domain=DOMAIN,
+        title="Receiver",
+        version=CONFIG_VERSION,
+        options={CONF_MODEL: MODEL_SLR2, CONF_MQTT_TOPIC: TOPIC},
+    )
+    member.add_to_hass(hass)
+    with patch("custom_components.hive_local_thermostat.sleep", AsyncMock()):
+        assert await hass.config_entries.async_setup(member.entry_id)
+        group = MockConfigEntry(
+            domain=DOMAIN,
+            title="Group",
+            version=CONFIG_VERSION,
+            options={
+                CONF_ENTRY_TYPE: ENTRY_TYPE_GROUP,
+                CONF_MODEL: MODEL_SLR2,
+                CONF_MQTT_TOPIC: "zigbee2mqtt/group",
+                CONF_MEMBERS: [member.entry_id],
+            },
+        )
+        group.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(group.entry_id)
+        assert await hass.config_entries.async_reload(group.entry_id)
+        assert await hass.config_entries.async_reload(group.entry_id)
+
+        with patch.object(
+            hass.config_entries, "async_schedule_reload"
+        ) as schedule_reload:
+            assert await hass.config_entries.async_reload(member.entry_id)
+        await hass.async_block_till_done()
+
+    schedule_reload.assert_called_once_with(group.entry_id)
@@ -0,0 +1,123 @@
+"""Tests for the house totals aggregated from all receivers."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+from custom_components.hive_local_thermostat.const import MODEL_SLR2
+from custom_components.hive_local_thermostat.coordinator import HiveCoordinator
+from custom_components.hive_local_thermostat.house import HiveHouseCoordinator
+
+from homeassistant.core import HomeAssistant
+
+from .common import SLR2_IDLE, receive
+
+
+def receiver(hass: HomeAssistant, number: int, temperature: float) -> HiveCoordinator:
+    """Return a receiver that reported a temperature."""
+    coordinator = HiveCoordinator(
+        hass,
+        f"receiver{number}",
+        MODEL_SLR2,
+        f"zigbee2mqtt/receiver{number}",
+        show_heat_schedule_mode=True,
+        show_water_schedule_mode=True,
+    )
+    receive(coordinator, {**SLR2_IDLE, "local_temperature_heat": temperature})
+    return coordinator
+
+
+async def test_zones_are_aggregated(hass: HomeAssistant) -> None:
+    """Counts, extremes and the mean follow the receivers."""
+    house = HiveHouseCoordinator(hass, "house")
+    receivers = [receiver(hass, number, t) for number, t in enumerate((18, 19, 21))]
+    for coordinator in receivers:
+        house.async_add_zone(coordinator)
+
+    assert house.data["zones"] == 3
+    assert house.data["zones_below_target"] == 2
+    assert house.data["min_temperature"] == 18
+    assert house.data["max_temperature"] == 21
+    assert house.data["mean_temperature"] == 19.3
+    assert not house.data["heating"]
+
+    receive(receivers[0], {"running_state_heat": "heat"})
+
+    assert house.data["zones_heating"] == 1
+    assert house.data["heating"]
+
+
+async def test_unknown_running_state_is_not_heating(hass: HomeAssistant) -> None:
+    """A running state that is not reported does not count as heating."""
+    house = HiveHouseCoordinator(hass, "house")
+    coordinator = receiver(hass, 0, 19)
+    house.async_add_zone(coordinator)
+
+    receive(coordinator, {"running_state_heat": None})
+
+    assert coordinator.running_state_heat == "preheating"
+    assert house.data["zones_heating"] == 0
+    assert not house.data["heating"]
+
+
+async def test_unchanged_zone_is_ignored(hass: HomeAssistant) -> None:
+    """An update not changing anything the house uses is ignored."""
+    house = HiveHouseCoordinator(hass, "house")
+    coordinator = receiver(hass, 0, 19)
+    house.async_add_zone(coordinator)
+
+    receive(coordinator, {"running_state_water": "heat"})
+
+    assert house.updates_ignored == 1
+
+
+async def test_entities_are_notified_of_changed_aggregates(
+    hass: HomeAssistant,
+) -> None:
+    """Listeners are only called when an aggregate changes."""
+    house = HiveHouseCoordinator(hass, "house")
+    coordinator = receiver(hass, 0, 19)
+    house.async_add_zone(coordinator)
+    updates = Mock()
+    house.async_add_listener(updates)
+
+    receive(coordinator, {"running_state_water": "heat"})
+    receive(coordinator, {"local_temperature_heat": 18})
+
+    updates.assert_called_once_with()
+    assert house.data["mean_temperature"] == 18
+
+
+async def test_extreme_moving_away_is_recomputed(hass: HomeAssistant) -> None:
+    """The minimum and maximum are found again when their zone changes."""
+    house = HiveHouseCoordinator(hass, "house")
+    receivers = [receiver(hass, number, t) for number, t in enumerate((18, 20))]
+    for coordinator in receivers:
+        house.async_add_zone(coordinator)
+
+    receive(receivers[0], {"local_temperature_heat": 22})
+
+    assert house.data["min_temperature"] == 20
+    assert house.data["max_temperature"] == 22
+
+    house.async_remove_zone(receivers[0])
+
+    assert house.data["zones"] == 1
+    assert house.data["min_temperature"] == 20
+    assert house.data["max_temperature"] == 20
+    assert house.data["mean_temperature"] == 20
+
+
+async def test_offline_zone_is_dropped(hass: HomeAssistant) -> None:
+    """A receiver that is not available stops contributing."""
+    house = HiveHouseCoordinator(hass, "house")
+    receivers = [receiver(hass, number, t) for number, t in enumerate((18, 20))]
+    for coordinator in receivers:
+        house.async_add_zone(coordinator)
+
+    receivers[0].online = False
+    receivers[0].async_availability_changed()
+
+    assert house.data["zones"] == 1
+    assert house.data["mean_temperature"] == 20
+    assert house.data["min_temperature"] == 20
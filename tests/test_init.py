@@ -0,0 +1,101 @@
+"""Tests for setting up a Hive Local Thermostat receiver."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from custom_components.hive_local_thermostat.const import (
+    ATTR_CACHED,
+    CONF_ATTRIBUTE_OUTPUT,
+    CONF_MODEL,
+    DOMAIN,
+    MODEL_SLR1,
+    MODEL_SLR2,
+    STORAGE_VERSION,
+)
+from pytest_homeassistant_custom_component.common import async_fire_mqtt_message
+from pytest_homeassistant_custom_component.typing import MqttMockHAClient
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util.dt import utcnow
+
+from .common import SLR2_IDLE, TOPIC, async_setup_receiver, receiver_entry
+
+
+async def test_cached_state_is_refreshed(
+    hass: HomeAssistant,
+    mqtt_mock: MqttMockHAClient,
+    hass_storage: dict,
+    entity_registry: er.EntityRegistry,
+    enable_custom_integrations: None,
+) -> None:
+    """State is requested after seeding from a fresh cache, which is flagged."""
+    entry = receiver_entry(hass)
+    hass_storage[f"{DOMAIN}.{entry.entry_id}"] = {
+        "version": STORAGE_VERSION,
+        "minor_version": 1,
+        "key": f"{DOMAIN}.{entry.entry_id}",
+        "data": {"saved": utcnow().isoformat(), "reported_state": SLR2_IDLE},
+    }
+
+    await async_setup_receiver(hass, entry)
+
+    assert any(
+        call.args[0] == f"{TOPIC}/get"
+        for call in mqtt_mock.async_publish.call_args_list
+    )
+
+    climate = next(
+        registered.entity_id
+        for registered in er.async_entries_for_config_entry(
+            entity_registry, entry.entry_id
+        )
+        if registered.domain == "climate"
+    )
+    assert hass.states.get(climate).attributes.get(ATTR_CACHED) is True
+
+    async_fire_mqtt_message(hass, TOPIC, json.dumps(SLR2_IDLE))
+    await hass.async_block_till_done()
+
+    assert ATTR_CACHED not in hass.states.get(climate).attributes
+
+
+@pytest.mark.parametrize(
+    ("attribute_output", "topic", "payload"),
+    [
+        (False, TOPIC, json.dumps(SLR2_IDLE)),
+        (True, f"{TOPIC}/system_mode_water", "heat"),
+    ],
+    ids=["json", "attribute"],
+)
+async def test_model_detected_during_setup(
+    hass: HomeAssistant,
+    mqtt_mock: MqttMockHAClient,
+    enable_custom_integrations: None,
+    attribute_output: bool,  # noqa: FBT001
+    topic: str,
+    payload: str,
+) -> None:
+    """A payload from another model arriving during setup reloads the entry."""
+    entry = receiver_entry(
+        hass, **{CONF_MODEL: MODEL_SLR1, CONF_ATTRIBUTE_OUTPUT: attribute_output}
+    )
+
+    async def _retained_payload(_delay: float) -> None:
+        async_fire_mqtt_message(hass, topic, payload)
+
+    with patch(
+        "custom_components.hive_local_thermostat.sleep",
+        AsyncMock(side_effect=_retained_payload),
+    ):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert entry.options[CONF_MODEL] == MODEL_SLR2
+    assert entry.runtime_data.coordinator.model == MODEL_SLR2
+    assert not entry.runtime_data.coordinator.model_switching
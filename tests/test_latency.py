@@ -0,0 +1,148 @@
+"""Tests for command round trip latency tracking."""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+from unittest.mock import patch
+
+import pytest
+from custom_components.hive_local_thermostat.latency import (
+    COMMAND_MODE,
+    COMMAND_SETPOINT,
+    COMMAND_TIMEOUT,
+    CommandLatencyTracker,
+    LatencyStats,
+    normalize_value,
+    reflects,
+)
+
+HOLD = "temperature_setpoint_hold_heat"
+MODE = "system_mode_heat"
+SETPOINT = "occupied_heating_setpoint_heat"
+
+
+class Clock:
+    """Monotonic time controlled by a test."""
+
+    def __init__(self) -> None:
+        """Start the clock."""
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+@pytest.fixture
+def clock() -> Generator[Clock]:
+    """Return the clock used by the tracker."""
+    clock = Clock()
+    with patch("custom_components.hive_local_thermostat.latency.monotonic", clock):
+        yield clock
+
+
+@pytest.mark.parametrize(
+    ("command", "reported"),
+    [
+        ("1", True),
+        (1, True),
+        ("0", False),
+        ("21.5", 21.5),
+        ("20", 20),
+        ("heat", "heat"),
+    ],
+)
+def test_normalize_value(command: object, reported: object) -> None:
+    """Command and report encodings of the same value compare equal."""
+    assert normalize_value(command) == normalize_value(reported)
+
+
+def test_reflects() -> None:
+    """A state reflects a command when every key is present and equal."""
+    state = {MODE: "heat", HOLD: True, SETPOINT: 20}
+
+    assert reflects(state, {MODE: "heat", HOLD: "1"})
+    assert not reflects(state, {MODE: "heat", HOLD: "0"})
+    assert not reflects(state, {"system_mode_water": "heat"})
+
+
+def test_confirmed_by_normalized_report(clock: Clock) -> None:
+    """A command is confirmed by the first report with its values."""
+    tracker = CommandLatencyTracker()
+    tracker.command_sent(
+        COMMAND_MODE, {MODE: "heat", HOLD: "0"}, {MODE: "heat", HOLD: True}
+    )
+
+    clock.now += 1.5
+    tracker.report_received({MODE: "heat", HOLD: True, SETPOINT: 21})
+    assert tracker.pending
+
+    clock.now += 1.0
+    tracker.report_received({MODE: "heat", HOLD: False, SETPOINT: 21})
+
+    assert not tracker.pending
+    assert tracker.last == 2.5
+    assert tracker.stats[COMMAND_MODE].confirmed == 1
+
+
+def test_command_already_reflected_is_not_tracked(clock: Clock) -> None:
+    """A command matching the reported state cannot be timed by a report."""
+    tracker = CommandLatencyTracker()
+    tracker.command_sent(COMMAND_SETPOINT, {SETPOINT: "20"}, {SETPOINT: 20})
+
+    clock.now += 5
+    tracker.report_received({SETPOINT: 20})
+
+    assert not tracker.pending
+    assert tracker.last is None
+    assert tracker.stats[COMMAND_SETPOINT].confirmed == 0
+
+
+def test_superseded_command(clock: Clock) -> None:
+    """A pending command overridden by a different value is superseded."""
+    tracker = CommandLatencyTracker()
+    tracker.command_sent(COMMAND_SETPOINT, {SETPOINT: "21"}, {SETPOINT: 20})
+    tracker.command_sent(COMMAND_SETPOINT, {SETPOINT: "22"}, {SETPOINT: 20})
+
+    assert tracker.stats[COMMAND_SETPOINT].superseded == 1
+    assert [pending.expected for pending in tracker.pending] == [{SETPOINT: "22"}]
+
+
+def test_repeated_command_keeps_send_time(clock: Clock) -> None:
+    """Repeating a pending command times the round trip from the first send."""
+    tracker = CommandLatencyTracker()
+    tracker.command_sent(COMMAND_SETPOINT, {SETPOINT: "21"}, {SETPOINT: 20})
+    clock.now += 2
+    tracker.command_sent(COMMAND_SETPOINT, {SETPOINT: 21}, {SETPOINT: 20})
+    clock.now += 1
+    tracker.report_received({SETPOINT: 21})
+
+    assert tracker.last == 3
+    assert tracker.stats[COMMAND_SETPOINT].confirmed == 1
+
+
+def test_lost_command(clock: Clock) -> None:
+    """A command never confirmed within the timeout is counted as lost."""
+    tracker = CommandLatencyTracker()
+    tracker.command_sent(COMMAND_SETPOINT, {SETPOINT: "21"}, {SETPOINT: 20})
+
+    clock.now += COMMAND_TIMEOUT + 1
+    tracker.expire()
+
+    assert not tracker.pending
+    assert tracker.lost == 1
+
+
+def test_histogram_buckets() -> None:
+    """Latencies are counted in the first bucket that holds them."""
+    stats = LatencyStats()
+    for latency in (0.2, 0.5, 3.0, 120.0):
+        stats.record(latency)
+
+    histogram = stats.as_dict()["histogram"]
+    assert histogram["<=0.5s"] == 2
+    assert histogram["<=5.0s"] == 1
+    assert histogram[">60.0s"] == 1
+    assert stats.minimum == 0.2
+    assert stats.maximum == 120.0
+    assert stats.mean == pytest.approx(30.925)
@@ -0,0 +1,59 @@
+"""Tests for the in-memory message trace."""
+
+from __future__ import annotations
+
+import pytest
+from custom_components.hive_local_thermostat.message_trace import (
+    TRACE_RECEIVED,
+    TRACE_SENT,
+    TraceBuffer,
+)
+
+
+def kinds(trace: TraceBuffer) -> list[str]:
+    """Return the kind of each record, oldest first."""
+    return [kind for _time, kind, _data in trace.records]
+
+
+def test_oldest_records_are_dropped() -> None:
+    """The buffer keeps only the newest records."""
+    trace = TraceBuffer("receiver", sample_rate=1, maxlen=3)
+
+    for number in range(5):
+        trace.record(TRACE_SENT, number)
+
+    assert [data for _time, _kind, data in trace.records] == [2, 3, 4]
+
+
+def test_received_messages_are_sampled() -> None:
+    """One in sample_rate received messages is kept, sent ones always are."""
+    trace = TraceBuffer("receiver", sample_rate=3)
+
+    for number in range(7):
+        trace.received(number)
+    trace.record(TRACE_SENT, "command")
+
+    assert kinds(trace) == [TRACE_RECEIVED, TRACE_RECEIVED, TRACE_SENT]
+    assert [data for _time, _kind, data in trace.records][:2] == [2, 5]
+
+
+def test_sample_rate_zero_keeps_no_received() -> None:
+    """A sample rate of 0 turns off tracing of received messages."""
+    trace = TraceBuffer("receiver", sample_rate=0)
+
+    trace.received("payload")
+
+    assert not trace.records
+
+
+def test_dump_logs_and_clears(caplog: pytest.LogCaptureFixture) -> None:
+    """A dump writes the records to the log once."""
+    trace = TraceBuffer("receiver", sample_rate=1)
+    trace.received({"local_temperature_heat": 20})
+
+    records = trace.dump("request")
+
+    assert records[0]["kind"] == TRACE_RECEIVED
+    assert "Trace for receiver (request)" in caplog.text
+    assert not trace.records
+    assert trace.dump("request") == []
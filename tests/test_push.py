@@ -0,0 +1,23 @@
+"""Tests for the push coordinator base."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+from custom_components.hive_local_thermostat.push import HivePushCoordinator
+
+from homeassistant.core import HomeAssistant
+
+
+async def test_listeners_are_added_and_removed(hass: HomeAssistant) -> None:
+    """Each update calls the current listeners, in the order added."""
+    coordinator = HivePushCoordinator(hass)
+    calls = Mock()
+    remove_first = coordinator.async_add_listener(calls.first)
+    coordinator.async_add_listener(calls.second)
+
+    coordinator.async_update_listeners()
+    remove_first()
+    coordinator.async_update_listeners()
+
+    assert [call[0] for call in calls.mock_calls] == ["first", "second", "second"]
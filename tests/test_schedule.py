@@ -0,0 +1,147 @@
+"""Tests for weekly schedule diffing."""
+
+from __future__ import annotations
+
+from datetime import time
+from unittest.mock import patch
+
+from custom_components.hive_local_thermostat.coordinator import HiveCoordinator
+from custom_components.hive_local_thermostat.schedule import (
+    DAYS,
+    SCHEDULE_HEAT,
+    WeeklySchedule,
+    day_schedule,
+    format_time,
+)
+
+from homeassistant.exceptions import HomeAssistantError
+
+KEY = "weekly_schedule_heat"
+WORKDAY = ((390, 20.0), (510, 16.0), (1020, 20.0), (1320, 16.0))
+WEEKEND = ((480, 20.0), (1320, 16.0))
+
+
+def report(days: list[str], schedule: tuple) -> dict:
+    """Return a schedule report as Zigbee2MQTT publishes it."""
+    return {
+        "days": days,
+        "transitions": [
+            {"time": minutes, "heating_setpoint": setpoint}
+            for minutes, setpoint in schedule
+        ],
+    }
+
+
+def known_week() -> WeeklySchedule:
+    """Return a schedule with every day reported."""
+    schedule = WeeklySchedule(KEY)
+    schedule.update_from_report(report(list(DAYS[:5]), WORKDAY))
+    schedule.update_from_report(report(list(DAYS[5:]), WEEKEND))
+    return schedule
+
+
+def test_day_schedule_is_sorted() -> None:
+    """Transitions from a service call are sorted by time."""
+    assert day_schedule(
+        [
+            {"time": time(22, 0), "temperature": 16.0},
+            {"time": time(6, 30), "temperature": 20.0},
+        ]
+    ) == ((390, 20.0), (1320, 16.0))
+    assert format_time(390) == "06:30"
+
+
+def test_reports_are_merged_by_day() -> None:
+    """Each report replaces only the days it carries."""
+    schedule = known_week()
+
+    assert schedule.complete
+    assert schedule.reported_all
+    assert schedule.days["monday"] == WORKDAY
+    assert schedule.days["sunday"] == WEEKEND
+
+    changed = schedule.update_from_report(report(["friday", "saturday"], WEEKEND))
+
+    assert changed == {"friday"}
+    assert schedule.days["friday"] == WEEKEND
+
+
+def test_malformed_report_is_ignored() -> None:
+    """Reports that cannot be read change nothing."""
+    schedule = WeeklySchedule(KEY)
+
+    assert schedule.update_from_report("monday") == set()
+    assert schedule.update_from_report({"days": ["monday"], "transitions": [{}]}) == (
+        set()
+    )
+    assert schedule.update_from_report(report(["someday"], WORKDAY)) == set()
+    assert not schedule.days
+
+
+def test_only_changed_days_are_written() -> None:
+    """Requested days matching the known schedule are not sent."""
+    schedule = known_week()
+    requested = dict.fromkeys(DAYS, WORKDAY)
+
+    changed = schedule.changed_days(requested)
+
+    assert changed == {"saturday": WORKDAY, "sunday": WORKDAY}
+    assert schedule.changed_days(requested, force=True) == requested
+
+
+def test_days_sharing_transitions_are_one_command() -> None:
+    """One command is sent per group of days with the same transitions."""
+    schedule = WeeklySchedule(KEY)
+
+    commands = schedule.commands(
+        {"sunday": WEEKEND, "monday": WORKDAY, "saturday": WEEKEND}
+    )
+
+    assert commands == [
+        {
+            KEY: {
+                "dayofweek": ["monday"],
+                "transitions": [
+                    {"transitionTime": minutes, "heatSetpoint": setpoint}
+                    for minutes, setpoint in WORKDAY
+                ],
+            }
+        },
+        {
+            KEY: {
+                "dayofweek": ["saturday", "sunday"],
+                "transitions": [
+                    {"transitionTime": 480, "heatSetpoint": 20.0},
+                    {"transitionTime": 1320, "heatSetpoint": 16.0},
+                ],
+            }
+        },
+    ]
+
+
+def test_storage_round_trip() -> None:
+    """Known days survive the state cache."""
+    schedule = known_week()
+    loaded = WeeklySchedule(KEY)
+
+    loaded.load(schedule.to_storage())
+
+    assert loaded.days == schedule.days
+    assert loaded.as_dict()["monday"][0] == {"time": "06:30", "temperature": 20.0}
+
+
+async def test_failed_write_is_not_queued(coordinator: HiveCoordinator) -> None:
+    """Days whose publish fails are reported as failed, not queued."""
+    with patch(
+        "homeassistant.components.mqtt.client.async_publish",
+        side_effect=[None, HomeAssistantError("offline")],
+    ):
+        sent, failed = await coordinator.async_set_schedule(
+            SCHEDULE_HEAT,
+            {"monday": WORKDAY, "saturday": WEEKEND, "sunday": WEEKEND},
+        )
+
+    assert sent == ["monday"]
+    assert failed == ["saturday", "sunday"]
+    assert set(coordinator.schedules[SCHEDULE_HEAT].days) == {"monday"}
+    assert not len(coordinator.command_queue)
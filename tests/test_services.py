@@ -0,0 +1,140 @@
+"""Tests for the Hive Local Thermostat services."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from custom_components.hive_local_thermostat.const import (
+    CONF_MODEL,
+    CONF_MQTT_TOPIC,
+    DOMAIN,
+    MODEL_SLR1,
+)
+from custom_components.hive_local_thermostat.services import (
+    ATTR_CONFIG_ENTRY_ID,
+    SERVICE_GET_STATES,
+    SERVICE_HEATING_BOOST,
+)
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_mqtt_message,
+)
+from pytest_homeassistant_custom_component.typing import MqttMockHAClient
+
+from homeassistant.const import ATTR_AREA_ID, ATTR_DEVICE_ID, ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import (
+    area_registry as ar,
+    device_registry as dr,
+    entity_registry as er,
+)
+
+from .common import SLR2_IDLE, TOPIC, async_setup_receiver, receiver_entry
+
+
+@pytest.fixture
+async def receiver(
+    hass: HomeAssistant,
+    mqtt_mock: MqttMockHAClient,
+    enable_custom_integrations: None,
+) -> MockConfigEntry:
+    """Return a receiver entry that is set up."""
+    entry = receiver_entry(hass)
+    await async_setup_receiver(hass, entry)
+    mqtt_mock.async_publish.reset_mock()
+    return entry
+
+
+def boosted_topics(mqtt_mock: MqttMockHAClient) -> list[str]:
+    """Return the topics a heating boost was published to."""
+    return [
+        call.args[0]
+        for call in mqtt_mock.async_publish.call_args_list
+        if "emergency_heating" in call.args[1]
+    ]
+
+
+@pytest.mark.parametrize("target", [ATTR_ENTITY_ID, ATTR_DEVICE_ID, ATTR_AREA_ID])
+async def test_boost_resolves_targets(
+    hass: HomeAssistant,
+    receiver: MockConfigEntry,
+    mqtt_mock: MqttMockHAClient,
+    entity_registry: er.EntityRegistry,
+    device_registry: dr.DeviceRegistry,
+    area_registry: ar.AreaRegistry,
+    target: str,
+) -> None:
+    """A receiver is found from any of its entities, its device or its area."""
+    device = device_registry.async_get_device(identifiers={(DOMAIN, receiver.entry_id)})
+    area = area_registry.async_create("Hallway")
+    device_registry.async_update_device(device.id, area_id=area.id)
+    climate = next(
+        entity.entity_id
+        for entity in er.async_entries_for_config_entry(
+            entity_registry, receiver.entry_id
+        )
+        if entity.domain == "climate"
+    )
+
+    targets = {
+        ATTR_ENTITY_ID: climate,
+        ATTR_DEVICE_ID: device.id,
+        ATTR_AREA_ID: area.id,
+    }
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_HEATING_BOOST, {target: targets[target]}, blocking=True
+    )
+
+    assert boosted_topics(mqtt_mock) == [f"{TOPIC}/set"]
+
+
+async def test_other_targets_are_rejected(
+    hass: HomeAssistant, receiver: MockConfigEntry, mqtt_mock: MqttMockHAClient
+) -> None:
+    """A target with no receivers is an error, nothing is sent."""
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_HEATING_BOOST,
+            {ATTR_ENTITY_ID: "light.kitchen"},
+            blocking=True,
+        )
+
+    assert not boosted_topics(mqtt_mock)
+
+
+async def test_get_states_returns_receivers(
+    hass: HomeAssistant, receiver: MockConfigEntry
+) -> None:
+    """Every loaded receiver is returned, or only those targeted."""
+    landing = receiver_entry(
+        hass, **{CONF_MODEL: MODEL_SLR1, CONF_MQTT_TOPIC: "zigbee2mqtt/landing"}
+    )
+    await async_setup_receiver(hass, landing)
+    async_fire_mqtt_message(hass, TOPIC, json.dumps(SLR2_IDLE))
+    await hass.async_block_till_done()
+
+    response = await hass.services.async_call(
+        DOMAIN, SERVICE_GET_STATES, {}, blocking=True, return_response=True
+    )
+
+    assert set(response["receivers"]) == {receiver.entry_id, landing.entry_id}
+    hallway = response["receivers"][receiver.entry_id]
+    assert hallway["target_temperature"] == 20
+    assert hallway["water_mode"] == "heat"
+    assert hallway["last_report_age"] == 0
+    assert response["receivers"][landing.entry_id]["last_report_age"] is None
+    assert "water_mode" not in response["receivers"][landing.entry_id]
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_GET_STATES,
+        {ATTR_CONFIG_ENTRY_ID: landing.entry_id},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert list(response["receivers"]) == [landing.entry_id]
@@ -0,0 +1,72 @@
+"""Tests for snapshots of receiver modes and setpoints."""
+
+from __future__ import annotations
+
+from custom_components.hive_local_thermostat.coordinator import HiveCoordinator
+from custom_components.hive_local_thermostat.snapshot import (
+    SNAPSHOT_HVAC_MODE,
+    SNAPSHOT_TEMPERATURE,
+    SNAPSHOT_WATER_MODE,
+    restore_commands,
+    snapshot_receiver,
+)
+from pytest_homeassistant_custom_component.typing import MqttMockHAClient
+
+from homeassistant.components.climate import HVACMode
+
+from .common import SLR2_IDLE, receive
+
+IDLE_SNAPSHOT = {
+    SNAPSHOT_HVAC_MODE: HVACMode.HEAT,
+    SNAPSHOT_TEMPERATURE: 20,
+    SNAPSHOT_WATER_MODE: "heat",
+}
+
+
+def test_snapshot_captures_modes_and_setpoint(coordinator: HiveCoordinator) -> None:
+    """The HVAC mode, setpoint and water mode are captured."""
+    receive(coordinator, SLR2_IDLE)
+
+    assert snapshot_receiver(coordinator) == IDLE_SNAPSHOT
+
+
+async def test_snapshot_during_boost_keeps_pre_boost_values(
+    coordinator: HiveCoordinator, mqtt_mock: MqttMockHAClient
+) -> None:
+    """A running boost is not captured, the values it replaced are."""
+    receive(coordinator, SLR2_IDLE)
+    await coordinator.async_heating_boost(30, 25)
+    receive(
+        coordinator,
+        {
+            "system_mode_heat": "emergency_heating",
+            "temperature_setpoint_hold_duration_heat": 30,
+            "occupied_heating_setpoint_heat": 25,
+        },
+    )
+
+    assert snapshot_receiver(coordinator) == IDLE_SNAPSHOT
+
+
+def test_restore_sends_only_what_changed(coordinator: HiveCoordinator) -> None:
+    """Values matching the snapshot are left alone."""
+    receive(coordinator, SLR2_IDLE)
+
+    assert restore_commands(coordinator, IDLE_SNAPSHOT) == []
+
+    receive(coordinator, {"occupied_heating_setpoint_heat": 21})
+
+    assert restore_commands(coordinator, IDLE_SNAPSHOT) == [("set_temperature", (20,))]
+
+    receive(
+        coordinator,
+        {
+            "temperature_setpoint_hold_heat": False,
+            "temperature_setpoint_hold_water": False,
+        },
+    )
+
+    assert restore_commands(coordinator, IDLE_SNAPSHOT) == [
+        ("set_hvac_mode_heat", (20, True)),
+        ("water_always_on", ()),
+    ]
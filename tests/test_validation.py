@@ -0,0 +1,85 @@
+"""Tests for per-model payload validation."""
+
+from __future__ import annotations
+
+from custom_components.hive_local_thermostat.const import MODEL_SLR1, MODEL_SLR2
+from custom_components.hive_local_thermostat.coordinator import payload_validator
+from custom_components.hive_local_thermostat.validation import (
+    BOOLEAN,
+    NUMBER,
+    PAYLOAD_FIELD,
+    REASON_MISSING,
+    REASON_NOT_OBJECT,
+    REASON_UNEXPECTED,
+    PayloadValidator,
+)
+
+from .common import SLR2_IDLE
+
+
+def test_valid_payload_is_applied_whole() -> None:
+    """A payload with the expected types passes unchanged."""
+    validator = payload_validator(MODEL_SLR2)
+
+    result = validator.validate(SLR2_IDLE)
+
+    assert result.valid is SLR2_IDLE
+    assert not result.errors
+    assert validator.rejected_payloads == 0
+
+
+def test_bad_field_is_dropped() -> None:
+    """A field of the wrong type is dropped and the rest applied."""
+    validator = PayloadValidator({"hold": BOOLEAN, "setpoint": NUMBER})
+
+    result = validator.validate({"hold": 1, "setpoint": True, "linkquality": "x"})
+
+    assert result.valid == {"linkquality": "x"}
+    assert result.errors == {
+        "hold": "unexpected type int",
+        "setpoint": "unexpected type bool",
+    }
+    assert not result.model_mismatch
+    assert validator.rejections == {"hold": 1, "setpoint": 1}
+    assert validator.rejected_payloads == 0
+
+
+def test_null_is_accepted() -> None:
+    """Values not reported yet are null and are accepted."""
+    validator = PayloadValidator({"setpoint": NUMBER})
+
+    assert validator.validate({"setpoint": None}).valid == {"setpoint": None}
+
+
+def test_non_object_is_rejected() -> None:
+    """A payload that is not a JSON object is rejected whole."""
+    validator = PayloadValidator({})
+
+    result = validator.validate([1, 2])
+
+    assert result.valid is None
+    assert result.errors == {PAYLOAD_FIELD: REASON_NOT_OBJECT}
+    assert validator.rejected_payloads == 1
+
+
+def test_slr2_payload_for_slr1_is_mismatch() -> None:
+    """A payload with the water mode is from another model than an SLR1."""
+    validator = payload_validator(MODEL_SLR1)
+
+    result = validator.validate({"system_mode_water": "heat"})
+
+    assert result.valid is None
+    assert result.model_mismatch
+    assert result.errors == {"system_mode_water": REASON_UNEXPECTED}
+
+
+def test_slr1_payload_for_slr2_is_mismatch() -> None:
+    """An SLR1 payload lacks the water mode an SLR2 always reports."""
+    validator = payload_validator(MODEL_SLR2)
+
+    result = validator.validate({"system_mode": "heat", "local_temperature": 19})
+
+    assert result.valid is None
+    assert result.model_mismatch
+    assert result.errors == {"system_mode_water": REASON_MISSING}
+    assert validator.as_dict()["rejected_payloads"] == 1
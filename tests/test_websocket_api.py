@@ -0,0 +1,70 @@
+"""Tests for the receiver state websocket stream."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import MagicMock
+
+from custom_components.hive_local_thermostat.coordinator import HiveCoordinator
+from custom_components.hive_local_thermostat.websocket_api import (
+    ATTR_RECEIVERS,
+    HiveStateStream,
+    state_delta,
+)
+
+from homeassistant.core import HomeAssistant
+
+from .common import SLR2_IDLE, receive
+
+
+def test_state_delta() -> None:
+    """Only new and changed fields are in the delta."""
+    old = {"hvac_mode": "heat", "target_temperature": 20, "water_mode": None}
+    new = {"hvac_mode": "heat", "target_temperature": 21, "water_mode": None, "x": 0}
+
+    assert state_delta(old, new) == {"target_temperature": 21, "x": 0}
+    assert state_delta(new, new) == {}
+    assert state_delta({}, new) == new
+
+
+def events(connection: MagicMock) -> list[dict[str, Any]]:
+    """Return the receivers sent in each event."""
+    return [
+        call.args[0]["event"][ATTR_RECEIVERS]
+        for call in connection.send_message.call_args_list
+    ]
+
+
+async def test_stream_sends_full_state_then_deltas(
+    hass: HomeAssistant, coordinator: HiveCoordinator
+) -> None:
+    """A followed receiver is sent in full once, then only what changed."""
+    connection = MagicMock()
+    stream = HiveStateStream(hass, connection, 1, None)
+    receive(coordinator, SLR2_IDLE)
+
+    stream.async_add_receiver(coordinator)
+    receive(coordinator, {"local_temperature_heat": 20.5})
+    receive(coordinator, {"temperature_setpoint_hold_duration_water": 0})
+    stream.async_remove_receiver(coordinator)
+
+    full, delta, removed = events(connection)
+    assert full["entry"]["target_temperature"] == 20
+    assert full["entry"]["water_mode"] == "heat"
+    assert delta == {"entry": {"current_temperature": 20.5}}
+    assert removed == {"entry": None}
+
+    stream.async_stop()
+
+
+async def test_stream_follows_selected_receivers(
+    hass: HomeAssistant, coordinator: HiveCoordinator
+) -> None:
+    """Receivers not selected by the subscription are not sent."""
+    connection = MagicMock()
+    stream = HiveStateStream(hass, connection, 1, {"other"})
+
+    stream.async_add_receiver(coordinator)
+    receive(coordinator, SLR2_IDLE)
+
+    assert not connection.send_message.called